@@ -1,13 +1,19 @@
 """DeepLabCut Live GUI package."""
 
-from .config import (
-    ApplicationSettings,
-    CameraSettings,
-    DLCProcessorSettings,
-    MultiCameraSettings,
-    RecordingSettings,
-)
-from .main import main
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import (
+        ApplicationSettings,
+        CameraSettings,
+        DLCProcessorSettings,
+        MultiCameraSettings,
+        RecordingSettings,
+    )
+    from .main import main
 
 __all__ = [
     "ApplicationSettings",
@@ -17,3 +23,27 @@ __all__ = [
     "RecordingSettings",
     "main",
 ]
+
+# Public names are imported on first use, so that lightweight modules such as
+# dlclivegui.processors.pose_protocol can be imported without pydantic, Qt, OpenCV or DLCLive
+_LAZY_ATTRS = {
+    "ApplicationSettings": ".config",
+    "CameraSettings": ".config",
+    "DLCProcessorSettings": ".config",
+    "MultiCameraSettings": ".config",
+    "RecordingSettings": ".config",
+    "main": ".main",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,9 @@ Rotation = Literal[0, 90, 180, 270]
 TileLayout = Literal["auto", "2x2", "1x4", "4x1"]
 Precision = Literal["FP32", "FP16"]
 ModelType = Literal["pytorch", "tensorflow"]
+ProcessorMode = Literal["inline", "process"]
+InferenceMode = Literal["thread", "process"]
+MotionModel = Literal["off", "constant_velocity", "kalman"]
 
 
 class CameraSettings(BaseModel):
@@ -234,6 +237,7 @@ class DynamicCropModel(BaseModel):
 
 
 class DLCProcessorSettings(BaseModel):
+    model_id: str = "main"  # names the pose stream (PoseSource.model_id) when several models run
     model_path: str = ""
     model_directory: str = "."
     device: str | None = "auto"  # "cuda:0", "cpu", or None
@@ -243,6 +247,39 @@ class DLCProcessorSettings(BaseModel):
     additional_options: dict[str, Any] = Field(default_factory=dict)
     model_type: ModelType = "pytorch"
     single_animal: bool = True
+    # "inline": the processor runs in DLCLive.get_pose on the inference thread.
+    # "process": it runs in a separate process fed through shared memory (see services/processor_host.py).
+    processor_mode: ProcessorMode = "inline"
+    processor_queue_size: int = Field(default=8, ge=1)
+    processor_blocking: bool = False  # "process" mode: wait for the processor instead of dropping poses
+    # Resize frames on a separate thread while the previous frame is in inference (only when
+    # resize != 1 and dynamic cropping is off); DLCLive then receives resize=1.
+    pipeline_preprocess: bool = True
+    # "thread": DLCLive runs on a worker thread of the GUI process.
+    # "process": it runs in a child process fed through shared memory (see services/inference_process.py).
+    inference_mode: InferenceMode = "thread"
+    # Initialized models kept between inference sessions (see services/model_cache.py); 0 disables.
+    model_cache_size: int = Field(default=1, ge=0)
+    # Load the model in the background as soon as it is selected (needs model_cache_size >= 1).
+    preload_model: bool = True
+    # Inference ROI (x0, y0, x1, y1) in frame pixels: only this region plus roi_margin is sent to the
+    # model and keypoints are mapped back to full-frame coordinates. None = full frame.
+    roi: tuple[int, int, int, int] | None = None
+    roi_margin: int = Field(default=0, ge=0)
+    # Rate control (see services/rate_control.py): submit at most target_fps frames per second;
+    # with target_latency_ms always infer the freshest frame and, with adaptive_resize, lower
+    # resize (down to min_resize) while the end-to-end latency is over budget.
+    target_fps: float | None = Field(default=None, gt=0)
+    target_latency_ms: float | None = Field(default=None, gt=0)
+    adaptive_resize: bool = False
+    min_resize: float = Field(default=0.25, gt=0, le=1.0)
+    # Motion model (see services/pose_tracking.py): predict a pose for every camera frame between
+    # inferences, emitted with PosePacket.predicted=True; optionally also passed to the processor
+    # (process(pose, frame_time=..., predicted=True)).
+    motion_model: MotionModel = "off"
+    motion_max_horizon_ms: float = Field(default=100.0, gt=0)
+    motion_min_confidence: float = Field(default=0.0, ge=0.0, le=1.0)
+    predictions_to_processor: bool = False
 
     @field_validator("dynamic", mode="before")
     @classmethod
@@ -281,6 +318,15 @@ class DLCProcessorSettings(BaseModel):
 
         return v
 
+    @field_validator("roi")
+    @classmethod
+    def _check_roi(cls, v):
+        if v is not None:
+            x0, y0, x1, y1 = v
+            if not (x1 > x0 and y1 > y0) or min(x0, y0) < 0:
+                raise ValueError(f"Invalid inference ROI {v!r}: need 0 <= x0 < x1 and 0 <= y0 < y1.")
+        return v
+
 
 class BoundingBoxSettings(BaseModel):
     enabled: bool = False
@@ -288,10 +334,12 @@ class BoundingBoxSettings(BaseModel):
     y0: int = 0
     x1: int = 200
     y1: int = 100
+    inference_roi: bool = False  # only run pose inference inside the box (see DLCProcessorSettings.roi)
+    roi_margin: int = Field(default=32, ge=0)
 
     @model_validator(mode="after")
     def _bbox_logic(self):
-        if self.enabled and not (self.x1 > self.x0 and self.y1 > self.y0):
+        if (self.enabled or self.inference_roi) and not (self.x1 > self.x0 and self.y1 > self.y0):
             raise ValueError("Bounding box enabled but coordinates are invalid (x1>x0 and y1>y0 required).")
         return self
 
@@ -315,6 +363,16 @@ class RecordingSettings(BaseModel):
     container: Literal["mp4", "avi", "mov"] = "mp4"
     codec: str = "libx264"
     crf: int = Field(default=23, ge=0, le=51)
+    # Pre-trigger ring buffer: keep the last N seconds per camera in RAM so that
+    # a (possibly remote-triggered) recording starts with the frames that preceded it.
+    pretrigger_seconds: float = Field(default=0.0, ge=0.0)  # 0.0 = disabled
+    pretrigger_memory_mb: int = Field(default=512, ge=0)  # shared across all cameras
+    # Backpressure: when the encoder falls behind, spill overflow frames to a raw file
+    # next to the video (encoded later, in order) instead of dropping them.
+    spill_to_disk: bool = True
+    spill_max_mb: int = Field(default=4096, ge=0)  # per camera
+    # RAM budget for encoder queues, shared across all recording cameras
+    buffer_memory_mb: int = Field(default=1024, ge=16)
 
     def output_path(self) -> Path:
         """Return the absolute output path for recordings."""
@@ -350,6 +408,21 @@ class ApplicationSettings(BaseModel):
     recording: RecordingSettings = Field(default_factory=RecordingSettings)
     bbox: BoundingBoxSettings = Field(default_factory=BoundingBoxSettings)
     visualization: VisualizationSettings = Field(default_factory=VisualizationSettings)
+    # Additional models run on the inference camera next to ``dlc`` (see services/multi_model.py)
+    extra_models: list[DLCProcessorSettings] = Field(default_factory=list)
+    max_concurrent_models: int = Field(default=0, ge=0)  # models inferring at the same time, 0 = no limit
+
+    @field_validator("extra_models")
+    @classmethod
+    def _name_extra_models(cls, v: list[DLCProcessorSettings]) -> list[DLCProcessorSettings]:
+        seen = {"main"}
+        for i, model in enumerate(v, start=2):
+            if model.model_id in seen:
+                model.model_id = f"model_{i}"
+            if model.model_id in seen:
+                raise ValueError(f"Duplicate model_id {model.model_id!r} in extra_models")
+            seen.add(model.model_id)
+        return v
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ApplicationSettings:
@@ -366,6 +439,7 @@ class ApplicationSettings(BaseModel):
         recording = RecordingSettings(**recording_data)
         bbox = BoundingBoxSettings(**bbox_data)
         visualization = VisualizationSettings(**visualization_data)
+        extra_models = [DLCProcessorSettings(**m) for m in data.get("extra_models", [])]
 
         return cls(
             camera=camera,
@@ -374,6 +448,8 @@ class ApplicationSettings(BaseModel):
             recording=recording,
             bbox=bbox,
             visualization=visualization,
+            extra_models=extra_models,
+            max_concurrent_models=data.get("max_concurrent_models", 0),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -385,6 +461,8 @@ class ApplicationSettings(BaseModel):
             "recording": self.recording.model_dump(),
             "bbox": self.bbox.model_dump(),
             "visualization": self.visualization.model_dump(),
+            "extra_models": [m.model_dump() for m in self.extra_models],
+            "max_concurrent_models": self.max_concurrent_models,
         }
 
     @classmethod
@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib.metadata
 import json
 import logging
+import math
 import os
 import time
 from pathlib import Path
@@ -64,15 +65,15 @@ from dlclivegui.config import (
 
 from ..processors.processor_utils import (
     default_processors_dir,
-    instantiate_from_scan,
     scan_processor_folder,
     scan_processor_package,
 )
-from ..services.dlc_processor import DLCLiveProcessor, PoseResult
+from ..services.dlc_processor import DLCLiveProcessor, PoseResult, create_processor
 from ..services.multi_camera_controller import MultiCameraController, MultiFrameData, get_camera_id
+from ..services.multi_model import PoseModelGroup
 from ..utils.display import BBoxColors, compute_tile_info, create_tiled_frame, draw_bbox, draw_pose
 from ..utils.settings_store import DLCLiveGUISettingsStore, ModelPathStore
-from ..utils.stats import format_dlc_stats
+from ..utils.stats import format_dlc_stats, format_model_stats
 from ..utils.utils import FPSTracker
 from .camera_config.camera_config_dialog import CameraConfigDialog
 from .misc import color_dropdowns as color_ui
@@ -84,6 +85,9 @@ from .theme import LOGO, LOGO_ALPHA, AppStyle, apply_theme
 
 logger = logging.getLogger("DLCLiveGUI")
 
+# Keypoint colormaps of the extra models, so that their overlays stand out from the main model
+EXTRA_MODEL_COLORMAPS = ("cool", "spring", "winter", "autumn")
+
 
 class DLCLiveMainWindow(QMainWindow):
     """Main application window."""
@@ -132,6 +136,9 @@ class DLCLiveMainWindow(QMainWindow):
         self._fps_tracker = FPSTracker()
         self._rec_manager = RecordingManager()
         self._dlc = DLCLiveProcessor()
+        # Extra models on the inference camera (config.extra_models), overlaid next to the main one
+        self._extra_models = PoseModelGroup(config.max_concurrent_models)
+        self._extra_poses: dict[str, PoseResult] = {}
         self.multi_camera_controller = MultiCameraController()
 
         self._config = config
@@ -140,6 +147,9 @@ class DLCLiveMainWindow(QMainWindow):
         self._current_frame: np.ndarray | None = None
         self._raw_frame: np.ndarray | None = None
         self._last_pose: PoseResult | None = None
+        # Sequence numbers of the pose slots last read by the display timer
+        self._pose_seq = 0
+        self._extra_pose_seqs: dict[str, int] = {}
         self._dlc_active: bool = False
         self._active_camera_settings: CameraSettings | None = None
         self._last_drop_warning = 0.0
@@ -151,6 +161,7 @@ class DLCLiveMainWindow(QMainWindow):
         self._processor_keys: list = []
         self._last_processor_vid_recording = False
         self._auto_record_session_name: str | None = None
+        self._pending_recording_start = False  # start recording on first frame after preview starts
         self._bbox_x0 = 0
         self._bbox_y0 = 0
         self._bbox_x1 = 0
@@ -745,8 +756,37 @@ class DLCLiveMainWindow(QMainWindow):
 
         form.addRow("Coordinates", bbox_layout)
 
+        self.bbox_roi_checkbox = QCheckBox("Run inference inside the box only")
+        self.bbox_roi_checkbox.setChecked(False)
+        self.bbox_roi_checkbox.setToolTip(
+            "Only the bounding box region (plus a margin) of the inference camera is sent to the model.\n"
+            "Keypoints are mapped back to full-frame coordinates. Applied when inference starts."
+        )
+        form.addRow(self.bbox_roi_checkbox)
+
+        # One toggle per extra model (filled by _rebuild_model_overlay_toggles)
+        self.model_overlays_layout = QHBoxLayout()
+        self.model_overlay_checkboxes: dict[str, QCheckBox] = {}
+        self.model_overlays_label = QLabel("Model overlays")
+        form.addRow(self.model_overlays_label, self.model_overlays_layout)
+
         return group
 
+    def _rebuild_model_overlay_toggles(self) -> None:
+        for checkbox in self.model_overlay_checkboxes.values():
+            self.model_overlays_layout.removeWidget(checkbox)
+            checkbox.deleteLater()
+        self.model_overlay_checkboxes = {}
+        for model in self._config.extra_models:
+            checkbox = QCheckBox(model.model_id)
+            checkbox.setChecked(True)
+            checkbox.setToolTip(f"Display the keypoints of {Path(model.model_path).name or model.model_id}")
+            checkbox.stateChanged.connect(self._on_show_predictions_changed)
+            self.model_overlays_layout.addWidget(checkbox)
+            self.model_overlay_checkboxes[model.model_id] = checkbox
+        visible = bool(self._config.extra_models)
+        self.model_overlays_label.setVisible(visible)
+
     # ------------------------------------------------------------------ signals
     def _connect_signals(self) -> None:
         self.preview_button.clicked.connect(self._start_preview)
@@ -778,10 +818,16 @@ class DLCLiveMainWindow(QMainWindow):
         self.multi_camera_controller.camera_error.connect(self._on_multi_camera_error)
         self.multi_camera_controller.initialization_failed.connect(self._on_multi_camera_initialization_failed)
 
-        # DLC processor signals
-        self._dlc.pose_ready.connect(self._on_pose_ready)
+        # DLC processor signals (poses are polled by the display timer, see _poll_poses)
         self._dlc.error.connect(self._on_dlc_error)
         self._dlc.initialized.connect(self._on_dlc_initialised)
+        self._dlc.processor_recording_changed.connect(self._on_processor_recording_changed)
+        self._dlc.preloaded.connect(self._on_model_preloaded)
+        self._extra_models.error.connect(self._on_extra_model_error)
+
+        # Recorder finalization (runs in the background after stop)
+        self._rec_manager.stop_progress.connect(self._on_recording_stop_progress)
+        self._rec_manager.stop_finished.connect(self._on_recording_stop_finished)
         self.dlc_camera_combo.currentIndexChanged.connect(self._on_dlc_camera_changed)
         self.dlc_camera_combo.currentTextChanged.connect(self.dlc_camera_combo.update_shrink_width)
 
@@ -840,6 +886,7 @@ class DLCLiveMainWindow(QMainWindow):
         self.bbox_y0_spin.setValue(bbox.y0)
         self.bbox_x1_spin.setValue(bbox.x1)
         self.bbox_y1_spin.setValue(bbox.y1)
+        self.bbox_roi_checkbox.setChecked(bbox.inference_roi)
 
         # Set visualization settings from config
         viz = config.visualization
@@ -851,6 +898,8 @@ class DLCLiveMainWindow(QMainWindow):
         if hasattr(self, "bbox_color_combo"):
             color_ui.set_bbox_combo_from_bgr(self.bbox_color_combo, self._bbox_color)
 
+        self._rebuild_model_overlay_toggles()
+
         # Update DLC camera list
         self._refresh_dlc_camera_list()
 
@@ -869,6 +918,8 @@ class DLCLiveMainWindow(QMainWindow):
             recording=self._recording_settings_from_ui(),
             bbox=self._bbox_settings_from_ui(),
             visualization=self._visualization_settings_from_ui(),
+            extra_models=self._config.extra_models,
+            max_concurrent_models=self._config.max_concurrent_models,
         )
 
     def _parse_json(self, value: str) -> dict:
@@ -901,9 +952,35 @@ class DLCLiveMainWindow(QMainWindow):
             resize=self._config.dlc.resize,  # Preserve from config
             precision=self._config.dlc.precision,  # Preserve from config
             model_type=model_bknd,
+            processor_mode=self._config.dlc.processor_mode,  # Preserve from config
+            processor_queue_size=self._config.dlc.processor_queue_size,  # Preserve from config
+            processor_blocking=self._config.dlc.processor_blocking,  # Preserve from config
+            pipeline_preprocess=self._config.dlc.pipeline_preprocess,  # Preserve from config
+            inference_mode=self._config.dlc.inference_mode,  # Preserve from config
+            model_cache_size=self._config.dlc.model_cache_size,  # Preserve from config
+            preload_model=self._config.dlc.preload_model,  # Preserve from config
+            target_fps=self._config.dlc.target_fps,  # Preserve from config
+            target_latency_ms=self._config.dlc.target_latency_ms,  # Preserve from config
+            adaptive_resize=self._config.dlc.adaptive_resize,  # Preserve from config
+            min_resize=self._config.dlc.min_resize,  # Preserve from config
+            motion_model=self._config.dlc.motion_model,  # Preserve from config
+            motion_max_horizon_ms=self._config.dlc.motion_max_horizon_ms,  # Preserve from config
+            motion_min_confidence=self._config.dlc.motion_min_confidence,  # Preserve from config
+            predictions_to_processor=self._config.dlc.predictions_to_processor,  # Preserve from config
+            roi=self._inference_roi_from_ui(),
+            roi_margin=self._config.bbox.roi_margin,  # Preserve from config
             # additional_options=self._parse_json(self.additional_options_edit.toPlainText()),
         )
 
+    def _inference_roi_from_ui(self) -> tuple[int, int, int, int] | None:
+        if not self.bbox_roi_checkbox.isChecked():
+            return None
+        x0, y0 = self.bbox_x0_spin.value(), self.bbox_y0_spin.value()
+        x1, y1 = self.bbox_x1_spin.value(), self.bbox_y1_spin.value()
+        if not (x1 > x0 and y1 > y0):
+            raise ValueError("Inference ROI is enabled but the bounding box coordinates are invalid (x1>x0 and y1>y0).")
+        return (x0, y0, x1, y1)
+
     def _recording_settings_from_ui(self) -> RecordingSettings:
         return RecordingSettings(
             enabled=True,  # Always enabled - recording controlled by button
@@ -912,6 +989,11 @@ class DLCLiveMainWindow(QMainWindow):
             container=self.container_combo.currentText().strip() or "mp4",
             codec=self.codec_combo.currentText().strip() or "libx264",
             crf=int(self.crf_spin.value()),
+            pretrigger_seconds=self._config.recording.pretrigger_seconds,  # Preserve from config
+            pretrigger_memory_mb=self._config.recording.pretrigger_memory_mb,  # Preserve from config
+            spill_to_disk=self._config.recording.spill_to_disk,  # Preserve from config
+            spill_max_mb=self._config.recording.spill_max_mb,  # Preserve from config
+            buffer_memory_mb=self._config.recording.buffer_memory_mb,  # Preserve from config
         )
 
     def _bbox_settings_from_ui(self) -> BoundingBoxSettings:
@@ -921,6 +1003,8 @@ class DLCLiveMainWindow(QMainWindow):
             y0=self.bbox_y0_spin.value(),
             x1=self.bbox_x1_spin.value(),
             y1=self.bbox_y1_spin.value(),
+            inference_roi=self.bbox_roi_checkbox.isChecked(),
+            roi_margin=self._config.bbox.roi_margin,  # Preserve from config
         )
 
     def _visualization_settings_from_ui(self) -> VisualizationSettings:
@@ -1031,6 +1115,41 @@ class DLCLiveMainWindow(QMainWindow):
             except Exception:
                 pass
 
+            self._preload_model()
+
+    def _preload_model(self) -> None:
+        """Start loading the selected model in the background so that inference starts instantly."""
+        if self._dlc_active or not self._config.dlc.preload_model:
+            return
+        frame_shape = self._expected_inference_shape()
+        if frame_shape is None:
+            logger.debug("Inference camera resolution unknown; model will be loaded when inference starts")
+            return
+        try:
+            settings = self._dlc_settings_from_ui()
+        except Exception as exc:
+            logger.debug("Not preloading model: %s", exc)
+            return
+        if self._dlc.preload(settings, frame_shape):
+            self.statusBar().showMessage("Loading model in the background…", 3000)
+
+    def _expected_inference_shape(self) -> tuple[int, ...] | None:
+        """Shape of the frames inference will receive: the live frame, else the configured resolution."""
+        if self._raw_frame is not None:
+            return self._raw_frame.shape
+        for cam in self._config.multi_camera.get_active_cameras():
+            if self._inference_camera_id in (None, get_camera_id(cam)):
+                if cam.width > 0 and cam.height > 0:
+                    return (cam.height, cam.width, 3)
+                return None
+        return None
+
+    def _on_model_preloaded(self, success: bool, message: str) -> None:
+        if success:
+            self.statusBar().showMessage(f"Model ready: {Path(message).name}", 3000)
+        else:
+            self.statusBar().showMessage(f"Background model loading failed: {message}", 5000)
+
     def _action_browse_directory(self) -> None:
         directory = QFileDialog.getExistingDirectory(self, "Select output directory", str(Path.home()))
         if directory:
@@ -1332,15 +1451,17 @@ class DLCLiveMainWindow(QMainWindow):
         offset, scale = (0, 0), (1.0, 1.0)
 
         # If this is the inference camera, apply pose overlays
-        if cam_id == self._inference_camera_id and self._last_pose and self._last_pose.pose is not None:
-            output = draw_pose(
-                output,
-                self._last_pose.pose,
-                p_cutoff=self._p_cutoff,
-                colormap=self._colormap,
-                offset=offset,
-                scale=scale,
-            )
+        if cam_id == self._inference_camera_id:
+            if self._last_pose and self._last_pose.pose is not None:
+                output = draw_pose(
+                    output,
+                    self._last_pose.pose,
+                    p_cutoff=self._p_cutoff,
+                    colormap=self._colormap,
+                    offset=offset,
+                    scale=scale,
+                )
+            output = self._draw_extra_poses(output, offset, scale, displayed_only=True)
         if self._bbox_enabled:
             output = draw_bbox(
                 frame=output,
@@ -1402,9 +1523,16 @@ class DLCLiveMainWindow(QMainWindow):
             frame = frame_data.frames[dlc_cam_id]
             timestamp = frame_data.timestamps.get(dlc_cam_id, time.time())
             self._dlc.enqueue_frame(frame, timestamp)
+            self._extra_models.enqueue_frame(frame, timestamp)
 
-        # PRIORITY 2: Recording (queued, non-blocking)
-        if self._rec_manager.is_active and src_id in frame_data.frames:
+        # Recording requested before the preview was running: start as soon as frames flow
+        if self._pending_recording_start:
+            self._pending_recording_start = False
+            self._start_multi_camera_recording()
+
+        # PRIORITY 2: Recording (queued, non-blocking), or pre-trigger buffering while idle
+        recording_active = self._rec_manager.is_active
+        if src_id in frame_data.frames and (recording_active or self._rec_manager.pretrigger_enabled):
             frame = frame_data.frames[src_id]
 
             if self.record_with_overlays_checkbox.isChecked():
@@ -1412,7 +1540,10 @@ class DLCLiveMainWindow(QMainWindow):
                 frame = self._render_overlays_for_recording(src_id, frame)
 
             ts = frame_data.timestamps.get(src_id, time.time())
-            self._rec_manager.write_frame(src_id, frame, ts)
+            if recording_active:
+                self._rec_manager.write_frame(src_id, frame, ts)
+            else:
+                self._rec_manager.buffer_frame(src_id, frame, ts)
 
         # PRIORITY 3: Mark display dirty (tiling done in display timer)
         self._display_dirty = True
@@ -1423,13 +1554,19 @@ class DLCLiveMainWindow(QMainWindow):
         self.stop_preview_button.setEnabled(True)
         active_count = self.multi_camera_controller.get_active_count()
         self.statusBar().showMessage(f"Multi-camera preview started: {active_count} camera(s)", 5000)
+        self._rec_manager.configure_pretrigger(
+            self._config.recording,
+            [get_camera_id(cam) for cam in self._config.multi_camera.get_active_cameras()],
+        )
         self._update_inference_buttons()
         self._update_camera_controls_enabled()
 
     def _on_multi_camera_stopped(self) -> None:
         """Handle all cameras stopped event."""
         # Stop all multi-camera recorders
+        self._pending_recording_start = False
         self._stop_multi_camera_recording()
+        self._rec_manager.clear_pretrigger()
 
         self.preview_button.setEnabled(True)
         self.stop_preview_button.setEnabled(False)
@@ -1497,9 +1634,17 @@ class DLCLiveMainWindow(QMainWindow):
         self._rec_manager.stop_all()
         self.start_record_button.setEnabled(True)
         self.stop_record_button.setEnabled(False)
-        self.statusBar().showMessage("Multi-camera recording stopped", 3000)
+        self.statusBar().showMessage("Multi-camera recording stopped, finalizing files…", 3000)
         self._update_camera_controls_enabled()
 
+    def _on_recording_stop_progress(self, finished: int, total: int) -> None:
+        if finished < total:
+            self.statusBar().showMessage(f"Finalizing recordings: {finished}/{total}", 3000)
+
+    def _on_recording_stop_finished(self, run_dir) -> None:
+        where = f" in {run_dir}" if run_dir is not None else ""
+        self.statusBar().showMessage(f"Recording saved{where}", 5000)
+
     # ------------------------------------------------------------------
     # Camera control
     def _show_logo_and_text(self):
@@ -1628,7 +1773,7 @@ class DLCLiveMainWindow(QMainWindow):
             if selected_key is not None and self._scanned_processors:
                 try:
                     # For now, instantiate with no parameters
-                    processor = instantiate_from_scan(self._scanned_processors, selected_key)
+                    processor = create_processor(self._scanned_processors, selected_key, settings)
                     processor_name = self._scanned_processors[selected_key]["name"]
                     self.statusBar().showMessage(f"Loaded processor: {processor_name}", 3000)
                 except Exception as e:
@@ -1643,6 +1788,15 @@ class DLCLiveMainWindow(QMainWindow):
 
         self._dlc.configure(settings, processor=processor)
         self._model_path_store.save_if_valid(settings.model_path)
+
+        try:
+            self._extra_models.max_concurrent = self._config.max_concurrent_models
+            self._extra_models.configure(self._config.extra_models)
+        except (RuntimeError, ValueError) as exc:
+            self._show_error(f"Invalid additional models: {exc}")
+            return False
+        # The main model takes part in the scheduling of the extra models
+        self._dlc.set_inference_gate(self._extra_models.gate if len(self._extra_models) else None)
         return True
 
     def _update_inference_buttons(self) -> None:
@@ -1659,6 +1813,7 @@ class DLCLiveMainWindow(QMainWindow):
             self.model_path_edit,
             self.browse_model_button,
             self.dlc_camera_combo,
+            self.bbox_roi_checkbox,
             # self.additional_options_edit,
         ]
         processor_widgets = [
@@ -1703,6 +1858,8 @@ class DLCLiveMainWindow(QMainWindow):
 
     def _update_display_from_pending(self) -> None:
         """Update display from pending frames (called by display timer)."""
+        if self._poll_poses():
+            self._display_dirty = True
         if not self._display_dirty:
             return
         if not self._multi_camera_frames:
@@ -1752,6 +1909,8 @@ class DLCLiveMainWindow(QMainWindow):
             if self._dlc_active and self._dlc_initialized:
                 stats = self._dlc.get_stats()
                 summary = format_dlc_stats(stats)
+                for model_id, model_stats in self._extra_models.get_stats().items():
+                    summary += "\n" + format_model_stats(model_id, model_stats)
                 self.dlc_stats_label.setText(summary)
             else:
                 self.dlc_stats_label.setText("DLC processor idle")
@@ -1797,41 +1956,64 @@ class DLCLiveMainWindow(QMainWindow):
 
         # Format status message
         client_str = f"{num_clients} client{'s' if num_clients != 1 else ''}"
+        client_stats = processor.get_client_stats() if hasattr(processor, "get_client_stats") else []
+        if client_stats:
+            worst_lag = max(entry["send_lag_ms"] for entry in client_stats)
+            dropped = sum(entry["dropped"] for entry in client_stats)
+            client_str += f" (send lag {worst_lag:.1f} ms"
+            client_str += f", dropped {dropped})" if dropped else ")"
         recording_str = "Yes" if is_recording else "No"
         self.processor_status_label.setText(f"Clients: {client_str} | Recording: {recording_str}")
 
-        # Handle auto-recording based on processor's video recording flag
+        # Fallback for processors without recording listeners: poll the video recording flag.
+        # Event-driven processors update _last_processor_vid_recording first, making this a no-op.
         if hasattr(processor, "_vid_recording") and self.allow_processor_ctrl_checkbox.isChecked():
             current_vid_recording = processor.video_recording
-
-            # Check if video recording state changed
             if current_vid_recording != self._last_processor_vid_recording:
-                if current_vid_recording:
-                    # Start video recording
-                    if not self._rec_manager.is_active:
-                        # Get session name from processor
-                        session_name = getattr(processor, "session_name", "auto_session")
-                        self._auto_record_session_name = session_name
-
-                        # Processor overrides session name field + persist it
-                        self.session_name_edit.setText(session_name)
-                        self._settings_store.set_session_name(session_name)
-
-                        # Optional: set base filename to session name (readable stable filenames)
-                        self.filename_edit.setText(session_name)
-                        self._update_recording_path_preview()
-
-                        self._start_recording()
-                        self.statusBar().showMessage(f"Auto-started recording: {session_name}", 3000)
-                        logger.info(f"Auto-recording started for session: {session_name}")
-                else:
-                    # Stop video recording
-                    if self._rec_manager.is_active:
-                        self._stop_recording()
-                        self.statusBar().showMessage("Auto-stopped recording", 3000)
-                        logger.info("Auto-recording stopped")
+                session_name = getattr(processor, "session_name", "auto_session")
+                self._apply_processor_recording_state(current_vid_recording, session_name)
+
+    def _on_processor_recording_changed(
+        self, active: bool, step: int, session_name: str, frame_time: float = math.nan
+    ) -> None:
+        """Start/stop recording immediately when the socket processor changes recording state."""
+        if not self._dlc_active or not self._processor_control_enabled():
+            return
+        logger.info(
+            "Processor %s recording at step %d, frame time %.6f (session: %s)",
+            "started" if active else "stopped",
+            step,
+            frame_time,
+            session_name,
+        )
+        self._apply_processor_recording_state(active, session_name or "auto_session", frame_time=frame_time)
+
+    def _apply_processor_recording_state(
+        self, active: bool, session_name: str, frame_time: float | None = None
+    ) -> None:
+        frame_str = f" at frame time {frame_time:.6f}" if frame_time is not None and math.isfinite(frame_time) else ""
+        if active:
+            if not self._rec_manager.is_active:
+                self._auto_record_session_name = session_name
+
+                # Processor overrides session name field + persist it
+                self.session_name_edit.setText(session_name)
+                self._settings_store.set_session_name(session_name)
+
+                # Optional: set base filename to session name (readable stable filenames)
+                self.filename_edit.setText(session_name)
+                self._update_recording_path_preview()
+
+                self._start_recording()
+                self.statusBar().showMessage(f"Auto-started recording: {session_name}", 3000)
+                logger.info(f"Auto-recording started for session: {session_name}{frame_str}")
+        else:
+            if self._rec_manager.is_active:
+                self._stop_recording()
+                self.statusBar().showMessage("Auto-stopped recording", 3000)
+                logger.info(f"Auto-recording stopped{frame_str}")
 
-                self._last_processor_vid_recording = current_vid_recording
+        self._last_processor_vid_recording = active
 
     def _start_inference(self) -> None:
         if self._dlc_active:
@@ -1844,7 +2026,9 @@ class DLCLiveMainWindow(QMainWindow):
             self._update_inference_buttons()
             return
         self._dlc.reset()
+        self._extra_models.reset()
         self._last_pose = None
+        self._extra_poses.clear()
         self._dlc_active = True
         self._dlc_initialized = False
 
@@ -1863,7 +2047,9 @@ class DLCLiveMainWindow(QMainWindow):
         self._dlc_active = False
         self._dlc_initialized = False
         self._dlc.reset()
+        self._extra_models.reset()
         self._last_pose = None
+        self._extra_poses.clear()
         self._last_processor_vid_recording = False
         self._auto_record_session_name = None
 
@@ -1885,11 +2071,9 @@ class DLCLiveMainWindow(QMainWindow):
         # Auto-start preview if not running
         if not self.multi_camera_controller.is_running():
             self._start_preview()
-            # Wait a moment for cameras to initialize before recording
-            # The recording will start after preview is confirmed running
+            # Recording starts on the first frame delivered after the preview is running
             self.statusBar().showMessage("Starting preview before recording...", 3000)
-            # Use a single-shot timer to start recording after preview starts
-            QTimer.singleShot(500, self._start_multi_camera_recording)
+            self._pending_recording_start = True
             return
 
         # Preview already running, start recording immediately
@@ -1897,15 +2081,56 @@ class DLCLiveMainWindow(QMainWindow):
 
     def _stop_recording(self) -> None:
         """Stop recording from all cameras."""
+        self._pending_recording_start = False
         self._stop_multi_camera_recording()
 
-    def _on_pose_ready(self, result: PoseResult) -> None:
+    def _poll_poses(self) -> bool:
+        """Take the newest poses from the inference slots; True if there is a new pose to draw.
+
+        Poses are read at the display rate instead of being delivered as one Qt event per
+        inference, so fast models neither flood the event queue nor force extra redraws.
+        """
         if not self._dlc_active:
-            return
-        self._last_pose = result
-        # logger.debug(f"Pose result: {result.pose}, Timestamp: {result.timestamp}")
-        if self._current_frame is not None:
-            self._display_frame(self._current_frame, force=True)
+            return False
+        changed = False
+        seq, result = self._dlc.latest_pose.read()
+        if seq != self._pose_seq:
+            self._pose_seq = seq
+            if result is not None:
+                self._last_pose = result
+                changed = True
+        for model_id, (seq, result) in self._extra_models.latest_poses().items():
+            if seq != self._extra_pose_seqs.get(model_id):
+                self._extra_pose_seqs[model_id] = seq
+                if result is not None:
+                    self._extra_poses[model_id] = result
+                    changed = True
+        return changed
+
+    def _on_extra_model_error(self, model_id: str, message: str) -> None:
+        # The main model keeps running; only this model's overlay goes away
+        self._extra_poses.pop(model_id, None)
+        self.statusBar().showMessage(f"Model '{model_id}' failed: {message}", 5000)
+
+    def _draw_extra_poses(self, frame: np.ndarray, offset, scale, *, displayed_only: bool = False) -> np.ndarray:
+        """Draw the latest pose of every extra model, each with its own colormap."""
+        model_ids = self._extra_models.model_ids
+        for model_id, result in self._extra_poses.items():
+            i = model_ids.index(model_id) if model_id in model_ids else 0
+            checkbox = self.model_overlay_checkboxes.get(model_id)
+            if displayed_only and checkbox is not None and not checkbox.isChecked():
+                continue
+            if result.pose is None:
+                continue
+            frame = draw_pose(
+                frame,
+                result.pose,
+                p_cutoff=self._p_cutoff,
+                colormap=EXTRA_MODEL_COLORMAPS[i % len(EXTRA_MODEL_COLORMAPS)],
+                offset=offset,
+                scale=scale,
+            )
+        return frame
 
     def _on_dlc_error(self, message: str) -> None:
         self._stop_inference(show_message=False)
@@ -1923,6 +2148,10 @@ class DLCLiveMainWindow(QMainWindow):
                 offset=self._dlc_tile_offset,
                 scale=self._dlc_tile_scale,
             )
+        if self._extra_poses:
+            display_frame = self._draw_extra_poses(
+                display_frame, self._dlc_tile_offset, self._dlc_tile_scale, displayed_only=True
+            )
 
         if self._bbox_enabled:
             display_frame = draw_bbox(
@@ -2026,8 +2255,8 @@ class DLCLiveMainWindow(QMainWindow):
 
         if hasattr(self, "_camera_validation_timer") and self._camera_validation_timer.isActive():
             self._camera_validation_timer.stop()
-        # Stop all multi-camera recorders
-        self._rec_manager.stop_all()
+        # Stop all multi-camera recorders and wait for the files to be finalized
+        self._rec_manager.stop_all(wait=True)
 
         # Close the camera dialog if open (ensures its worker thread is canceled)
         if getattr(self, "_cam_dialog", None) is not None and self._cam_dialog.isVisible():
@@ -2038,6 +2267,7 @@ class DLCLiveMainWindow(QMainWindow):
             self._cam_dialog = None
 
         self._dlc.shutdown()
+        self._extra_models.shutdown()
         if hasattr(self, "_metrics_timer"):
             self._metrics_timer.stop()
 
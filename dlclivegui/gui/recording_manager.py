@@ -1,26 +1,60 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from pathlib import Path
 
 import numpy as np
+from PySide6.QtCore import QObject, Signal
 
 from dlclivegui.config import CameraSettings, RecordingSettings
 from dlclivegui.services.multi_camera_controller import get_camera_id
-from dlclivegui.services.video_recorder import RecorderStats, VideoRecorder
+from dlclivegui.services.video_recorder import FrameRingBuffer, RecorderStats, VideoRecorder
 from dlclivegui.utils.utils import build_run_dir, sanitize_name
 
 log = logging.getLogger(__name__)
 
+MIN_RECORDER_BUFFER = 8  # frames
+# (height, width) assumed when a camera has neither a current frame nor a configured resolution;
+# deliberately large so that the estimate never lets the queue exceed its share of the budget
+ESTIMATED_FRAME_SIZE = (1080, 1920)
 
-class RecordingManager:
-    """Handle multi-camera recording lifecycle and filenames."""
+
+def allocate_buffer_frames(budget_bytes: int, streams: dict[str, tuple[int, float]]) -> dict[str, int]:
+    """Split a RAM budget across cameras and return a queue length (in frames) per camera.
+
+    ``streams`` maps camera id -> (bytes per frame, fps). The budget is shared in
+    proportion to each stream's byte rate so that every camera can absorb the same
+    duration of encoder stall, whatever its resolution.
+    """
+    rates = {cam_id: nbytes * (fps if fps > 0 else 30.0) for cam_id, (nbytes, fps) in streams.items() if nbytes > 0}
+    total_rate = sum(rates.values())
+    out: dict[str, int] = {}
+    for cam_id, rate in rates.items():
+        share = budget_bytes * rate / total_rate
+        out[cam_id] = max(MIN_RECORDER_BUFFER, int(share // streams[cam_id][0]))
+    return out
+
+
+class RecordingManager(QObject):
+    """Handle multi-camera recording lifecycle and filenames.
+
+    Stopping is asynchronous: recorders are drained and finalized concurrently on
+    background threads, while the manager is immediately ready for a new recording.
+    """
+
+    stop_progress = Signal(int, int)  # recorders finalized, total
+    stop_finished = Signal(object)  # run dir of the stopped recording (Path | None)
 
     def __init__(self):
+        super().__init__()
         self._recorders: dict[str, VideoRecorder] = {}
         self._session_dir: Path | None = None
         self._run_dir: Path | None = None
+        self._pretrigger: dict[str, FrameRingBuffer] = {}
+        self._stop_threads: list[threading.Thread] = []
+        self._stop_lock = threading.Lock()
 
     @property
     def is_active(self) -> bool:
@@ -38,9 +72,52 @@ class RecordingManager:
     def run_dir(self) -> Path | None:
         return self._run_dir
 
+    @property
+    def is_finalizing(self) -> bool:
+        """True while previously stopped recorders are still being drained/closed."""
+        with self._stop_lock:
+            return any(t.is_alive() for t in self._stop_threads)
+
+    @property
+    def pretrigger_enabled(self) -> bool:
+        return bool(self._pretrigger)
+
     def pop(self, cam_id: str, default=None) -> VideoRecorder | None:
         return self._recorders.pop(cam_id, default)
 
+    def configure_pretrigger(self, recording: RecordingSettings, cam_ids: list[str]) -> None:
+        """(Re)arm the pre-trigger ring buffers for the given cameras.
+
+        The memory budget in ``recording.pretrigger_memory_mb`` is split evenly
+        across cameras. A zero duration or budget disables pre-trigger buffering.
+        """
+        self.clear_pretrigger()
+        seconds = float(recording.pretrigger_seconds)
+        budget = int(recording.pretrigger_memory_mb) * 1024 * 1024
+        if seconds <= 0.0 or budget <= 0 or not cam_ids:
+            self._pretrigger = {}
+            return
+        per_cam = budget // len(cam_ids)
+        self._pretrigger = {cam_id: FrameRingBuffer(seconds, per_cam) for cam_id in cam_ids}
+        log.info(
+            "Pre-trigger buffer armed: %.2fs, %.1f MB per camera (%d cameras)",
+            seconds,
+            per_cam / (1024 * 1024),
+            len(cam_ids),
+        )
+
+    def clear_pretrigger(self) -> None:
+        for ring in self._pretrigger.values():
+            ring.clear()
+        self._pretrigger = {}
+
+    def buffer_frame(self, cam_id: str, frame: np.ndarray, timestamp: float | None = None) -> None:
+        """Keep ``frame`` in the pre-trigger ring of ``cam_id`` (no-op while recording it)."""
+        ring = self._pretrigger.get(cam_id)
+        if ring is None or cam_id in self._recorders:
+            return
+        ring.append(frame, timestamp if timestamp is not None else time.time())
+
     def start_all(
         self,
         recording: RecordingSettings,
@@ -89,6 +166,26 @@ class RecordingManager:
 
         started_any = False
 
+        # Size encoder queues from the RAM budget (frames are stored as uint8 RGB)
+        streams = {}
+        for cam in active_cams:
+            cam_id = get_camera_id(cam)
+            frame = current_frames.get(cam_id)
+            if frame is not None:
+                height, width = frame.shape[:2]
+            elif cam.width > 0 and cam.height > 0:
+                height, width = cam.height, cam.width
+                log.info(
+                    "No frame from %s yet; sizing its recorder buffer for the configured %dx%d", cam_id, width, height
+                )
+            else:
+                height, width = ESTIMATED_FRAME_SIZE
+                log.warning(
+                    "Frame size of %s unknown; sizing its recorder buffer for %dx%d frames", cam_id, width, height
+                )
+            streams[cam_id] = (height * width * 3, float(cam.fps))
+        buffer_frames = allocate_buffer_frames(recording.buffer_memory_mb * 1024 * 1024, streams)
+
         for cam in active_cams:
             cam_id = get_camera_id(cam)
             cam_filename = f"{base_stem}_{cam.backend}_cam{cam.index}{base_path.suffix}"
@@ -97,18 +194,33 @@ class RecordingManager:
             frame = current_frames.get(cam_id)
             frame_size = (frame.shape[0], frame.shape[1]) if frame is not None else None
 
+            ring = self._pretrigger.get(cam_id)
+            pending = ring.drain() if ring is not None else []
+            if frame_size is not None:
+                # Frames captured before a resolution change cannot go into this file
+                pending = [(f, ts) for f, ts in pending if f.shape[:2] == frame_size]
+
             recorder = VideoRecorder(
                 cam_path,
                 frame_size=frame_size,
                 frame_rate=float(cam.fps),
                 codec=recording.codec,
                 crf=recording.crf,
+                buffer_size=buffer_frames[cam_id] + len(pending),
+                spill_max_bytes=recording.spill_max_mb * 1024 * 1024 if recording.spill_to_disk else 0,
             )
             try:
                 recorder.start()
                 self._recorders[cam_id] = recorder
                 started_any = True
-                log.info("Started recording %s -> %s", cam_id, cam_path)
+                log.info(
+                    "Started recording %s -> %s (buffer %d frames)",
+                    cam_id,
+                    cam_path,
+                    buffer_frames[cam_id],
+                )
+                if pending:
+                    self._flush_pretrigger(cam_id, recorder, pending)
             except Exception as exc:
                 log.error("Failed to start recording for %s: %s", cam_id, exc)
                 if all_or_nothing:
@@ -123,16 +235,81 @@ class RecordingManager:
 
         return run_dir
 
-    def stop_all(self) -> None:
-        for cam_id, rec in self._recorders.items():
+    def _flush_pretrigger(self, cam_id: str, recorder: VideoRecorder, pending: list[tuple[np.ndarray, float]]) -> None:
+        written = 0
+        for frame, ts in pending:
             try:
-                rec.stop()
-                log.info("Stopped recording %s", cam_id)
+                if recorder.write(frame, timestamp=ts):
+                    written += 1
             except Exception as exc:
-                log.warning("Error stopping recorder for %s: %s", cam_id, exc)
+                log.warning("Failed to flush pre-trigger frames for %s: %s", cam_id, exc)
+                break
+        span = pending[-1][1] - pending[0][1] if len(pending) > 1 else 0.0
+        log.info("Flushed %d/%d pre-trigger frames (%.2fs) for %s", written, len(pending), span, cam_id)
+
+    def stop_all(self, *, wait: bool = False, timeout: float | None = None) -> None:
+        """Stop all recorders.
+
+        State is cleared immediately so a new recording can be started right away;
+        the recorders themselves are drained and finalized concurrently in the
+        background (see :attr:`stop_progress` / :attr:`stop_finished`).
+
+        Args:
+            wait: If True, block until all recorders are finalized (e.g. on shutdown).
+            timeout: Maximum time to wait when ``wait`` is True (None = no limit).
+        """
+        recorders = list(self._recorders.items())
+        run_dir = self._run_dir
         self._recorders.clear()
         self._session_dir = None
         self._run_dir = None
+        if recorders:
+            self._stop_in_background(recorders, run_dir)
+        if wait:
+            self.wait_for_stop(timeout)
+
+    def wait_for_stop(self, timeout: float | None = None) -> bool:
+        """Block until background stops complete. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._stop_lock:
+            threads = list(self._stop_threads)
+        for t in threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            t.join(remaining)
+        return not self.is_finalizing
+
+    def _stop_in_background(
+        self, recorders: list[tuple[str, VideoRecorder]], run_dir: Path | None, *, announce: bool = True
+    ) -> None:
+        total = len(recorders)
+        done = 0
+        done_lock = threading.Lock()
+
+        def _stop_one(cam_id: str, rec: VideoRecorder) -> None:
+            nonlocal done
+            try:
+                rec.stop()
+                log.info("Stopped recording %s", cam_id)
+            except Exception as exc:
+                log.warning("Error stopping recorder for %s: %s", cam_id, exc)
+            with done_lock:
+                done += 1
+                finished = done
+            if not announce:
+                return
+            self.stop_progress.emit(finished, total)
+            if finished == total:
+                log.info("Finalized %d recording(s) in %s", total, run_dir)
+                self.stop_finished.emit(run_dir)
+
+        threads = [
+            threading.Thread(target=_stop_one, args=(cam_id, rec), name=f"RecorderStop-{cam_id}", daemon=True)
+            for cam_id, rec in recorders
+        ]
+        with self._stop_lock:
+            self._stop_threads = [t for t in self._stop_threads if t.is_alive()] + threads
+        for t in threads:
+            t.start()
 
     def write_frame(self, cam_id: str, frame: np.ndarray, timestamp: float | None = None) -> None:
         rec = self._recorders.get(cam_id)
@@ -142,17 +319,15 @@ class RecordingManager:
             rec.write(frame, timestamp=timestamp if timestamp is not None else time.time())
         except Exception as exc:
             log.warning("Failed to write frame for %s: %s", cam_id, exc)
-            try:
-                rec.stop()
-            except Exception:
-                log.exception("Failed to stop recorder for %s after write error.")
             self._recorders.pop(cam_id, None)
+            self._stop_in_background([(cam_id, rec)], self._run_dir, announce=False)
 
     def get_stats_summary(self) -> str:
         totals = {
             "written": 0,
             "dropped": 0,
             "queue": 0,
+            "spilled": 0,
             "max_latency": 0.0,
             "avg_latencies": [],
         }
@@ -163,6 +338,7 @@ class RecordingManager:
             totals["written"] += stats.frames_written
             totals["dropped"] += stats.dropped_frames
             totals["queue"] += stats.queue_size
+            totals["spilled"] += stats.spilled_frames
             totals["max_latency"] = max(totals["max_latency"], stats.last_latency)
             totals["avg_latencies"].append(stats.average_latency)
 
@@ -176,8 +352,9 @@ class RecordingManager:
             return "Recording..."
         else:
             avg = sum(totals["avg_latencies"]) / len(totals["avg_latencies"]) if totals["avg_latencies"] else 0.0
+            spilled = f" | spilled {totals['spilled']}" if totals["spilled"] else ""
             return (
                 f"{len(self._recorders)} cams | {totals['written']} frames | "
                 f"latency {totals['max_latency'] * 1000:.1f}ms (avg {avg * 1000:.1f}ms) | "
-                f"queue {totals['queue']} | dropped {totals['dropped']}"
+                f"queue {totals['queue']} | dropped {totals['dropped']}{spilled}"
             )
@@ -0,0 +1,327 @@
+"""Single-threaded asyncio server for socket processors.
+
+:class:`AsyncProcessorServer` is a drop-in transport for :class:`BaseProcessorSocket`
+(``server_backend="asyncio"``). One event-loop thread accepts clients, reads their
+commands and fans out broadcasts, instead of one receive thread per client plus an
+accept thread and a sender thread.
+
+The server speaks the ``multiprocessing.connection`` protocol, so existing clients
+(``Client(address, authkey=...)`` with ``send``/``recv``/``recv_bytes``) keep working:
+
+* frames are a big-endian ``int32`` length (``-1`` followed by a ``uint64`` length for
+  payloads above 2 GiB) and the payload bytes;
+* authentication reuses ``multiprocessing.connection.deliver_challenge`` and
+  ``answer_challenge``. The handshake is blocking, so it runs in the loop's default
+  executor; everything else stays on the loop thread.
+"""
+
+# dlclivegui/processors/async_server.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import pickle
+import socket
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, answer_challenge, deliver_challenge
+
+logger = logging.getLogger("dlc_processor_socket")
+
+_SIZE = struct.Struct("!i")
+_LONG_SIZE = struct.Struct("!Q")
+_MAX_SHORT = 0x7FFFFFFF
+
+HANDSHAKE_TIMEOUT = 5.0
+
+
+def pack_frame(data: bytes) -> bytes:
+    """Prefix ``data`` with a ``multiprocessing.connection`` length header."""
+    n = len(data)
+    if n > _MAX_SHORT:
+        return _SIZE.pack(-1) + _LONG_SIZE.pack(n) + data
+    return _SIZE.pack(n) + data
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    (size,) = _SIZE.unpack(await reader.readexactly(_SIZE.size))
+    if size == -1:
+        (size,) = _LONG_SIZE.unpack(await reader.readexactly(_LONG_SIZE.size))
+    return await reader.readexactly(size)
+
+
+def _set_recv_timeout(sock: socket.socket, seconds: float) -> None:
+    """Kernel-level receive timeout (``Connection`` reads the raw handle, ignoring ``settimeout``)."""
+    try:
+        if sys.platform.startswith("win"):
+            value = struct.pack("I", int(seconds * 1000))
+        else:
+            value = struct.pack("ll", int(seconds), int((seconds % 1) * 1e6))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, value)
+    except OSError:
+        pass
+
+
+@dataclass
+class ClientStats:
+    """Per-client delivery statistics (used by both server backends).
+
+    ``send lag`` is the time between ``broadcast()`` and the payload being handed to
+    the client's socket.
+    """
+
+    sent: int = 0
+    lag_avg_ms: float = 0.0  # exponential moving average
+    lag_max_ms: float = 0.0
+    lag_last_ms: float = 0.0
+
+    LAG_SMOOTHING = 0.1
+
+    def record(self, lag_seconds: float) -> None:
+        lag_ms = lag_seconds * 1000.0
+        if self.sent == 0:
+            self.lag_avg_ms = lag_ms
+        else:
+            self.lag_avg_ms += self.LAG_SMOOTHING * (lag_ms - self.lag_avg_ms)
+        self.lag_max_ms = max(self.lag_max_ms, lag_ms)
+        self.lag_last_ms = lag_ms
+        self.sent += 1
+
+
+class AsyncClient:
+    """A connected client (kept in :attr:`AsyncProcessorServer.clients`)."""
+
+    __slots__ = ("peer", "writer", "dropped", "stats")
+
+    def __init__(self, peer, writer: asyncio.StreamWriter):
+        self.peer = peer
+        self.writer = writer
+        self.dropped = 0
+        self.stats = ClientStats()
+
+    def __repr__(self):
+        return f"AsyncClient(peer={self.peer!r}, dropped={self.dropped})"
+
+
+class AsyncProcessorServer:
+    """
+    Accept clients, dispatch their commands and broadcast payloads from one asyncio loop.
+
+    Args:
+        bind: (host, port) to listen on. Port 0 picks a free port (see :attr:`address`).
+        authkey: Shared secret for the ``multiprocessing`` handshake, or None for no auth.
+        on_message: Called with every unpickled client message. It runs in the loop's
+            executor (one message at a time per client, in order), so slow commands such
+            as ``save`` do not stall broadcasts. A non-None return value is pickled and sent
+            back to that client only (e.g. the reply to ``ping``).
+        client_queue_size: Max payloads buffered per client. When a client's pending
+            output exceeds this many payloads, new payloads are dropped for that client.
+    """
+
+    def __init__(
+        self,
+        bind,
+        authkey: bytes | None,
+        on_message: Callable[[object], object],
+        *,
+        client_queue_size: int = 8,
+    ):
+        self._bind = tuple(bind)
+        self._authkey = authkey
+        self._on_message = on_message
+        self._client_queue_size = max(1, int(client_queue_size))
+
+        # Mutated only from the loop thread; len()/iteration snapshots are safe elsewhere
+        self.clients: set[AsyncClient] = set()
+        self.dropped_payloads: dict[object, int] = {}  # peer -> payloads dropped
+
+        self._sock: socket.socket | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._stopping: asyncio.Event | None = None
+        self._client_tasks: set[asyncio.Task] = set()
+
+    @property
+    def address(self):
+        """Actual bound (host, port)."""
+        return self._sock.getsockname()[:2] if self._sock is not None else self._bind
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def start(self) -> None:
+        """Bind (raising on error in the caller) and start the loop thread."""
+        if self.running:
+            return
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            if not sys.platform.startswith("win"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(self._bind)
+            sock.listen()
+            sock.setblocking(False)
+        except Exception:
+            sock.close()
+            raise
+        self._sock = sock
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="ProcessorAsyncServer", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5.0)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        loop = self._loop
+        if loop is not None and self._stopping is not None:
+            try:
+                loop.call_soon_threadsafe(self._stopping.set)
+            except RuntimeError:
+                pass  # loop already closed
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("Async server thread did not terminate cleanly")
+            self._thread = None
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+            self._sock = None
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._serve())
+        except Exception:
+            logger.exception("Async processor server crashed")
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception:
+                pass
+            loop.close()
+            self._loop = None
+            self._ready.set()
+
+    async def _serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        client_tasks: set[asyncio.Task] = set()
+        self._client_tasks = client_tasks
+        accept_task = loop.create_task(self._accept_loop())
+        self._ready.set()
+
+        await self._stopping.wait()
+
+        accept_task.cancel()
+        for client in list(self.clients):
+            client.writer.close()
+        for task in list(client_tasks):
+            task.cancel()
+        await asyncio.gather(accept_task, *client_tasks, return_exceptions=True)
+        self.clients.clear()
+
+    # ------------------------------------------------------------------ accept / receive
+
+    async def _accept_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                sock, peer = await loop.sock_accept(self._sock)
+            except asyncio.CancelledError:
+                raise
+            except OSError as exc:
+                logger.debug(f"Accept failed: {exc}")
+                await asyncio.sleep(0.05)
+                continue
+            task = loop.create_task(self._handle_client(sock, peer))
+            self._client_tasks.add(task)
+            task.add_done_callback(self._client_tasks.discard)
+
+    def _authenticate(self, sock: socket.socket) -> None:
+        """Run the blocking multiprocessing handshake on a duplicate of ``sock``."""
+        sock.setblocking(True)
+        _set_recv_timeout(sock, HANDSHAKE_TIMEOUT)  # a silent client must not hold an executor thread
+        dup = sock.dup()
+        conn = Connection(dup.detach())
+        try:
+            deliver_challenge(conn, self._authkey)
+            answer_challenge(conn, self._authkey)
+        finally:
+            conn.close()
+            _set_recv_timeout(sock, 0)
+            sock.setblocking(False)
+
+    async def _handle_client(self, sock: socket.socket, peer) -> None:
+        loop = asyncio.get_running_loop()
+        if self._authkey is not None:
+            try:
+                await loop.run_in_executor(None, self._authenticate, sock)
+            except Exception as exc:
+                logger.warning(f"Rejected client {peer}: {exc}")
+                sock.close()
+                return
+
+        reader, writer = await asyncio.open_connection(sock=sock)
+        client = AsyncClient(peer, writer)
+        self.clients.add(client)
+        logger.debug(f"Client connected from {peer}")
+        try:
+            while True:
+                msg = pickle.loads(await read_frame(reader))
+                reply = await loop.run_in_executor(None, self._dispatch, msg)
+                if reply is not None and not writer.transport.is_closing():
+                    writer.write(pack_frame(pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(f"Dropping client {peer}: {exc}")
+        finally:
+            self.clients.discard(client)
+            self.dropped_payloads.pop(peer, None)
+            writer.close()
+            logger.info("Client disconnected")
+
+    def _dispatch(self, msg):
+        try:
+            return self._on_message(msg)
+        except Exception:
+            logger.exception("Client command failed")
+            return None
+
+    # ------------------------------------------------------------------ broadcast
+
+    def broadcast(self, data: bytes) -> None:
+        """Thread-safe: queue ``data`` (already serialized) for every connected client."""
+        loop = self._loop
+        if loop is None or not self.clients:
+            return
+        try:
+            loop.call_soon_threadsafe(self._fanout, pack_frame(data), time.perf_counter())
+        except RuntimeError:
+            pass  # loop closed during shutdown
+
+    def _fanout(self, framed: bytes, enqueued: float) -> None:
+        limit = self._client_queue_size * len(framed)
+        lag = time.perf_counter() - enqueued
+        for client in list(self.clients):
+            transport = client.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() >= limit:
+                client.dropped += 1
+                self.dropped_payloads[client.peer] = client.dropped
+                continue
+            client.writer.write(framed)
+            client.stats.record(lag)
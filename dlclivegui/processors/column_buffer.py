@@ -0,0 +1,142 @@
+"""Growable NumPy column for per-frame processor data.
+
+Processors record one value (a timestamp, a step, a derived angle, a whole pose
+array, ...) per frame for the duration of a recording. :class:`ColumnBuffer` keeps
+these values in fixed-size preallocated NumPy chunks instead of a ``deque`` of boxed
+Python objects:
+
+* ``append`` writes into the current chunk and is O(1) with no reallocation or
+  copy of earlier data (a new chunk is allocated every ``chunk_size`` rows);
+* ``to_array`` returns the filled rows as one array: a view if everything fits in a
+  single chunk, otherwise one ``np.concatenate``;
+* ``chunks`` yields views of the filled rows chunk by chunk, for writers that can
+  stream data without building a single array.
+
+Row shape and dtype are taken from the first appended value unless given; values of
+any other shape are rejected rather than broadcast into the row.
+"""
+
+# dlclivegui/processors/column_buffer.py
+from __future__ import annotations
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class ColumnBuffer:
+    """Append-only column of equally shaped values backed by NumPy chunks."""
+
+    __slots__ = ("_dtype", "_shape", "_chunk_size", "_chunks", "_pos", "_len", "_name")
+
+    def __init__(
+        self,
+        dtype=None,
+        shape: tuple[int, ...] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        name: str | None = None,
+    ):
+        self._name = name
+        self._dtype = np.dtype(dtype) if dtype is not None else None
+        self._shape = tuple(shape) if shape is not None else None
+        self._chunk_size = max(1, int(chunk_size))
+        self._chunks: list[np.ndarray] = []
+        self._pos = self._chunk_size  # row index in the last chunk; full -> allocate on next append
+        self._len = 0
+
+    @property
+    def dtype(self) -> np.dtype | None:
+        return self._dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the data as :meth:`to_array` would return it."""
+        return (self._len,) + (self._shape or ())
+
+    @property
+    def name(self) -> str | None:
+        return self._name
+
+    def append(self, value) -> None:
+        if self._shape is None or self._dtype is None:
+            arr = np.asarray(value, dtype=self._dtype)
+            if self._shape is None:
+                self._shape = arr.shape
+            if self._dtype is None:
+                self._dtype = arr.dtype
+        if np.shape(value) != self._shape:
+            raise ValueError(
+                f"Column {self._name or '<unnamed>'!r}: value of shape {np.shape(value)} "
+                f"does not match row shape {self._shape}"
+            )
+        if self._pos == self._chunk_size:
+            self._chunks.append(np.empty((self._chunk_size,) + self._shape, dtype=self._dtype))
+            self._pos = 0
+        self._chunks[-1][self._pos] = value
+        self._pos += 1
+        self._len += 1
+
+    def clear(self) -> None:
+        """Drop all rows. Arrays returned earlier stay valid (chunks are never reused)."""
+        self._chunks = []
+        self._pos = self._chunk_size
+        self._len = 0
+
+    def chunks(self):
+        """Yield views of the filled rows, one per chunk, oldest first.
+
+        Only rows appended before the call are included, so this is safe to use
+        while another thread keeps appending.
+        """
+        n = self._len
+        chunks = self._chunks
+        full, rest = divmod(n, self._chunk_size)
+        yield from chunks[:full]
+        if rest:
+            yield chunks[full][:rest]
+
+    def rows(self, start: int, stop: int | None = None) -> np.ndarray:
+        """Rows ``[start, stop)``; a view when they lie within one chunk."""
+        stop = self._len if stop is None else min(stop, self._len)
+        if start >= stop:
+            return np.empty((0,) + (self._shape or ()), dtype=self._dtype if self._dtype is not None else float)
+        size = self._chunk_size
+        first, last = start // size, (stop - 1) // size
+        if first == last:
+            return self._chunks[first][start - first * size : stop - first * size]
+        parts = [self._chunks[first][start - first * size :], *self._chunks[first + 1 : last]]
+        parts.append(self._chunks[last][: stop - last * size])
+        return np.concatenate(parts)
+
+    def to_array(self) -> np.ndarray:
+        parts = list(self.chunks())
+        if not parts:
+            return np.empty((0,) + (self._shape or ()), dtype=self._dtype if self._dtype is not None else float)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.to_array()
+        return arr.astype(dtype, copy=False) if dtype is not None else arr
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            i = int(index)
+            if i < 0:
+                i += self._len
+            if not 0 <= i < self._len:
+                raise IndexError("ColumnBuffer index out of range")
+            return self._chunks[i // self._chunk_size][i % self._chunk_size]
+        return self.to_array()[index]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __repr__(self):
+        return f"ColumnBuffer(name={self._name!r}, len={self._len}, shape={self._shape}, dtype={self._dtype})"
@@ -2,20 +2,27 @@
 
 # dlclivegui/processors/dlc_processor_socket.py
 import logging
+import os
 import pickle
 import socket
 import sys
 import time
 from collections import deque
-from math import acos, atan2, copysign, degrees, pi, sqrt
+from math import acos, atan2, copysign, degrees, nan, sqrt
 from multiprocessing.connection import Client, Listener
 from pathlib import Path
-from threading import Event, Thread
+from threading import Condition, Event, Lock, Thread, current_thread
 
 import numpy as np
-import pandas as pd
 from dlclive import Processor  # type: ignore
 
+from dlclivegui.processors.async_server import AsyncProcessorServer, ClientStats
+from dlclivegui.processors.column_buffer import ColumnBuffer
+from dlclivegui.processors.one_euro import OneEuroFilter, OneEuroFilterArray  # noqa: F401
+from dlclivegui.processors.pose_protocol import encode_pose_message
+from dlclivegui.processors.pose_stream import DEFAULT_CHUNK_ROWS, PoseStreamWriter, pose_dataframe
+from dlclivegui.processors.shared_pose import SharedPosePublisher
+
 logger = logging.getLogger("dlc_processor_socket")
 
 # Avoid duplicate handlers if module is imported multiple times
@@ -27,6 +34,12 @@ if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
 # Registry for GUI discovery
 PROCESSOR_REGISTRY = {}
 
+# Broadcast encodings: pickled Python lists, or the binary format of pose_protocol.py
+WIRE_FORMATS = ("pickle", "binary")
+
+# Server implementations: accept/rx/sender threads, or a single asyncio loop (async_server.py)
+SERVER_BACKENDS = ("threads", "asyncio")
+
 
 def register_processor(cls):
     registry_key = getattr(cls, "PROCESSOR_ID", cls.__name__)
@@ -39,45 +52,6 @@ def register_processor(cls):
     return cls
 
 
-class OneEuroFilter:  # pragma: no cover
-    def __init__(self, t0, x0, dx0=None, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
-        self.min_cutoff = min_cutoff
-        self.beta = beta
-        self.d_cutoff = d_cutoff
-        self.x_prev = x0
-        if dx0 is None:
-            dx0 = np.zeros_like(x0)
-        self.dx_prev = dx0
-        self.t_prev = t0
-
-    @staticmethod
-    def smoothing_factor(t_e, cutoff):
-        r = 2 * pi * cutoff * t_e
-        return r / (r + 1)
-
-    @staticmethod
-    def exponential_smoothing(alpha, x, x_prev):
-        return alpha * x + (1 - alpha) * x_prev
-
-    def __call__(self, t, x):
-        t_e = t - self.t_prev
-        if t_e <= 0:
-            return x
-        a_d = self.smoothing_factor(t_e, self.d_cutoff)
-        dx = (x - self.x_prev) / t_e
-        dx_hat = self.exponential_smoothing(a_d, dx, self.dx_prev)
-
-        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
-        a = self.smoothing_factor(t_e, cutoff)
-        x_hat = self.exponential_smoothing(a, x, self.x_prev)
-
-        self.x_prev = x_hat
-        self.dx_prev = dx_hat
-        self.t_prev = t
-
-        return x_hat
-
-
 # pragma: cover
 class BaseProcessorSocket(Processor):
     """
@@ -97,9 +71,15 @@ class BaseProcessorSocket(Processor):
         authkey=None,
         use_perf_counter=False,
         save_original=False,
+        wire_format="pickle",
+        shm_name=None,
+        server_backend="threads",
+        stream_original=False,
+        timing_info=False,
         *,
         start_server: bool = True,
         socket_timeout: float = 1.0,
+        client_queue_size: int = 8,
     ):
         """
         Args:
@@ -107,8 +87,27 @@ class BaseProcessorSocket(Processor):
             authkey: Optional auth key bytes. If None and bind is set, defaults to b"secret password".
             use_perf_counter: If True, uses time.perf_counter; else time.time.
             save_original: If True, stores raw pose arrays.
+            wire_format: "pickle" (default, clients use Client.recv()) or "binary"
+                (see pose_protocol.py, clients use recv_bytes() + decode_pose_message()).
+            shm_name: Optional shared-memory segment name. If set, every broadcast payload is
+                also published there for same-host readers (see shared_pose.py).
+            server_backend: "threads" (default: accept thread, one receive thread per client
+                and a sender thread) or "asyncio" (one event-loop thread for all clients,
+                see async_server.py). Both accept the same clients and commands.
+            stream_original: With save_original, append recorded poses to the HDF5 file in
+                the background while recording (see pose_stream.py) instead of writing
+                everything at save time.
+            timing_info: If True, pickle payloads get a trailing dict with ``frame_id`` (the
+                processor step), ``frame_time`` (camera capture time, use it to align poses
+                with video frames), ``pose_time`` and ``predicted`` (True for motion-model
+                estimates, which are broadcast but not recorded; binary messages always carry
+                these, ``predicted`` as a header flag). Together with the ``ping`` command this
+                lets clients measure camera-to-client latency.
             start_server: If True and bind is not None, starts the socket server in __init__.
             socket_timeout: Socket poll/accept timeout.
+            client_queue_size: Max payloads buffered per client (each client has its own
+                sender thread); when a client falls behind, its oldest pending payloads are
+                dropped.
         """
         super().__init__()
         self.dlc_cfg = None  # DeepLabCut config for saving original pose data
@@ -117,12 +116,12 @@ class BaseProcessorSocket(Processor):
         self.timing_func = time.perf_counter if use_perf_counter else time.time
         self.start_time = self.timing_func()
 
-        # Recording buffers
-        self.time_stamp = deque()
-        self.step = deque()
-        self.frame_time = deque()
-        self.pose_time = deque()
-        self.original_pose = deque() if save_original else None
+        # Recording buffers (preallocated NumPy chunks, see column_buffer.py)
+        self.time_stamp = ColumnBuffer(np.float64, name="time_stamp")
+        self.step = ColumnBuffer(np.int64, name="step")
+        self.frame_time = ColumnBuffer(np.float64, name="frame_time")
+        self.pose_time = ColumnBuffer(np.float64, name="pose_time")
+        self.original_pose = ColumnBuffer(name="original_pose") if save_original else None
 
         self._session_name = "test_session"
         self.filename = None
@@ -130,8 +129,31 @@ class BaseProcessorSocket(Processor):
         self._recording = Event()
         self._vid_recording = Event()
         self.curr_step = 0
+        self.last_frame_time = nan  # camera capture time of the last processed pose
         self.save_original = save_original
 
+        # Incremental HDF5 output of original poses (only with save_original)
+        self.stream_original = bool(stream_original)
+        self.stream_chunk_rows = DEFAULT_CHUNK_ROWS
+        self._pose_stream = None
+        self._streamed_rows = 0
+        self._streamed_file = None  # (path, rows) of the last finished stream
+        self._stream_lock = Lock()
+
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {WIRE_FORMATS}, got {wire_format!r}")
+        self.wire_format = wire_format
+        self.timing_info = bool(timing_info)
+
+        # Optional same-host transport, created on the first broadcast (payload shape known then)
+        self.shm_name = shm_name or None
+        self._shm_publisher = None
+
+        if server_backend not in SERVER_BACKENDS:
+            raise ValueError(f"server_backend must be one of {SERVER_BACKENDS}, got {server_backend!r}")
+        self.server_backend = server_backend
+        self._async_server = None
+
         # Networking (optional)
         self.address = bind
         self.authkey = authkey if authkey is not None else (b"secret password" if bind is not None else None)
@@ -144,6 +166,20 @@ class BaseProcessorSocket(Processor):
         self._stop = Event()
         self.conns = set()
 
+        # Outgoing payloads: serialized once in broadcast(), sent by one sender thread per
+        # client from a bounded drop-oldest queue, so a stalled client only delays itself.
+        # Command replies wait in a separate queue that the sender drains first.
+        self._client_queue_size = max(1, int(client_queue_size))
+        self._send_queues = {}
+        self._reply_queues = {}  # conn -> deque of replies (one per command the client sent)
+        self._send_cond = Condition()
+        self._sender_threads = {}  # conn -> Thread
+        self.dropped_payloads = {}  # conn -> payloads dropped because the client was too slow
+        self.client_stats = {}  # conn -> ClientStats (sent payloads, send lag)
+
+        # In-process subscribers to recording state changes (e.g. the GUI recorder)
+        self._recording_listeners = []
+
         if start_server and self.address is not None:
             self.start_server(self.address, self.authkey, timeout=self._socket_timeout)
 
@@ -168,6 +204,37 @@ class BaseProcessorSocket(Processor):
         self._session_name = name
         self.filename = f"{name}_dlc_processor_data.pkl"
 
+    # --------------------------------------------------------------------------------------
+    # RECORDING EVENTS
+    # --------------------------------------------------------------------------------------
+
+    def add_recording_listener(self, callback):
+        """
+        Subscribe to recording state changes.
+
+        ``callback(active: bool, step: int, session_name: str, frame_time: float)`` is invoked
+        synchronously from the thread that changed the state (usually a client receive thread)
+        as soon as recording starts or stops. ``step`` is the processor step counter (it
+        restarts when recording starts, so it is not a camera frame index); ``frame_time`` is
+        the camera capture time of the last processed pose (NaN before the first pose), the
+        same clock as the timestamps saved with recorded video frames.
+        """
+        if callback not in self._recording_listeners:
+            self._recording_listeners.append(callback)
+
+    def remove_recording_listener(self, callback):
+        try:
+            self._recording_listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _notify_recording_changed(self, active, step):
+        for callback in list(self._recording_listeners):
+            try:
+                callback(active, step, self.session_name, self.last_frame_time)
+            except Exception:
+                logger.exception("Recording listener failed")
+
     # --------------------------------------------------------------------------------------
     # SERVER CONTROL
     # --------------------------------------------------------------------------------------
@@ -176,7 +243,7 @@ class BaseProcessorSocket(Processor):
         Start the socket server if not already running.
         Safe to call multiple times.
         """
-        if self.listener is not None:
+        if self.listener is not None or self._async_server is not None:
             return
 
         if self._stop.is_set():
@@ -185,6 +252,23 @@ class BaseProcessorSocket(Processor):
         self.address = bind
         self.authkey = authkey
 
+        if self.server_backend == "asyncio":
+            server = AsyncProcessorServer(
+                bind,
+                authkey,
+                self._handle_client_message,
+                client_queue_size=self._client_queue_size,
+            )
+            server.start()
+            self._async_server = server
+            # Share the server's bookkeeping so status displays work unchanged
+            self.conns = server.clients
+            self.dropped_payloads = server.dropped_payloads
+            self.client_stats = {}
+            self.address = server.address
+            logger.info(f"Processor server (asyncio) started on {self.address[0]}:{self.address[1]}")
+            return
+
         self.listener = Listener(bind, authkey=authkey)
         try:
             # Underlying socket timeout
@@ -229,7 +313,9 @@ class BaseProcessorSocket(Processor):
             try:
                 if conn.poll(0.1):
                     msg = conn.recv()
-                    self._handle_client_message(msg)
+                    reply = self._handle_client_message(msg)
+                    if reply is not None:
+                        self._send_reply(conn, reply)
                     continue
 
                 if conn.closed:
@@ -252,6 +338,11 @@ class BaseProcessorSocket(Processor):
         except Exception:
             pass
         self.conns.discard(conn)
+        with self._send_cond:
+            self._send_queues.pop(conn, None)
+            self._reply_queues.pop(conn, None)
+            self.dropped_payloads.pop(conn, None)
+            self.client_stats.pop(conn, None)
 
     def _close_listener(self):
         """Close both outer and inner listener sockets."""
@@ -272,39 +363,56 @@ class BaseProcessorSocket(Processor):
     # --------------------------------------------------------------------------------------
 
     def _handle_client_message(self, msg):
+        """Handle one client command. A returned dict is sent back to that client only."""
         if not isinstance(msg, dict):
-            return
+            return None
 
         cmd = msg.get("cmd")
+        if cmd == "ping":
+            # Clock sync: the client compares its send/receive times with ours
+            # (see pose_protocol.sync_clock)
+            return {
+                "cmd": "pong",
+                "seq": msg.get("seq"),
+                "t_client": msg.get("t_client"),
+                "t_server": self.timing_func(),  # clock of payload timestamps
+                "t_wall": time.time(),  # clock of frame_time
+            }
+
         if cmd == "set_session_name":
             self.session_name = msg.get("session_name", "default_session")
 
         elif cmd == "start_recording":
-            self._recording.set()
-            self._vid_recording.set()
-            self._clear_data_queues()
-            self.curr_step = 0
-            logger.info("Recording started")
+            self.start_recording()
 
         elif cmd == "stop_recording":
-            self._recording.clear()
-            self._vid_recording.clear()
-            logger.info("Recording stopped")
+            self.stop_recording()
 
         elif cmd == "save":
             file = msg.get("filename", self.filename)
             self.save(file)
+        return None
 
     # Optional public helpers (nice for non-socket usage)
     def start_recording(self):
+        trigger_step = self.curr_step
+        self._finish_stream()
         self._recording.set()
         self._vid_recording.set()
         self._clear_data_queues()
+        self._start_stream()
         self.curr_step = 0
+        logger.info(f"Recording started at step {trigger_step} (frame time {self.last_frame_time})")
+        self._notify_recording_changed(True, trigger_step)
 
     def stop_recording(self):
+        was_recording = self.video_recording
         self._recording.clear()
         self._vid_recording.clear()
+        self._finish_stream()
+        logger.info(f"Recording stopped at step {self.curr_step} (frame time {self.last_frame_time})")
+        if was_recording:
+            self._notify_recording_changed(False, self.curr_step)
 
     # --------------------------------------------------------------------------------------
     # STOP / SHUTDOWN
@@ -318,19 +426,38 @@ class BaseProcessorSocket(Processor):
         logger.info("Stopping processor...")
         self._stop.set()
 
+        if self._async_server is not None:
+            self._async_server.stop()
+            self._async_server = None
+            self.conns = set()
+            self.dropped_payloads = {}
+            self.client_stats = {}
+
         # Wake accept() so the accept loop exits quickly (especially helpful on Windows)
         # This is safe even if no clients are connected.
         try:
-            if self.address is not None and self.authkey is not None:
+            if self.listener is not None and self.address is not None and self.authkey is not None:
                 c = Client(self.address, authkey=self.authkey)
                 c.close()
         except Exception:
             pass
 
+        with self._send_cond:
+            self._send_cond.notify_all()
+            senders = list(self._sender_threads.values())
+            self._sender_threads.clear()
+
         for conn in list(self.conns):
             self._close_conn(conn)
 
+        # A sender stuck on a client that stopped reading is a daemon thread; don't wait for it forever
+        deadline = time.monotonic() + 2.0
+        for t in senders:
+            t.join(timeout=max(0.0, deadline - time.monotonic()))
+
         self._close_listener()
+        self._close_shared()
+        self._finish_stream()
 
         # Join accept thread to avoid race conditions on restart
         if self._accept_thread is not None:
@@ -365,20 +492,169 @@ class BaseProcessorSocket(Processor):
     # BROADCAST
     # --------------------------------------------------------------------------------------
 
-    def broadcast(self, payload):
-        """Send payload to all connected clients. No-op if server isn't running."""
+    def broadcast(self, payload, *, frame_time=None, pose_time=None, predicted=False):
+        """
+        Queue payload for all connected clients. No-op if server isn't running.
+
+        ``payload`` is ``[timestamp, values...]``. The payload is encoded once here
+        (pickle, or a binary pose message tagged with the current step, ``frame_time``, ``pose_time``
+        and the ``predicted`` flag when ``wire_format="binary"``) and sent with ``send_bytes`` from a sender
+        thread per client (or the event loop with ``server_backend="asyncio"``; clients still use
+        ``Client.recv()``), so slow or dead clients never block the caller (the inference thread).
+        """
+        if self.shm_name is not None:
+            self._publish_shared(payload, frame_time=frame_time, pose_time=pose_time, predicted=predicted)
         if not self.conns:
             return
 
-        dead = []
-        for conn in list(self.conns):
+        data = self._encode_payload(payload, frame_time=frame_time, pose_time=pose_time, predicted=predicted)
+        if self._async_server is not None:
+            self._async_server.broadcast(data)
+            return
+        enqueued = time.perf_counter()
+        with self._send_cond:
+            for conn in list(self.conns):
+                q = self._send_queue_locked(conn)
+                if len(q) == q.maxlen:
+                    self.dropped_payloads[conn] = self.dropped_payloads.get(conn, 0) + 1
+                q.append((data, enqueued))
+            self._send_cond.notify_all()
+
+    def _send_queue_locked(self, conn):
+        q = self._send_queues.get(conn)
+        if q is None:
+            q = self._send_queues[conn] = deque(maxlen=self._client_queue_size)
+        self._ensure_sender_locked(conn)
+        return q
+
+    def _send_reply(self, conn, reply):
+        """Queue a reply for one client ahead of pending broadcasts (the sender thread owns the socket)."""
+        data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._send_cond:
+            if conn not in self.conns:
+                return
+            self._send_queue_locked(conn)
+            self._reply_queues.setdefault(conn, deque()).append(data)
+            self._send_cond.notify_all()
+
+    def get_client_stats(self):
+        """Per-client delivery stats: payloads sent and dropped, send lag (ms)."""
+        if self._async_server is not None:
+            entries = [(c.peer, c.stats, c.dropped) for c in list(self._async_server.clients)]
+        else:
+            with self._send_cond:
+                entries = [
+                    (id(conn), self.client_stats.get(conn, ClientStats()), self.dropped_payloads.get(conn, 0))
+                    for conn in list(self.conns)
+                ]
+        return [
+            {
+                "client": client,
+                "sent": stats.sent,
+                "dropped": dropped,
+                "send_lag_ms": stats.lag_avg_ms,
+                "send_lag_max_ms": stats.lag_max_ms,
+            }
+            for client, stats, dropped in entries
+        ]
+
+    @staticmethod
+    def _payload_values(payload):
+        timestamp, *values = payload
+        data = values[0] if len(values) == 1 and isinstance(values[0], np.ndarray) else values
+        return timestamp, data
+
+    def _publish_shared(self, payload, *, frame_time=None, pose_time=None, predicted=False):
+        timestamp, data = self._payload_values(payload)
+        data = np.asarray(data, dtype=np.float32)
+        try:
+            if self._shm_publisher is None:
+                self._shm_publisher = SharedPosePublisher(self.shm_name, data.shape)
+                logger.info(f"Publishing poses to shared memory '{self.shm_name}' (shape {data.shape})")
+            self._shm_publisher.publish(
+                data,
+                frame_id=self.curr_step,
+                timestamp=timestamp,
+                frame_time=frame_time,
+                pose_time=pose_time,
+                predicted=predicted,
+            )
+        except Exception as exc:
+            logger.error(f"Shared-memory publishing disabled: {exc}")
+            self._close_shared()
+            self.shm_name = None
+
+    def _close_shared(self):
+        if self._shm_publisher is not None:
             try:
-                conn.send(payload)
+                self._shm_publisher.close()
             except Exception:
-                dead.append(conn)
+                pass
+            self._shm_publisher = None
+
+    def _encode_payload(self, payload, *, frame_time=None, pose_time=None, predicted=False):
+        if self.wire_format == "binary":
+            timestamp, data = self._payload_values(payload)
+            return encode_pose_message(
+                data,
+                frame_id=self.curr_step,
+                timestamp=timestamp,
+                frame_time=frame_time,
+                pose_time=pose_time,
+                predicted=predicted,
+            )
+        if self.timing_info:
+            payload = [
+                *payload,
+                {"frame_id": self.curr_step, "frame_time": frame_time, "pose_time": pose_time, "predicted": predicted},
+            ]
+        return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
 
-        for conn in dead:
-            self._close_conn(conn)
+    def _ensure_sender_locked(self, conn):
+        # _send_cond must be held
+        t = self._sender_threads.get(conn)
+        if (t is not None and t.is_alive()) or self._stop.is_set():
+            return
+        t = self._sender_threads[conn] = Thread(
+            target=self._sender_loop, args=(conn,), name="ProcessorSender", daemon=True
+        )
+        t.start()
+
+    def _sender_loop(self, conn):
+        while not self._stop.is_set():
+            with self._send_cond:
+                q = self._send_queues.get(conn)
+                if q is None:
+                    break  # client closed
+                replies = self._reply_queues.get(conn)
+                if not q and not replies:
+                    self._send_cond.wait(timeout=0.1)
+                    continue
+                items = [(data, None) for data in replies or ()] + list(q)
+                if replies:
+                    replies.clear()
+                q.clear()
+
+            try:
+                for data, enqueued in items:
+                    conn.send_bytes(data)
+                    if enqueued is not None:
+                        self._record_sent(conn, enqueued)
+            except Exception:
+                self._close_conn(conn)
+                break
+        with self._send_cond:
+            if self._sender_threads.get(conn) is current_thread():
+                del self._sender_threads[conn]
+
+    def _record_sent(self, conn, enqueued):
+        stats = self.client_stats.get(conn)
+        if stats is None:
+            with self._send_cond:
+                if conn not in self.conns:
+                    return
+                stats = self.client_stats.setdefault(conn, ClientStats())
+        stats.record(time.perf_counter() - enqueued)
 
     # --------------------------------------------------------------------------------------
     # PROCESS
@@ -387,19 +663,26 @@ class BaseProcessorSocket(Processor):
     def process(self, pose, **kwargs):
         curr_time = self.timing_func()
 
-        self.curr_step += 1
-
-        if self.recording:
-            if self.save_original and self.original_pose is not None:
-                self.original_pose.append(pose.copy())
-            self.time_stamp.append(curr_time)
-            self.step.append(self.curr_step)
-            self.frame_time.append(kwargs.get("frame_time", -1))
-            if "pose_time" in kwargs:
-                self.pose_time.append(kwargs["pose_time"])
+        # Motion-model estimates (predicted=True) are broadcast, flagged, but neither counted nor recorded
+        predicted = bool(kwargs.get("predicted", False))
+        if not predicted:
+            self.curr_step += 1
+            self.last_frame_time = kwargs.get("frame_time", nan)
+
+            if self.recording:
+                if self.save_original and self.original_pose is not None:
+                    self.original_pose.append(pose)
+                self.time_stamp.append(curr_time)
+                self.step.append(self.curr_step)
+                self.frame_time.append(kwargs.get("frame_time", -1))
+                if "pose_time" in kwargs:
+                    self.pose_time.append(kwargs["pose_time"])
+                self._stream_rows()
 
         payload = [curr_time, pose]
-        self.broadcast(payload)
+        self.broadcast(
+            payload, frame_time=kwargs.get("frame_time"), pose_time=kwargs.get("pose_time"), predicted=predicted
+        )
         return pose
 
     # --------------------------------------------------------------------------------------
@@ -414,16 +697,91 @@ class BaseProcessorSocket(Processor):
         if self.save_original and self.original_pose is not None:
             self.original_pose.clear()
 
+    # --------------------------------------------------------------------------------------
+    # INCREMENTAL POSE OUTPUT
+    # --------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _data_path(file):
+        return Path(__file__).parent.parent.parent / "data" / file
+
+    @staticmethod
+    def _pose_file(path2save):
+        return path2save.parent / (path2save.stem + "_DLC.hdf5")
+
+    def _bodyparts(self):
+        if isinstance(self.dlc_cfg, dict):
+            return self.dlc_cfg.get("metadata", {}).get("bodyparts", [])
+        return None
+
+    def _start_stream(self):
+        if not (self.stream_original and self.save_original):
+            return
+        with self._stream_lock:
+            file = self.filename or f"{self.session_name}_dlc_processor_data.pkl"
+            self._pose_stream = PoseStreamWriter(self._pose_file(self._data_path(file)), self._bodyparts())
+            self._streamed_rows = 0
+            self._streamed_file = None
+
+    def _stream_rows(self, final=False):
+        """Hand rows recorded since the last call to the writer thread (every stream_chunk_rows)."""
+        with self._stream_lock:
+            stream = self._pose_stream
+            if stream is None or self.original_pose is None:
+                return
+            n = min(len(self.original_pose), len(self.frame_time), len(self.time_stamp))
+            start = self._streamed_rows
+            if n - start < (1 if final else self.stream_chunk_rows):
+                return
+            # Same columns as save_original_pose: frame_time and the processor time stamp
+            stream.submit(
+                self.original_pose.rows(start, n),
+                self.frame_time.rows(start, n),
+                self.time_stamp.rows(start, n),
+            )
+            self._streamed_rows = n
+
+    def _finish_stream(self):
+        self._stream_rows(final=True)
+        with self._stream_lock:
+            stream, self._pose_stream = self._pose_stream, None
+        if stream is None:
+            return
+        if stream.close(timeout=30.0) and stream.rows_written:
+            self._streamed_file = (stream.path, stream.rows_written)
+            logger.info(f"Streamed {stream.rows_written} poses to {stream.path}")
+        else:
+            self._streamed_file = None
+
+    def _use_streamed_file(self, target, n_rows):
+        """Move the finished stream to ``target`` if it holds exactly the recorded rows."""
+        if self._streamed_file is None:
+            return False
+        path, rows = self._streamed_file
+        if rows != n_rows or not path.exists():
+            return False
+        if path != target:
+            os.replace(path, target)
+            self._streamed_file = (target, rows)
+        return True
+
+    # --------------------------------------------------------------------------------------
+    # SAVE
+    # --------------------------------------------------------------------------------------
+
     def save(self, file=None):
         if not file:
             return 0
         try:
+            # Saving while recording ends the stream; anything not in it is written below
+            self._finish_stream()
             save_dict = self.get_data()
-            path2save = Path(__file__).parent.parent.parent / "data" / file
+            path2save = self._data_path(file)
             path2save.parent.mkdir(parents=True, exist_ok=True)
             if self.save_original:
                 original_pose = save_dict.pop("original_pose")
-                self.save_original_pose(original_pose, save_dict["frame_time"], save_dict["time_stamp"], path2save)
+                if not self._use_streamed_file(self._pose_file(path2save), len(original_pose)):
+                    self.save_original_pose(original_pose, save_dict["frame_time"], save_dict["time_stamp"], path2save)
             with open(path2save, "wb") as f:
                 pickle.dump(save_dict, f)
             logger.info(f"Saved data to {path2save}")
@@ -439,21 +797,12 @@ class BaseProcessorSocket(Processor):
         pose_times: np.ndarray,
         filepath2save: Path,
     ):
-        filepath2save = filepath2save.parent / (filepath2save.stem + "_DLC.hdf5")
-        if isinstance(self.dlc_cfg, dict):
-            bodyparts = self.dlc_cfg.get("metadata", {}).get("bodyparts", [])
-        else:
-            bodyparts = None
-        poses = np.array(original_pose)
-        poses = poses.reshape((poses.shape[0], poses.shape[1] * poses.shape[2]))
-        if bodyparts and len(bodyparts) * 3 == poses.shape[1]:
-            pdindex = pd.MultiIndex.from_product([bodyparts, ["x", "y", "likelihood"]], names=["bodyparts", "coords"])
-            pose_df = pd.DataFrame(poses, columns=pdindex)
-        else:
+        filepath2save = self._pose_file(filepath2save)
+        bodyparts = self._bodyparts()
+        poses = np.asarray(original_pose)
+        if not (bodyparts and poses.ndim == 3 and len(bodyparts) * 3 == poses.shape[1] * poses.shape[2]):
             logger.warning("Bodyparts information not found in dlc_cfg; saving without column labels.")
-            pose_df = pd.DataFrame(poses)
-        pose_df["frame_time"] = pose_frame_times
-        pose_df["pose_time"] = pose_times
+        pose_df = pose_dataframe(poses, pose_frame_times, pose_times, bodyparts)
 
         pose_df.to_hdf(filepath2save, key="df_with_missing", mode="w")
 
@@ -464,12 +813,12 @@ class BaseProcessorSocket(Processor):
     def get_data(self):
         save_dict = {
             "start_time": self.start_time,
-            "time_stamp": np.array(self.time_stamp),
-            "step": np.array(self.step),
-            "frame_time": np.array(self.frame_time),
-            "pose_time": np.array(self.pose_time) if self.pose_time else None,
+            "time_stamp": self.time_stamp.to_array(),
+            "step": self.step.to_array(),
+            "frame_time": self.frame_time.to_array(),
+            "pose_time": self.pose_time.to_array() if self.pose_time else None,
             "use_perf_counter": self.timing_func == time.perf_counter,
-            "original_pose": np.array(self.original_pose) if self.save_original else None,
+            "original_pose": self.original_pose.to_array() if self.save_original else None,
         }
         if self.dlc_cfg is not None:
             save_dict["dlc_cfg"] = self.dlc_cfg
@@ -522,6 +871,31 @@ class ExampleProcessorSocketCalculateMousePose(BaseProcessorSocket):  # pragma:
             "default": False,
             "description": "Save raw pose arrays for analysis",
         },
+        "wire_format": {
+            "type": "str",
+            "default": "pickle",
+            "description": "Broadcast encoding: 'pickle' or 'binary' (see pose_protocol.py)",
+        },
+        "shm_name": {
+            "type": "str",
+            "default": "",
+            "description": "Also publish to this shared-memory segment for same-host readers (empty = off)",
+        },
+        "server_backend": {
+            "type": "str",
+            "default": "threads",
+            "description": "Socket server implementation: 'threads' or 'asyncio' (single event-loop thread)",
+        },
+        "stream_original": {
+            "type": "bool",
+            "default": False,
+            "description": "Write raw poses to HDF5 in the background while recording (needs save_original)",
+        },
+        "timing_info": {
+            "type": "bool",
+            "default": False,
+            "description": "Append frame id, frame time and pose time to pickled payloads (for latency measurement)",
+        },
     }
 
     def __init__(
@@ -532,18 +906,28 @@ class ExampleProcessorSocketCalculateMousePose(BaseProcessorSocket):  # pragma:
         use_filter=False,
         filter_kwargs: dict | None = None,
         save_original=False,
+        wire_format="pickle",
+        shm_name="",
+        server_backend="threads",
+        stream_original=False,
+        timing_info=False,
     ):
         super().__init__(
             bind=bind,
             authkey=authkey,
             use_perf_counter=use_perf_counter,
             save_original=save_original,
+            wire_format=wire_format,
+            shm_name=shm_name,
+            server_backend=server_backend,
+            stream_original=stream_original,
+            timing_info=timing_info,
         )
 
-        self.center_x = deque()
-        self.center_y = deque()
-        self.heading_direction = deque()
-        self.head_angle = deque()
+        self.center_x = ColumnBuffer(np.float64, name="center_x")
+        self.center_y = ColumnBuffer(np.float64, name="center_y")
+        self.heading_direction = ColumnBuffer(np.float64, name="heading_direction")
+        self.head_angle = ColumnBuffer(np.float64, name="head_angle")
 
         self.use_filter = use_filter
         self.filter_kwargs = filter_kwargs if filter_kwargs is not None else {}
@@ -557,13 +941,9 @@ class ExampleProcessorSocketCalculateMousePose(BaseProcessorSocket):  # pragma:
         self.head_angle.clear()
 
     def _initialize_filters(self, vals):
-        t0 = self.timing_func()
-        self.filters = {
-            "center_x": OneEuroFilter(t0, vals[0], **self.filter_kwargs),
-            "center_y": OneEuroFilter(t0, vals[1], **self.filter_kwargs),
-            "heading": OneEuroFilter(t0, vals[2], **self.filter_kwargs),
-            "head_angle": OneEuroFilter(t0, vals[3], **self.filter_kwargs),
-        }
+        # One vectorized filter for [center_x, center_y, heading, head_angle]
+        self.filters = OneEuroFilterArray(**self.filter_kwargs)
+        self.filters(self.timing_func(), np.asarray(vals, dtype=np.float64))
         logger.debug(f"Initialized One-Euro filters with parameters: {self.filter_kwargs}")
 
     def process(self, pose, **kwargs):
@@ -605,42 +985,44 @@ class ExampleProcessorSocketCalculateMousePose(BaseProcessorSocket):  # pragma:
             if self.filters is None:
                 self._initialize_filters(vals)
 
-            vals = [
-                self.filters["center_x"](curr_time, vals[0]),
-                self.filters["center_y"](curr_time, vals[1]),
-                self.filters["heading"](curr_time, vals[2]),
-                self.filters["head_angle"](curr_time, vals[3]),
-            ]
+            vals = self.filters(curr_time, np.asarray(vals, dtype=np.float64)).tolist()
 
         # Wrap heading to [0, 360) after filtering
         vals[2] = vals[2] % 360
-        # Update step counter
-        self.curr_step = self.curr_step + 1
-
-        # Store processed data (only if recording)
-        if self.recording:
-            if self.save_original and self.original_pose is not None:
-                self.original_pose.append(pose.copy())
-            self.center_x.append(vals[0])
-            self.center_y.append(vals[1])
-            self.heading_direction.append(vals[2])
-            self.head_angle.append(vals[3])
-            self.time_stamp.append(curr_time)
-            self.step.append(self.curr_step)
-            self.frame_time.append(kwargs.get("frame_time", -1))
-            if "pose_time" in kwargs:
-                self.pose_time.append(kwargs["pose_time"])
+        # Motion-model estimates (predicted=True) are broadcast, flagged, but neither counted nor recorded
+        predicted = bool(kwargs.get("predicted", False))
+        if not predicted:
+            # Update step counter
+            self.curr_step = self.curr_step + 1
+            self.last_frame_time = kwargs.get("frame_time", nan)
+
+            # Store processed data (only if recording)
+            if self.recording:
+                if self.save_original and self.original_pose is not None:
+                    self.original_pose.append(pose)
+                self.center_x.append(vals[0])
+                self.center_y.append(vals[1])
+                self.heading_direction.append(vals[2])
+                self.head_angle.append(vals[3])
+                self.time_stamp.append(curr_time)
+                self.step.append(self.curr_step)
+                self.frame_time.append(kwargs.get("frame_time", -1))
+                if "pose_time" in kwargs:
+                    self.pose_time.append(kwargs["pose_time"])
+                self._stream_rows()
 
         payload = [curr_time, vals[0], vals[1], vals[2], vals[3]]
-        self.broadcast(payload)
+        self.broadcast(
+            payload, frame_time=kwargs.get("frame_time"), pose_time=kwargs.get("pose_time"), predicted=predicted
+        )
         return pose
 
     def get_data(self):
         save_dict = super().get_data()
-        save_dict["x_pos"] = np.array(self.center_x)
-        save_dict["y_pos"] = np.array(self.center_y)
-        save_dict["heading_direction"] = np.array(self.heading_direction)
-        save_dict["head_angle"] = np.array(self.head_angle)
+        save_dict["x_pos"] = self.center_x.to_array()
+        save_dict["y_pos"] = self.center_y.to_array()
+        save_dict["heading_direction"] = self.heading_direction.to_array()
+        save_dict["head_angle"] = self.head_angle.to_array()
         save_dict["use_filter"] = self.use_filter
         save_dict["filter_kwargs"] = self.filter_kwargs
         return save_dict
@@ -681,6 +1063,31 @@ class ExampleProcessorSocketFilterKeypoints(BaseProcessorSocket):  # pragma: no
             "default": True,
             "description": "Save raw pose arrays for analysis",
         },
+        "wire_format": {
+            "type": "str",
+            "default": "pickle",
+            "description": "Broadcast encoding: 'pickle' or 'binary' (see pose_protocol.py)",
+        },
+        "shm_name": {
+            "type": "str",
+            "default": "",
+            "description": "Also publish to this shared-memory segment for same-host readers (empty = off)",
+        },
+        "server_backend": {
+            "type": "str",
+            "default": "threads",
+            "description": "Socket server implementation: 'threads' or 'asyncio' (single event-loop thread)",
+        },
+        "stream_original": {
+            "type": "bool",
+            "default": False,
+            "description": "Write raw poses to HDF5 in the background while recording (needs save_original)",
+        },
+        "timing_info": {
+            "type": "bool",
+            "default": False,
+            "description": "Append frame id, frame time and pose time to pickled payloads (for latency measurement)",
+        },
     }
 
     def __init__(
@@ -692,18 +1099,28 @@ class ExampleProcessorSocketFilterKeypoints(BaseProcessorSocket):  # pragma: no
         filter_kwargs: dict | None = None,
         save_original=True,
         p_cutoff=0.4,
+        wire_format="pickle",
+        shm_name="",
+        server_backend="threads",
+        stream_original=False,
+        timing_info=False,
     ):
         super().__init__(
             bind=bind,
             authkey=authkey,
             use_perf_counter=use_perf_counter,
             save_original=save_original,
+            wire_format=wire_format,
+            shm_name=shm_name,
+            server_backend=server_backend,
+            stream_original=stream_original,
+            timing_info=timing_info,
         )
 
-        self.center_x = deque()
-        self.center_y = deque()
-        self.heading_direction = deque()
-        self.head_angle = deque()
+        self.center_x = ColumnBuffer(np.float64, name="center_x")
+        self.center_y = ColumnBuffer(np.float64, name="center_y")
+        self.heading_direction = ColumnBuffer(np.float64, name="heading_direction")
+        self.head_angle = ColumnBuffer(np.float64, name="head_angle")
 
         self.p_cutoff = p_cutoff
 
@@ -719,13 +1136,9 @@ class ExampleProcessorSocketFilterKeypoints(BaseProcessorSocket):  # pragma: no
         self.head_angle.clear()
 
     def _initialize_filters(self, vals):
-        t0 = self.timing_func()
-        self.filters = {
-            "center_x": OneEuroFilter(t0, vals[0], **self.filter_kwargs),
-            "center_y": OneEuroFilter(t0, vals[1], **self.filter_kwargs),
-            "heading": OneEuroFilter(t0, vals[2], **self.filter_kwargs),
-            "head_angle": OneEuroFilter(t0, vals[3], **self.filter_kwargs),
-        }
+        # One vectorized filter for [center_x, center_y, heading, head_angle]
+        self.filters = OneEuroFilterArray(**self.filter_kwargs)
+        self.filters(self.timing_func(), np.asarray(vals, dtype=np.float64))
         logger.debug(f"Initialized One-Euro filters with parameters: {self.filter_kwargs}")
 
     def process(self, pose, **kwargs):
@@ -772,42 +1185,44 @@ class ExampleProcessorSocketFilterKeypoints(BaseProcessorSocket):  # pragma: no
             if self.filters is None:
                 self._initialize_filters(vals)
 
-            vals = [
-                self.filters["center_x"](curr_time, vals[0]),
-                self.filters["center_y"](curr_time, vals[1]),
-                self.filters["heading"](curr_time, vals[2]),
-                self.filters["head_angle"](curr_time, vals[3]),
-            ]
+            vals = self.filters(curr_time, np.asarray(vals, dtype=np.float64)).tolist()
 
         # Wrap heading to [0, 360) after filtering
         vals[2] = vals[2] % 360
-        # Update step counter
-        self.curr_step = self.curr_step + 1
-
-        # Store processed data (only if recording)
-        if self.recording:
-            if self.save_original and self.original_pose is not None:
-                self.original_pose.append(pose.copy())
-            self.center_x.append(vals[0])
-            self.center_y.append(vals[1])
-            self.heading_direction.append(vals[2])
-            self.head_angle.append(vals[3])
-            self.time_stamp.append(curr_time)
-            self.step.append(self.curr_step)
-            self.frame_time.append(kwargs.get("frame_time", -1))
-            if "pose_time" in kwargs:
-                self.pose_time.append(kwargs["pose_time"])
+        # Motion-model estimates (predicted=True) are broadcast, flagged, but neither counted nor recorded
+        predicted = bool(kwargs.get("predicted", False))
+        if not predicted:
+            # Update step counter
+            self.curr_step = self.curr_step + 1
+            self.last_frame_time = kwargs.get("frame_time", nan)
+
+            # Store processed data (only if recording)
+            if self.recording:
+                if self.save_original and self.original_pose is not None:
+                    self.original_pose.append(pose)
+                self.center_x.append(vals[0])
+                self.center_y.append(vals[1])
+                self.heading_direction.append(vals[2])
+                self.head_angle.append(vals[3])
+                self.time_stamp.append(curr_time)
+                self.step.append(self.curr_step)
+                self.frame_time.append(kwargs.get("frame_time", -1))
+                if "pose_time" in kwargs:
+                    self.pose_time.append(kwargs["pose_time"])
+                self._stream_rows()
 
         payload = [curr_time, vals[0], vals[1], vals[2], vals[3]]
-        self.broadcast(payload)
+        self.broadcast(
+            payload, frame_time=kwargs.get("frame_time"), pose_time=kwargs.get("pose_time"), predicted=predicted
+        )
         return pose
 
     def get_data(self):
         save_dict = super().get_data()
-        save_dict["x_pos"] = np.array(self.center_x)
-        save_dict["y_pos"] = np.array(self.center_y)
-        save_dict["heading_direction"] = np.array(self.heading_direction)
-        save_dict["head_angle"] = np.array(self.head_angle)
+        save_dict["x_pos"] = self.center_x.to_array()
+        save_dict["y_pos"] = self.center_y.to_array()
+        save_dict["heading_direction"] = self.heading_direction.to_array()
+        save_dict["head_angle"] = self.head_angle.to_array()
         save_dict["use_filter"] = self.use_filter
         save_dict["filter_kwargs"] = self.filter_kwargs
         return save_dict
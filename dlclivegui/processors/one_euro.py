@@ -0,0 +1,133 @@
+"""One-Euro filters for smoothing pose-derived signals in processors.
+
+:class:`OneEuroFilter` filters one signal with a single update time; the
+vectorized :class:`OneEuroFilterArray` keeps independent state per array element,
+so a whole pose can be filtered in one call. Both are re-exported from
+``dlc_processor_socket``. This module only depends on NumPy and the standard
+library; importing it does not load pydantic, Qt, OpenCV or DLCLive (the
+``dlclivegui`` package imports those lazily).
+"""
+
+# dlclivegui/processors/one_euro.py
+from __future__ import annotations
+
+from math import pi
+
+import numpy as np
+
+
+class OneEuroFilter:  # pragma: no cover
+    def __init__(self, t0, x0, dx0=None, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.x_prev = x0
+        if dx0 is None:
+            dx0 = np.zeros_like(x0)
+        self.dx_prev = dx0
+        self.t_prev = t0
+
+    @staticmethod
+    def smoothing_factor(t_e, cutoff):
+        r = 2 * pi * cutoff * t_e
+        return r / (r + 1)
+
+    @staticmethod
+    def exponential_smoothing(alpha, x, x_prev):
+        return alpha * x + (1 - alpha) * x_prev
+
+    def __call__(self, t, x):
+        t_e = t - self.t_prev
+        if t_e <= 0:
+            return x
+        a_d = self.smoothing_factor(t_e, self.d_cutoff)
+        dx = (x - self.x_prev) / t_e
+        dx_hat = self.exponential_smoothing(a_d, dx, self.dx_prev)
+
+        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
+        a = self.smoothing_factor(t_e, cutoff)
+        x_hat = self.exponential_smoothing(a, x, self.x_prev)
+
+        self.x_prev = x_hat
+        self.dx_prev = dx_hat
+        self.t_prev = t
+
+        return x_hat
+
+
+class OneEuroFilterArray:
+    """
+    Vectorized One-Euro filter: an independent filter per element of a NumPy array.
+
+    One call filters a whole pose (e.g. ``(n_animals, n_keypoints, 2)`` coordinates) with
+    the same maths as :class:`OneEuroFilter`. Each element keeps its own state and last
+    update time, so keypoints that are missing (NaN) or below ``min_confidence`` hold
+    their last estimate and resume smoothly when they come back.
+
+    Example::
+
+        self.keypoint_filter = OneEuroFilterArray(min_cutoff=1.0, beta=0.02, min_confidence=0.6)
+        xy = self.keypoint_filter(curr_time, pose[..., :2], confidence=pose[..., 2])
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.0, d_cutoff=1.0, min_confidence=0.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.min_confidence = min_confidence
+        self.reset()
+
+    def reset(self):
+        self.x_prev = None  # NaN where an element has not been observed yet
+        self.dx_prev = None
+        self.t_prev = None
+
+    @staticmethod
+    def smoothing_factor(t_e, cutoff):
+        r = 2 * pi * cutoff * t_e
+        return r / (r + 1)
+
+    def __call__(self, t, x, confidence=None):
+        """
+        Filter ``x`` observed at time ``t``.
+
+        Args:
+            t: Timestamp in seconds.
+            x: Array of values; its shape fixes the filter state (a new shape resets it).
+            confidence: Optional array broadcastable to ``x`` after appending trailing axes
+                (e.g. ``(n_animals, n_keypoints)`` for ``x`` of shape ``(n_animals, n_keypoints, 2)``).
+        """
+        x = np.asarray(x, dtype=np.float64)
+        valid = np.isfinite(x)
+        if confidence is not None and self.min_confidence > 0:
+            conf = np.asarray(confidence, dtype=np.float64)
+            conf = conf.reshape(conf.shape + (1,) * (x.ndim - conf.ndim))
+            valid &= conf >= self.min_confidence
+
+        if self.x_prev is None or self.x_prev.shape != x.shape:
+            self.x_prev = np.where(valid, x, np.nan)
+            self.dx_prev = np.zeros_like(x)
+            self.t_prev = np.full(x.shape, float(t))
+            return x.copy()
+
+        seen = ~np.isnan(self.x_prev)
+        t_e = t - self.t_prev
+        update = valid & seen & (t_e > 0)
+        first = valid & ~seen
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a_d = self.smoothing_factor(t_e, self.d_cutoff)
+            dx = (x - self.x_prev) / t_e
+            dx_hat = a_d * dx + (1 - a_d) * self.dx_prev
+            cutoff = self.min_cutoff + self.beta * np.abs(dx_hat)
+            a = self.smoothing_factor(t_e, cutoff)
+            x_hat = a * x + (1 - a) * self.x_prev
+
+        self.x_prev = np.where(update, x_hat, np.where(first, x, self.x_prev))
+        self.dx_prev = np.where(update, dx_hat, self.dx_prev)
+        self.t_prev = np.where(update | first, t, self.t_prev)
+
+        # Gated elements hold their last estimate (raw value if never seen); like the scalar
+        # filter, valid elements with a non-increasing timestamp pass through unchanged
+        held = np.where(seen, self.x_prev, x)
+        return np.where(update | first, self.x_prev, np.where(valid, x, held))
@@ -0,0 +1,208 @@
+"""Compact binary wire format for streaming poses to (non-Python) clients.
+
+Each message is a fixed little-endian header followed by the raw array bytes::
+
+    offset  size  field
+    0       4     magic        b"DLCP"
+    4       1     version      (currently 1)
+    5       1     dtype code   (1 = float32, 2 = float64)
+    6       1     ndim         number of dimensions of the array
+    7       1     flags        bit 0 (FLAG_PREDICTED): motion-model estimate, not an inferred pose
+    8       8     frame_id     uint64, processor step
+    16      8     timestamp    float64, processor time when the message was built
+    24      8     frame_time   float64, camera capture time (NaN if unknown)
+    32      8     pose_time    float64, time the pose was produced (NaN if unknown)
+    40      4*n   shape        uint32 per dimension
+    ...           data         C-order array bytes
+
+A 30-keypoint ``(30, 3)`` float32 pose is 40 + 8 + 360 = 408 bytes and decodes with
+a single ``np.frombuffer``. Messages travel over the usual
+``multiprocessing.connection`` channel: the server sends them with ``send_bytes``
+and clients read them with ``recv_bytes``.
+
+Clock synchronization: clients send ``{"cmd": "ping", "seq": n, "t_client": t}`` and
+the processor answers (pickled) ``{"cmd": "pong", "seq", "t_client", "t_server", "t_wall"}``
+where ``t_server`` is the processor clock used for payload timestamps and ``t_wall``
+is ``time.time()``, the clock of camera ``frame_time`` values. :func:`sync_clock`
+runs a few rounds and keeps the one with the lowest round trip.
+
+This module only depends on NumPy and the standard library; the ``dlclivegui`` package
+imports its GUI and settings lazily, so clients can import it without pydantic, Qt,
+OpenCV or DLCLive installed.
+"""
+
+# dlclivegui/processors/pose_protocol.py
+from __future__ import annotations
+
+import math
+import pickle
+import struct
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+MAGIC = b"DLCP"
+VERSION = 1
+
+FLAG_PREDICTED = 0x01  # other flag bits are reserved and sent as 0
+
+_HEADER = struct.Struct("<4sBBBBQddd")
+HEADER_SIZE = _HEADER.size  # 40 bytes, shape follows
+
+_DTYPE_CODES = {np.dtype("<f4"): 1, np.dtype("<f8"): 2}
+_CODE_DTYPES = {code: dtype for dtype, code in _DTYPE_CODES.items()}
+
+
+class ProtocolError(ValueError):
+    """Raised when a message cannot be decoded."""
+
+
+@dataclass(slots=True)
+class PoseMessage:
+    """Decoded pose message."""
+
+    frame_id: int
+    timestamp: float
+    frame_time: float
+    pose_time: float
+    data: np.ndarray
+    predicted: bool = False  # extrapolated by the motion model for a frame without inference
+
+
+def encode_pose_message(
+    data,
+    *,
+    frame_id: int,
+    timestamp: float,
+    frame_time: float | None = None,
+    pose_time: float | None = None,
+    predicted: bool = False,
+    dtype=np.float32,
+) -> bytes:
+    """Encode ``data`` (pose array or vector of derived values) into one message."""
+    arr = np.ascontiguousarray(data, dtype=np.dtype(dtype).newbyteorder("<"))
+    code = _DTYPE_CODES.get(arr.dtype)
+    if code is None:
+        raise ProtocolError(f"Unsupported dtype for wire format: {arr.dtype}")
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        code,
+        arr.ndim,
+        FLAG_PREDICTED if predicted else 0,
+        int(frame_id),
+        float(timestamp),
+        math.nan if frame_time is None else float(frame_time),
+        math.nan if pose_time is None else float(pose_time),
+    )
+    shape = struct.pack(f"<{arr.ndim}I", *arr.shape)
+    return b"".join((header, shape, arr.tobytes()))
+
+
+def decode_pose_message(buf, *, copy: bool = False) -> PoseMessage:
+    """Decode a message produced by :func:`encode_pose_message`.
+
+    With ``copy=False`` the returned array is a read-only view on ``buf``.
+    """
+    view = memoryview(buf)
+    if len(view) < HEADER_SIZE:
+        raise ProtocolError(f"Message too short: {len(view)} bytes")
+    magic, version, code, ndim, flags, frame_id, timestamp, frame_time, pose_time = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ProtocolError(f"Bad magic {magic!r}")
+    if version != VERSION:
+        raise ProtocolError(f"Unsupported protocol version {version}")
+    dtype = _CODE_DTYPES.get(code)
+    if dtype is None:
+        raise ProtocolError(f"Unknown dtype code {code}")
+
+    shape_end = HEADER_SIZE + 4 * ndim
+    shape = struct.unpack_from(f"<{ndim}I", view, HEADER_SIZE)
+    count = math.prod(shape)
+    if len(view) != shape_end + count * dtype.itemsize:
+        raise ProtocolError(f"Payload size does not match shape {shape} ({len(view)} bytes)")
+
+    data = np.frombuffer(view, dtype=dtype, count=count, offset=shape_end).reshape(shape)
+    if copy:
+        data = data.copy()
+    return PoseMessage(
+        frame_id=frame_id,
+        timestamp=timestamp,
+        frame_time=frame_time,
+        pose_time=pose_time,
+        data=data,
+        predicted=bool(flags & FLAG_PREDICTED),
+    )
+
+
+def iter_pose_messages(address, authkey: bytes = b"secret password"):
+    """Reference client: connect to a processor using ``wire_format="binary"`` and yield messages.
+
+    Example::
+
+        for msg in iter_pose_messages(("127.0.0.1", 6000)):
+            print(msg.frame_id, msg.data)
+    """
+    from multiprocessing.connection import Client
+
+    conn = Client(address, authkey=authkey)
+    try:
+        while True:
+            try:
+                buf = conn.recv_bytes()
+            except EOFError:
+                return
+            yield decode_pose_message(buf)
+    finally:
+        conn.close()
+
+
+@dataclass(slots=True)
+class ClockSync:
+    """Offsets between the processor clocks and a client clock (server time = client time + offset)."""
+
+    offset: float  # processor timestamp clock (payload timestamps, pose_time)
+    wall_offset: float  # processor wall clock (camera frame_time)
+    rtt: float  # round trip of the best sample, bounds the offset error to +-rtt/2
+
+    def latency(self, frame_time: float, now: float) -> float:
+        """Camera-to-client latency of a message with ``frame_time``, received at client time ``now``."""
+        return now - (frame_time - self.wall_offset)
+
+
+def _wait_for_pong(conn, seq: int, timeout: float) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not conn.poll(remaining):
+            raise TimeoutError("No pong from processor")
+        buf = conn.recv_bytes()
+        if buf[:4] == MAGIC:
+            continue  # binary pose broadcast
+        msg = pickle.loads(buf)
+        if isinstance(msg, dict) and msg.get("cmd") == "pong" and msg.get("seq") == seq:
+            return msg
+
+
+def sync_clock(conn, samples: int = 8, *, clock=time.time, timeout: float = 2.0) -> ClockSync:
+    """Estimate processor clock offsets over ``conn`` (a ``multiprocessing`` Client).
+
+    Pose broadcasts received while syncing are discarded. ``clock`` is the client clock
+    the offsets refer to.
+    """
+    best = None
+    for seq in range(max(1, samples)):
+        t_send = clock()
+        conn.send({"cmd": "ping", "seq": seq, "t_client": t_send})
+        reply = _wait_for_pong(conn, seq, timeout)
+        t_recv = clock()
+        mid = (t_send + t_recv) / 2
+        sample = ClockSync(
+            offset=reply["t_server"] - mid,
+            wall_offset=reply["t_wall"] - mid,
+            rtt=t_recv - t_send,
+        )
+        if best is None or sample.rtt < best.rtt:
+            best = sample
+    return best
@@ -0,0 +1,99 @@
+"""Incremental HDF5 writer for recorded poses.
+
+:class:`PoseStreamWriter` appends blocks of pose rows to an appendable HDF5 table
+(``pandas.HDFStore``, table format) from a background thread while a recording is
+running. The resulting file has the same key (``df_with_missing``), columns and
+index as the one :meth:`BaseProcessorSocket.save_original_pose` writes in one go, and
+is readable with ``pd.read_hdf``. Rows that were flushed survive a crash, and saving
+at the end only has to write the last partial block.
+"""
+
+# dlclivegui/processors/pose_stream.py
+from __future__ import annotations
+
+import logging
+import queue
+from pathlib import Path
+from threading import Thread
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("dlc_processor_socket")
+
+HDF_KEY = "df_with_missing"
+DEFAULT_CHUNK_ROWS = 256
+
+
+def pose_dataframe(poses, frame_time, pose_time, bodyparts=None, start: int = 0) -> pd.DataFrame:
+    """Flatten ``poses`` (n, keypoints, 3) into the DLC-style table, index starting at ``start``."""
+    poses = np.asarray(poses)
+    poses = poses.reshape((poses.shape[0], poses.shape[1] * poses.shape[2]))
+    index = pd.RangeIndex(start, start + poses.shape[0])
+    if bodyparts and len(bodyparts) * 3 == poses.shape[1]:
+        columns = pd.MultiIndex.from_product([bodyparts, ["x", "y", "likelihood"]], names=["bodyparts", "coords"])
+        df = pd.DataFrame(poses, columns=columns, index=index)
+    else:
+        df = pd.DataFrame(poses, index=index)
+    df["frame_time"] = frame_time
+    df["pose_time"] = pose_time
+    return df
+
+
+class PoseStreamWriter:
+    """Append pose blocks to ``path`` on a background thread.
+
+    ``submit`` only queues references, so it is cheap enough to call from the
+    inference thread; the arrays must not be modified afterwards (``ColumnBuffer``
+    rows never are). The file is created on the first block.
+    """
+
+    def __init__(self, path, bodyparts=None):
+        self.path = Path(path)
+        self.bodyparts = list(bodyparts) if bodyparts else None
+        self.rows_written = 0
+        self.error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = Thread(target=self._run, name="PoseStreamWriter", daemon=True)
+        self._thread.start()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def submit(self, poses, frame_time, pose_time) -> None:
+        if self.error is None:
+            self._queue.put((poses, frame_time, pose_time))
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Write pending blocks and close the file. Returns False if writing failed."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                self.error = self.error or TimeoutError(f"Pose stream to {self.path} did not finish")
+        return self.error is None
+
+    def _run(self) -> None:
+        store = None
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                df = pose_dataframe(*item, bodyparts=self.bodyparts, start=self.rows_written)
+                if store is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    store = pd.HDFStore(self.path, mode="w")
+                store.append(HDF_KEY, df, index=False)
+                store.flush()
+                self.rows_written += len(df)
+        except Exception as exc:
+            self.error = exc
+            logger.error(f"Streaming poses to {self.path} failed: {exc}")
+        finally:
+            if store is not None:
+                try:
+                    store.close()
+                except Exception:
+                    pass
@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib.util
 import inspect
 import logging
+import os
+import pickle
 import pkgutil
 import sys
 from importlib import import_module
@@ -11,13 +13,123 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Discovery cache
+# ---------------------------------------------------------------------------
+# Scanning used to import every processor module (pulling in pandas, dlclive, ...)
+# on each refresh. The cache stores, per file path, the (mtime, size) it was scanned
+# at and the metadata of its processors (name, description, params, no class).
+# Cached entries carry "class": None; instantiate_from_scan() imports the module
+# the first time such a processor is actually created.
+
+DISCOVERY_CACHE_VERSION = 1
+DISCOVERY_CACHE_ENV = "DLCLIVEGUI_CACHE_DIR"
+_METADATA_KEYS = ("name", "description", "params")
+
+_discovery_cache: dict | None = None
+
+
+def discovery_cache_path() -> Path:
+    """Location of the discovery cache (``$DLCLIVEGUI_CACHE_DIR`` or the user cache directory)."""
+    override = os.environ.get(DISCOVERY_CACHE_ENV)
+    if override:
+        base = Path(override)
+    elif sys.platform.startswith("win"):
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")) / "DLCLiveGUI"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "dlclivegui"
+    return base / "processor_discovery.pkl"
+
+
+def _load_cache() -> dict:
+    global _discovery_cache
+    path = discovery_cache_path()
+    if _discovery_cache is None or _discovery_cache.get("path") != str(path):
+        entries = {}
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") == DISCOVERY_CACHE_VERSION:
+                entries = data["files"]
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            logger.debug(f"Ignoring unreadable processor discovery cache {path}: {exc}")
+        _discovery_cache = {"path": str(path), "files": entries, "dirty": False}
+    return _discovery_cache
+
+
+def _save_cache() -> None:
+    cache = _discovery_cache
+    if cache is None or not cache["dirty"]:
+        return
+    path = Path(cache["path"])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": DISCOVERY_CACHE_VERSION, "files": cache["files"]}, f)
+        os.replace(tmp, path)
+        cache["dirty"] = False
+    except Exception as exc:
+        logger.debug(f"Could not write processor discovery cache {path}: {exc}")
+
+
+def clear_discovery_cache() -> None:
+    """Forget cached metadata (in memory and on disk); the next scan imports every module."""
+    global _discovery_cache
+    _discovery_cache = None
+    try:
+        discovery_cache_path().unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.debug(f"Could not remove processor discovery cache: {exc}")
+
+
+def _file_signature(file_path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cached_processors(file_path) -> dict[str, dict] | None:
+    """Cached metadata for ``file_path`` if the file is unchanged, else None."""
+    signature = _file_signature(file_path)
+    entry = _load_cache()["files"].get(str(Path(file_path).resolve()))
+    if signature is None or entry is None or tuple(entry["signature"]) != signature:
+        return None
+    return {key: {**meta, "class": None} for key, meta in entry["processors"].items()}
+
+
+def _store_processors(file_path, processors: dict[str, dict]) -> None:
+    signature = _file_signature(file_path)
+    if signature is None:
+        return
+    metadata = {key: {k: info.get(k) for k in _METADATA_KEYS} for key, info in processors.items()}
+    try:
+        pickle.dumps(metadata)
+    except Exception:
+        return  # e.g. non-picklable param defaults: just don't cache this file
+    cache = _load_cache()
+    cache["files"][str(Path(file_path).resolve())] = {"signature": signature, "processors": metadata}
+    cache["dirty"] = True
+
 
 def default_processors_dir() -> str:
     with as_file(files("dlclivegui").joinpath("processors")) as path:
         return str(path)
 
 
-def scan_processor_folder(folder_path):
+def scan_processor_folder(folder_path, *, use_cache: bool = True):
+    """
+    Discover processors in ``*.py`` files of ``folder_path``.
+
+    With ``use_cache`` (default), files unchanged since they were last scanned are not
+    imported; their entries have ``"class": None`` until instantiated.
+    """
     all_processors = {}
     folder = Path(folder_path)
 
@@ -26,7 +138,10 @@ def scan_processor_folder(folder_path):
             continue
 
         try:
-            processors = load_processors_from_file(py_file)
+            processors = _cached_processors(py_file) if use_cache else None
+            if processors is None:
+                processors = load_processors_from_file(py_file, raise_errors=True)
+                _store_processors(py_file, processors)
             for class_or_id, processor_info in processors.items():
                 key = f"{py_file.name}::{class_or_id}"
                 processor_info["file"] = py_file.name
@@ -36,14 +151,18 @@ def scan_processor_folder(folder_path):
         except Exception:
             logger.exception(f"Error loading {py_file}")
 
+    _save_cache()
     return all_processors
 
 
-def scan_processor_package(package_name: str = "dlclivegui.processors") -> dict[str | dict]:
+def scan_processor_package(package_name: str = "dlclivegui.processors", *, use_cache: bool = True) -> dict[str | dict]:
     """
     Discover and load processor classes from a package namespace.
     Returns a dict keyed as 'module.py::ClassName' with the same
     structure you use today.
+
+    With ``use_cache`` (default), modules whose file is unchanged since the last scan
+    are not imported (see :func:`scan_processor_folder`).
     """
     all_processors: dict[str, dict] = {}
 
@@ -58,52 +177,80 @@ def scan_processor_package(package_name: str = "dlclivegui.processors") -> dict[
         if ispkg:
             continue
         try:
-            mod = import_module(mod_name)
-
-            # Prefer module-level registry function if present
-            if hasattr(mod, "get_available_processors"):
-                processors = mod.get_available_processors()
-            else:
-                # Fallback: scan for dlclive.Processor subclasses
-                from dlclive import Processor
-
-                processors = {}
-                for attr_name in dir(mod):
-                    obj = getattr(mod, attr_name)
-                    try:
-                        if isinstance(obj, type) and obj is not Processor and issubclass(obj, Processor):
-                            processors[attr_name] = {
-                                "class": obj,
-                                "name": getattr(obj, "PROCESSOR_NAME", attr_name),
-                                "description": getattr(obj, "PROCESSOR_DESCRIPTION", ""),
-                                "params": getattr(obj, "PROCESSOR_PARAMS", {}),
-                            }
-                    except Exception:
-                        # Non-class or weird metaclass; ignore
-                        pass
+            origin = _module_origin(mod_name)
+            processors = _cached_processors(origin) if (use_cache and origin) else None
+            if processors is None:
+                mod = import_module(mod_name)
+                processors = _processors_in_module(mod)
+                origin = mod.__file__ or ""
+                if origin:
+                    _store_processors(origin, processors)
 
             # Normalize into your “file::class” shape
-            module_file = mod.__name__.split(".")[-1] + ".py"
+            module_file = mod_name.split(".")[-1] + ".py"
             for class_name, info in processors.items():
                 key = f"{module_file}::{class_name}"
                 info = dict(info)  # copy
                 info["file"] = module_file
                 info["class_name"] = class_name
-                info["file_path"] = mod.__file__ or ""
+                info["file_path"] = origin or ""
+                info["module"] = mod_name
                 all_processors[key] = info
 
         except Exception:
             logger.exception(f"Error importing processor module '{mod_name}'")
 
+    _save_cache()
     return all_processors
 
 
-def load_processors_from_file(file_path: str | Path):
+def _module_origin(mod_name: str) -> str | None:
+    try:
+        spec = importlib.util.find_spec(mod_name)
+    except Exception:
+        return None
+    return spec.origin if spec is not None and spec.has_location else None
+
+
+def _processors_in_module(module) -> dict[str, dict]:
+    """Processors exposed by an imported module (registry function or dlclive.Processor subclasses)."""
+    # Preferred path: the module exposes get_available_processors()
+    if hasattr(module, "get_available_processors"):
+        processors = module.get_available_processors()
+        if not isinstance(processors, dict):
+            raise TypeError(f"{module.__name__}: get_available_processors() must return a dict, got {type(processors)}")
+        return processors
+
+    # Fallback path: discover subclasses of dlclive.Processor
+    from dlclive import Processor
+
+    processors: dict[str, dict] = {}
+    for name, obj in inspect.getmembers(module, inspect.isclass):
+        if obj is Processor:
+            continue
+        # Guard: module might define other classes; only include Processor subclasses
+        try:
+            if issubclass(obj, Processor):
+                processors[name] = {
+                    "class": obj,
+                    "name": getattr(obj, "PROCESSOR_NAME", name),
+                    "description": getattr(obj, "PROCESSOR_DESCRIPTION", ""),
+                    "params": getattr(obj, "PROCESSOR_PARAMS", {}),
+                }
+        except Exception:
+            # Some "classes" can fail issubclass checks; ignore safely
+            continue
+
+    return processors
+
+
+def load_processors_from_file(file_path: str | Path, *, raise_errors: bool = False):
     """
     Load all processor classes from a Python file.
 
     Returns:
         dict[str, dict]: { "ClassOrId": {...info...}, ... }
+        On import errors, logs and returns {} (or re-raises with ``raise_errors``).
     """
     file_path = str(file_path)
     stem = Path(file_path).stem
@@ -122,42 +269,28 @@ def load_processors_from_file(file_path: str | Path):
         module = importlib.util.module_from_spec(spec)
         sys.modules[module_name] = module  # Make visible during import for intra-module imports
         spec.loader.exec_module(module)
-
-        # Preferred path: the module exposes get_available_processors()
-        if hasattr(module, "get_available_processors"):
-            processors = module.get_available_processors()
-            if not isinstance(processors, dict):
-                raise TypeError(f"{file_path}: get_available_processors() must return a dict, got {type(processors)}")
-            return processors
-
-        # Fallback path: discover subclasses of dlclive.Processor
-        from dlclive import Processor
-
-        processors: dict[str, dict] = {}
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if obj is Processor:
-                continue
-            # Guard: module might define other classes; only include Processor subclasses
-            try:
-                if issubclass(obj, Processor):
-                    processors[name] = {
-                        "class": obj,
-                        "name": getattr(obj, "PROCESSOR_NAME", name),
-                        "description": getattr(obj, "PROCESSOR_DESCRIPTION", ""),
-                        "params": getattr(obj, "PROCESSOR_PARAMS", {}),
-                    }
-            except Exception:
-                # Some "classes" can fail issubclass checks; ignore safely
-                continue
-
-        return processors
+        return _processors_in_module(module)
 
     except Exception:
+        if raise_errors:
+            raise
         # Full traceback helps a ton when a plugin fails to import
         logger.exception(f"Error loading processors from {file_path}")
         return {}
 
 
+def _import_processor_class(processor_info: dict):
+    """Import the module behind a cached scan entry and return the processor class."""
+    class_name = processor_info["class_name"]
+    if processor_info.get("module"):
+        processors = _processors_in_module(import_module(processor_info["module"]))
+    else:
+        processors = load_processors_from_file(processor_info["file_path"], raise_errors=True)
+    if class_name not in processors:
+        raise ValueError(f"Processor '{class_name}' no longer exists in {processor_info.get('file_path')}")
+    return processors[class_name]["class"]
+
+
 def instantiate_from_scan(processors_dict, processor_key, **kwargs):
     """
     Instantiate a processor from scan_processor_folder results.
@@ -183,7 +316,11 @@ def instantiate_from_scan(processors_dict, processor_key, **kwargs):
         raise ValueError(f"Unknown processor '{processor_key}'. Available: {available}")
 
     processor_info = processors_dict[processor_key]
-    processor_class = processor_info["class"]
+    processor_class = processor_info.get("class")
+    if processor_class is None:
+        # Entry came from the discovery cache: import the module now
+        processor_class = _import_processor_class(processor_info)
+        processor_info["class"] = processor_class
     return processor_class(**kwargs)
 
 
@@ -0,0 +1,280 @@
+"""Shared-memory pose channel for consumers running on the same host.
+
+A publisher owns a ``multiprocessing.shared_memory`` segment holding a small
+header and a ring of fixed-size pose records. Each record is protected by a
+seqlock: the writer makes the sequence odd while it writes and even again when
+done, readers retry if the sequence changed or was odd while they copied. Readers
+never block the publisher and never touch a socket, so fetching the latest pose
+is a memory copy.
+
+Layout (little-endian)::
+
+    header (64 bytes)
+        magic u32 | version u32 | capacity u32 | ndim u32 | shape u32[4] | published u64 | padding
+    record i (capacity records)
+        seq u64 | frame_id u64 | timestamp f64 | frame_time f64 | pose_time f64 | flags u64
+        | data f32[prod(shape)]
+
+``flags`` uses the bits of :mod:`pose_protocol` (``FLAG_PREDICTED`` for motion-model estimates).
+
+``published`` is the number of records written so far; the newest record lives
+in slot ``(published - 1) % capacity``.
+
+This module only depends on NumPy and the standard library (the ``dlclivegui``
+package imports its GUI and settings lazily), so consumers can import it without
+pydantic, Qt, OpenCV or DLCLive installed.
+"""
+
+# dlclivegui/processors/shared_pose.py
+from __future__ import annotations
+
+import logging
+import math
+import struct
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from dlclivegui.processors.pose_protocol import FLAG_PREDICTED, PoseMessage
+
+logger = logging.getLogger(__name__)
+
+MAGIC = 0x444C4353  # "DLCS"
+VERSION = 2
+HEADER_SIZE = 64
+MAX_DIMS = 4
+DEFAULT_CAPACITY = 64
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "<u4"),
+        ("version", "<u4"),
+        ("capacity", "<u4"),
+        ("ndim", "<u4"),
+        ("shape", "<u4", (MAX_DIMS,)),
+        ("published", "<u8"),
+    ]
+)
+_META_DTYPE = np.dtype(
+    [
+        ("seq", "<u8"),
+        ("frame_id", "<u8"),
+        ("timestamp", "<f8"),
+        ("frame_time", "<f8"),
+        ("pose_time", "<f8"),
+        ("flags", "<u8"),
+    ]
+)
+# Hot-path accessors (struct on the raw buffer is much cheaper than NumPy scalar indexing)
+_SEQ = struct.Struct("<Q")
+_META = struct.Struct("<QQdddQ")
+_PUBLISHED_OFFSET = _HEADER_DTYPE.fields["published"][1]
+
+# Segments created by publishers in this process (their resource-tracker registration must be kept)
+_OWNED: set[str] = set()
+
+
+def _record_dtype(n_values: int) -> np.dtype:
+    return np.dtype(_META_DTYPE.descr + [("data", "<f4", (n_values,))])
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process' resource tracker unlink it on exit."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if name in _OWNED:
+        return shm
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    return shm
+
+
+class SharedPosePublisher:
+    """Write poses of a fixed shape into a shared-memory ring."""
+
+    def __init__(self, name: str, shape: tuple[int, ...], capacity: int = DEFAULT_CAPACITY):
+        shape = tuple(int(d) for d in shape)
+        if not 0 < len(shape) <= MAX_DIMS:
+            raise ValueError(f"Pose must have 1..{MAX_DIMS} dimensions, got shape {shape}")
+        self._shape = shape
+        self._capacity = max(1, int(capacity))
+        self._rec_dtype = _record_dtype(math.prod(shape))
+        size = HEADER_SIZE + self._capacity * self._rec_dtype.itemsize
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            logger.warning("Shared-memory segment %r already exists (stale publisher?); replacing it", name)
+            stale = _attach(name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _OWNED.add(name)
+
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf, offset=0)
+        self._records = np.ndarray((self._capacity,), dtype=self._rec_dtype, buffer=self._shm.buf, offset=HEADER_SIZE)
+        self._records["seq"] = 0
+        self._header["magic"] = MAGIC
+        self._header["version"] = VERSION
+        self._header["capacity"] = self._capacity
+        self._header["ndim"] = len(shape)
+        self._header["shape"] = list(shape) + [0] * (MAX_DIMS - len(shape))
+        self._header["published"] = 0
+        self._published = 0
+        self._buf = self._shm.buf
+        self._rec_size = self._rec_dtype.itemsize
+        self._data = self._records["data"]
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._shape
+
+    def publish(
+        self,
+        data,
+        *,
+        frame_id: int,
+        timestamp: float,
+        frame_time: float | None = None,
+        pose_time: float | None = None,
+        predicted: bool = False,
+    ) -> None:
+        arr = np.asarray(data, dtype=np.float32)
+        if arr.shape != self._shape:
+            raise ValueError(f"Pose shape {arr.shape} does not match channel shape {self._shape}")
+        slot = self._published % self._capacity
+        off = HEADER_SIZE + slot * self._rec_size
+        buf = self._buf
+        (seq,) = _SEQ.unpack_from(buf, off)
+        _SEQ.pack_into(buf, off, seq + 1)  # odd: write in progress
+        _META.pack_into(
+            buf,
+            off,
+            seq + 1,
+            int(frame_id),
+            float(timestamp),
+            math.nan if frame_time is None else float(frame_time),
+            math.nan if pose_time is None else float(pose_time),
+            FLAG_PREDICTED if predicted else 0,
+        )
+        self._data[slot] = arr.reshape(-1)
+        _SEQ.pack_into(buf, off, seq + 2)  # even: stable
+        self._published += 1
+        _SEQ.pack_into(buf, _PUBLISHED_OFFSET, self._published)
+
+    def close(self, unlink: bool = True) -> None:
+        shm = getattr(self, "_shm", None)
+        if shm is None:
+            return
+        self._header = self._records = self._data = self._buf = None
+        self._shm = None
+        shm.close()
+        if unlink:
+            _OWNED.discard(shm.name)
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SharedPoseReader:
+    """Read poses published by :class:`SharedPosePublisher` (typically in another process)."""
+
+    def __init__(self, name: str, *, max_retries: int = 100):
+        self._shm = _attach(name)
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf, offset=0)
+        if int(self._header["magic"]) != MAGIC:
+            self.close()
+            raise ValueError(f"Shared-memory segment {name!r} is not a pose channel")
+        if int(self._header["version"]) != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported pose channel version {int(self._header['version'])}")
+        ndim = int(self._header["ndim"])
+        self._shape = tuple(int(d) for d in self._header["shape"][:ndim])
+        self._capacity = int(self._header["capacity"])
+        rec_dtype = _record_dtype(math.prod(self._shape))
+        self._rec_size = rec_dtype.itemsize
+        self._n_values = math.prod(self._shape)
+        self._buf = self._shm.buf
+        self._max_retries = max(1, int(max_retries))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._shape
+
+    @property
+    def published(self) -> int:
+        """Number of poses published so far (use as a cursor for :meth:`read_since`)."""
+        return _SEQ.unpack_from(self._buf, _PUBLISHED_OFFSET)[0]
+
+    def latest(self) -> PoseMessage | None:
+        """Return a copy of the most recent pose, or None if nothing was published yet."""
+        published = self.published
+        if published == 0:
+            return None
+        return self._read_slot((published - 1) % self._capacity)
+
+    def read_since(self, cursor: int) -> tuple[list[PoseMessage], int]:
+        """Return poses published after ``cursor`` (oldest first) and the new cursor.
+
+        If the reader fell more than ``capacity`` poses behind, the oldest ones are lost.
+        """
+        published = self.published
+        start = max(cursor, published - self._capacity)
+        out = []
+        for i in range(start, published):
+            msg = self._read_slot(i % self._capacity)
+            if msg is not None and self.published - self._capacity <= i:  # skip slots reused while we read
+                out.append(msg)
+        return out, published
+
+    def read(self, index: int) -> PoseMessage | None:
+        """Return pose number ``index`` (0-based), or None if it is not published yet or was overwritten."""
+        published = self.published
+        if not published - self._capacity <= index < published:
+            return None
+        msg = self._read_slot(index % self._capacity)
+        if self.published - self._capacity > index:
+            return None  # the slot was reused while we read it
+        return msg
+
+    def _read_slot(self, slot: int) -> PoseMessage | None:
+        buf = self._buf
+        off = HEADER_SIZE + slot * self._rec_size
+        end = off + self._rec_size
+        for _ in range(self._max_retries):
+            (seq1,) = _SEQ.unpack_from(buf, off)
+            if seq1 & 1:
+                continue
+            raw = bytes(buf[off:end])  # copy the whole record, then validate
+            if _SEQ.unpack_from(buf, off)[0] == seq1:
+                _seq, frame_id, timestamp, frame_time, pose_time, flags = _META.unpack_from(raw)
+                data = np.frombuffer(raw, dtype="<f4", count=self._n_values, offset=_META.size)
+                return PoseMessage(
+                    frame_id=frame_id,
+                    timestamp=timestamp,
+                    frame_time=frame_time,
+                    pose_time=pose_time,
+                    data=data.reshape(self._shape),
+                    predicted=bool(flags & FLAG_PREDICTED),
+                )
+        logger.debug("Gave up reading pose slot %d after %d retries", slot, self._max_retries)
+        return None
+
+    def close(self) -> None:
+        shm = getattr(self, "_shm", None)
+        if shm is None:
+            return
+        self._header = self._buf = None
+        self._shm = None
+        shm.close()
@@ -4,24 +4,33 @@
 from __future__ import annotations
 
 import logging
+import math
 import queue
 import threading
 import time
 from collections import deque
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import count
 from typing import Any
 
+import cv2
 import numpy as np
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QMetaMethod, QObject, Signal
 
 from dlclivegui.config import DLCProcessorSettings, ModelType
 from dlclivegui.processors.processor_utils import instantiate_from_scan
+from dlclivegui.services.inference_process import RemoteDLCLive
+from dlclivegui.services.model_cache import ModelCache, ModelKey, close_runner
+from dlclivegui.services.pose_tracking import make_pose_predictor
+from dlclivegui.services.processor_host import ProcessorHost
+from dlclivegui.services.rate_control import InferenceRateController
 from dlclivegui.temp import Engine  # type: ignore # TODO use main package enum when released
 
 logger = logging.getLogger(__name__)
 STOP_WORKER_TIMEOUT = 10.0  # # seconds to wait in STOPPING state before scheduling background reaping
+PREPROCESS_BUFFERS = 3  # one in inference, one waiting, one being written
 
 try:  # pragma: no cover - optional dependency
     from dlclive import (
@@ -59,6 +68,7 @@ class PoseResult:
 class PoseSource:
     backend: PoseBackends  # e.g. "DLCLive"
     model_type: ModelType | None = None
+    model_id: str | None = None  # DLCProcessorSettings.model_id, tells apart models run on the same frames
 
 
 @dataclass(slots=True, frozen=True)
@@ -69,6 +79,45 @@ class PosePacket:
     individual_ids: list[str] | None = None
     source: PoseSource = PoseSource(backend=PoseBackends.DLC_LIVE)
     raw: Any | None = None
+    predicted: bool = False  # estimated by the motion model for a frame that was not inferred
+
+
+class LatestPoseSlot:
+    """
+    Newest :class:`PoseResult` of a processor, read without locks or Qt events.
+
+    The inference worker (and the camera thread, for motion-model predictions) publish
+    every pose here; readers such as the GUI display timer poll :meth:`read` at their
+    own rate and compare the sequence number with the last one they saw. The slot holds
+    a single ``(sequence, result)`` tuple that is replaced as a whole; rebinding an
+    attribute is atomic, so a reader always gets a consistent pair. Writers share a small
+    lock so that the newer-frame check and the store happen together.
+    """
+
+    __slots__ = ("_entry", "_lock", "_seq")
+
+    def __init__(self) -> None:
+        self._seq = count(1)
+        self._lock = threading.Lock()
+        self._entry: tuple[int, PoseResult | None] = (0, None)
+
+    def publish(self, result: PoseResult) -> bool:
+        """Store ``result`` unless the slot already holds a pose for a newer frame."""
+        with self._lock:
+            current = self._entry[1]
+            # With a motion model, an inferred pose can be published after a prediction for a newer frame
+            if current is not None and result.timestamp < current.timestamp:
+                return False
+            self._entry = (next(self._seq), result)
+            return True
+
+    def read(self) -> tuple[int, PoseResult | None]:
+        """``(sequence, result)``; the sequence changes whenever a pose is published or the slot is cleared."""
+        return self._entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = (next(self._seq), None)
 
 
 def validate_pose_array(
@@ -119,6 +168,83 @@ def validate_pose_array(
     return arr
 
 
+def mask_non_finite(pose: np.ndarray) -> tuple[np.ndarray, int]:
+    """Copy of ``pose`` with keypoints containing NaN/inf masked (x, y = NaN, likelihood = 0), and their count."""
+    bad = ~np.isfinite(pose).all(axis=-1)
+    out = pose.astype(np.float64, copy=True)
+    out[bad, :2] = np.nan
+    out[bad, 2] = 0.0
+    return out, int(bad.sum())
+
+
+class PoseValidator:
+    """
+    Per-frame pose validation with a fast path.
+
+    The first pose, and any pose whose shape or dtype differs from the previous one (e.g.
+    another number of detected animals), gets the full :func:`validate_pose_array` check.
+    Other poses are only compared with that shape and dtype. Non-finite values do not
+    reject the frame: they are detected with a single reduction and the affected
+    keypoints are masked (see :func:`mask_non_finite`) and counted in :attr:`masked_keypoints`.
+    """
+
+    def __init__(self, source_backend: PoseBackends | str = PoseBackends.DLC_LIVE):
+        self.source_backend = source_backend
+        self.reset()
+
+    def reset(self) -> None:
+        self._shape: tuple[int, ...] | None = None
+        self._dtype: np.dtype | None = None
+        self.full_checks = 0
+        self.masked_keypoints = 0
+
+    def __call__(self, pose: Any) -> np.ndarray:
+        arr = pose if isinstance(pose, np.ndarray) else np.asarray(pose)
+        if arr.shape != self._shape or arr.dtype != self._dtype:
+            arr = validate_pose_array(arr, source_backend=self.source_backend, check_finite=False)
+            self._shape, self._dtype = arr.shape, arr.dtype
+            self.full_checks += 1
+        # Integers are always finite; for floats, NaN/inf anywhere makes the sum non-finite
+        if arr.dtype.kind in "fc" and not math.isfinite(arr.sum()):
+            arr, masked = mask_non_finite(arr)
+            self.masked_keypoints += masked
+        return arr
+
+
+def to_frame_coords(pose: Any, scale: tuple[float, float] | None = None, offset=None) -> np.ndarray:
+    """
+    Map keypoints from model-input coordinates (ROI crop, then resize) to full-frame coordinates.
+
+    Returns a copy of ``pose`` (..., 3) with ``x * sx + ox`` and ``y * sy + oy``; likelihoods are unchanged.
+    """
+    sx, sy = scale if scale is not None else (1.0, 1.0)
+    ox, oy = offset if offset is not None else (0, 0)
+    arr = np.array(pose, dtype=float, copy=True)
+    arr[..., 0] = arr[..., 0] * sx + ox
+    arr[..., 1] = arr[..., 1] * sy + oy
+    return arr
+
+
+def to_model_coords(pose: Any, scale: tuple[float, float] | None = None, offset=None) -> np.ndarray:
+    """Inverse of :func:`to_frame_coords`."""
+    sx, sy = scale if scale is not None else (1.0, 1.0)
+    ox, oy = offset if offset is not None else (0, 0)
+    arr = np.array(pose, dtype=float, copy=True)
+    arr[..., 0] = (arr[..., 0] - ox) / sx
+    arr[..., 1] = (arr[..., 1] - oy) / sy
+    return arr
+
+
+def roi_bounds(roi, margin: int, width: int, height: int) -> tuple[int, int, int, int] | None:
+    """Clip ``roi`` (x0, y0, x1, y1) grown by ``margin`` to a width x height frame; None if nothing is left."""
+    x0, y0, x1, y1 = roi
+    x0, y0 = max(0, int(x0) - margin), max(0, int(y0) - margin)
+    x1, y1 = min(width, int(x1) + margin), min(height, int(y1) + margin)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1, y1
+
+
 @dataclass
 class ProcessorStats:
     """Statistics for DLC processor performance."""
@@ -135,25 +261,80 @@ class ProcessorStats:
     avg_inference_time: float = 0.0
     avg_signal_emit_time: float = 0.0
     avg_total_process_time: float = 0.0
+    avg_preprocess_time: float = 0.0  # Pipelined resize on the preprocess thread
     # Separated timing for GPU vs socket processor
     avg_gpu_inference_time: float = 0.0  # Pure model inference
     avg_processor_overhead: float = 0.0  # Socket processor overhead
+    avg_ipc_overhead: float = 0.0  # inference_mode="process": frame/pose transfer, excluded from GPU time
+    # Out-of-process processor (processor_mode="process"); overhead above is then the hand-over only
+    processor_host_active: bool = False
+    processor_host_pending: int = 0
+    processor_host_dropped: int = 0
+    avg_processor_host_time: float = 0.0  # time spent in process() in the host process
+    # Rate control (target_fps / target_latency_ms)
+    rate_control_active: bool = False
+    frames_skipped: int = 0  # not submitted because of target_fps
+    frames_replaced: int = 0  # waiting frames replaced by a fresher one (also counted in frames_dropped)
+    current_resize: float = 0.0
+    resize_changes: int = 0
+    last_rate_decision: str = ""
+    # Model warm-start cache (model_cache_size)
+    last_init_time: float = 0.0  # model construction + init_inference of the current session
+    last_init_cached: bool = False  # the current session reused a cached runner
+    cached_models: int = 0  # idle runners kept for the next session
+    model_cache_bytes: int = 0  # estimated memory of the idle runners (weights size)
+    frames_predicted: int = 0  # poses estimated by the motion model between inferences
+    keypoints_masked: int = 0  # non-finite keypoints masked by pose validation
+
+
+def create_processor(scanned_processors: dict, processor_key, settings: DLCProcessorSettings, **kwargs):
+    """Instantiate a scanned processor inline, or start it in a host process (``processor_mode="process"``)."""
+    if settings.processor_mode == "process":
+        return ProcessorHost.from_scan(
+            scanned_processors,
+            processor_key,
+            kwargs=kwargs,
+            queue_size=settings.processor_queue_size,
+            blocking=settings.processor_blocking,
+        )
+    return instantiate_from_scan(scanned_processors, processor_key, **kwargs)
 
 
 class DLCLiveProcessor(QObject):
-    """Background pose estimation using DLCLive with queue-based threading."""
+    """Background pose estimation using DLCLive with queue-based threading.
+
+    Every pose is published to :attr:`latest_pose`, which the GUI polls at its display
+    rate. ``pose_ready`` is only emitted while something is connected to it, so that
+    hundreds of poses per second do not flood the receiver's event queue; the other
+    signals report state changes.
+    """
 
     pose_ready = Signal(object)
     error = Signal(str)
     initialized = Signal(bool)
-    frame_processed = Signal()
+    # Emitted (from the processor's thread, delivered queued) when a socket processor
+    # starts/stops recording: (active, processor step, session name, camera frame time or NaN)
+    processor_recording_changed = Signal(bool, int, str, float)
+    # Background model preload finished: (success, model path or error message)
+    preloaded = Signal(bool, str)
 
     def __init__(self) -> None:
         super().__init__()
         # DLCLive instance and config
         self._settings = DLCProcessorSettings()
         self._dlc: Any | None = None
+        self._dlc_key: ModelKey | None = None
+        self._model_cache = ModelCache(self._settings.model_cache_size)
+        self._last_init_time = 0.0
+        self._last_init_cached = False
+        self._preload_thread: threading.Thread | None = None
+        self._preload_key: ModelKey | None = None
+        self._preload_generation = 0  # bumped by shutdown() so late preloads are discarded
+        # Shared with other processors on the same frames to limit concurrent inferences (see multi_model.py)
+        self._inference_gate: threading.Semaphore | None = None
         self._processor: Any | None = None
+        self._latest_pose = LatestPoseSlot()
+        self._pose_ready_method = QMetaMethod.fromSignal(self.pose_ready)
         # Worker thread and queue
         self._queue: queue.Queue[Any] | None = None
         self._worker_thread: threading.Thread | None = None
@@ -180,6 +361,24 @@ class DLCLiveProcessor(QObject):
         self._total_process_times: deque[float] = deque(maxlen=60)
         self._gpu_inference_times: deque[float] = deque(maxlen=60)
         self._processor_overhead_times: deque[float] = deque(maxlen=60)
+        self._preprocess_times: deque[float] = deque(maxlen=60)
+        self._ipc_times: deque[float] = deque(maxlen=60)
+
+        self._frames_replaced = 0
+        self._rate: InferenceRateController | None = None
+
+        # Motion model predicting poses for camera frames between inferences (see pose_tracking.py)
+        self._motion: Any | None = None
+        self._motion_lock = threading.Lock()
+        self._frames_predicted = 0
+        self._validator = PoseValidator()
+        # Serializes processor calls from the worker and predictions fed from the camera thread
+        self._processor_call_lock = threading.Lock()
+
+        # Pipelined preprocessing (see _preprocess_loop)
+        self._preprocess_thread: threading.Thread | None = None
+        self._prep_buffers: list[np.ndarray | None] = [None] * PREPROCESS_BUFFERS
+        self._prep_index = 0
 
     @staticmethod
     def get_model_backend(model_path: str) -> Engine:
@@ -190,7 +389,21 @@ class DLCLiveProcessor(QObject):
             if self._state != WorkerState.STOPPED:
                 raise RuntimeError("Cannot configure DLCLiveProcessor while it is running. Please stop it first.")
             self._settings = settings
+            self._model_cache.capacity = settings.model_cache_size
+            old = self._processor
+            if old is not None and old is not processor and hasattr(old, "remove_recording_listener"):
+                old.remove_recording_listener(self._on_processor_recording_changed)
+            if isinstance(old, ProcessorHost) and old is not processor:
+                old.close()
             self._processor = processor
+            if processor is not None and hasattr(processor, "add_recording_listener"):
+                processor.add_recording_listener(self._on_processor_recording_changed)
+
+    def _on_processor_recording_changed(
+        self, active: bool, step: int, session_name: str, frame_time: float | None = None
+    ) -> None:
+        frame_time = math.nan if frame_time is None else float(frame_time)
+        self.processor_recording_changed.emit(bool(active), int(step), str(session_name), frame_time)
 
     def reset(self) -> None:
         """Stop the worker thread and drop the current DLCLive instance."""
@@ -202,12 +415,15 @@ class DLCLiveProcessor(QObject):
                 "Reset requested but worker thread is still alive; skipping DLCLive reset to avoid potential issues."
             )
             return
-        self._dlc = None
+        self._release_dlc()
         self._initialized = False
+        self._latest_pose.clear()
         with self._stats_lock:
             self._frames_enqueued = 0
             self._frames_processed = 0
             self._frames_dropped = 0
+            self._frames_replaced = 0
+            self._frames_predicted = 0
             self._latencies.clear()
             self._processing_times.clear()
             self._queue_wait_times.clear()
@@ -216,6 +432,8 @@ class DLCLiveProcessor(QObject):
             self._total_process_times.clear()
             self._gpu_inference_times.clear()
             self._processor_overhead_times.clear()
+            self._preprocess_times.clear()
+            self._ipc_times.clear()
 
     def shutdown(self) -> None:
         stopped = self._stop_worker()
@@ -226,8 +444,51 @@ class DLCLiveProcessor(QObject):
                 "Shutdown requested but worker thread is still alive; DLCLive instance may not be fully released."
             )
             return
-        self._dlc = None
+        self._release_dlc(cache=False)
+        self._preload_generation += 1
+        self._model_cache.clear()
         self._initialized = False
+        if isinstance(self._processor, ProcessorHost):
+            self._processor.close()
+
+    @property
+    def settings(self) -> DLCProcessorSettings:
+        return self._settings
+
+    def set_inference_gate(self, gate: threading.Semaphore | None) -> None:
+        """Hold ``gate`` around every inference (None: no limit)."""
+        self._inference_gate = gate
+
+    @property
+    def latest_pose(self) -> LatestPoseSlot:
+        """Slot holding the newest pose (poll it instead of connecting to ``pose_ready`` per pose)."""
+        return self._latest_pose
+
+    def _publish_pose(self, result: PoseResult) -> None:
+        self._latest_pose.publish(result)
+        # Queued signal delivery costs an event per pose; skip it when nobody listens
+        if self.isSignalConnected(self._pose_ready_method):
+            self.pose_ready.emit(result)
+
+    @property
+    def model_cache(self) -> ModelCache:
+        return self._model_cache
+
+    def evict_cached_models(self, model_path: str | None = None) -> int:
+        """Free idle cached models (of ``model_path`` only, if given); return how many were evicted."""
+        return self._model_cache.evict(model_path)
+
+    def _release_dlc(self, cache: bool = True) -> None:
+        """Drop the current runner, parking it in the model cache for the next session if possible."""
+        dlc, self._dlc = self._dlc, None
+        key, self._dlc_key = self._dlc_key, None
+        if dlc is None:
+            return
+        healthy = not isinstance(dlc, RemoteDLCLive) or dlc.alive
+        if cache and key is not None and healthy:
+            self._model_cache.put(key, dlc)
+        elif isinstance(dlc, RemoteDLCLive):
+            dlc.close()
 
     def enqueue_frame(self, frame: np.ndarray, timestamp: float) -> None:
         # Keep lifecycle lock held only for quick state checks and snapshots.
@@ -236,9 +497,17 @@ class DLCLiveProcessor(QObject):
                 return
             t = self._worker_thread
             q = self._queue
+            rate = self._rate
+            motion = self._motion
             should_start = t is None or not t.is_alive()
 
-        frame_c = frame.copy()
+        if motion is not None and not should_start:
+            self._emit_prediction(motion, timestamp)
+
+        if not should_start and rate is not None and not rate.should_submit(time.perf_counter()):
+            return  # skipped before paying for the copy
+
+        frame_c, offset = self._crop_to_roi(frame)
         enq_time = time.perf_counter()
 
         if should_start:
@@ -250,7 +519,7 @@ class DLCLiveProcessor(QObject):
                 t = self._worker_thread
                 if t is None or not t.is_alive():
                     # _start_worker_locked expects the lifecycle lock to be held.
-                    self._start_worker_locked(frame_c, timestamp)
+                    self._start_worker_locked(frame_c, timestamp, offset)
                     return
                 # Worker is now running; refresh queue snapshot.
                 q = self._queue
@@ -258,17 +527,87 @@ class DLCLiveProcessor(QObject):
         if q is None:
             return
 
+        item = (frame_c, timestamp, enq_time, offset)
         try:
-            q.put_nowait((frame_c, timestamp, enq_time))
+            q.put_nowait(item)
             with self._stats_lock:
                 self._frames_enqueued += 1
         except queue.Full:
+            replaced = rate is not None and rate.keep_latest and self._replace_queued(q, item)
             with self._stats_lock:
                 self._frames_dropped += 1
+                if replaced:
+                    self._frames_enqueued += 1
+                    self._frames_replaced += 1
+
+    def _emit_prediction(self, motion, timestamp: float) -> None:
+        """Emit the motion-model estimate for a camera frame newer than the last inferred pose."""
+        with self._motion_lock:
+            if motion.last_update is None or timestamp <= motion.last_update:
+                return
+            pose = motion.predict(timestamp)
+        if pose is None:
+            return
+        if self._settings.predictions_to_processor and self._processor is not None:
+            # Predictions are already in frame coordinates: bypass the worker's timing/mapping wrapper,
+            # which also takes the call lock
+            process = self._processor.process
+            process = getattr(process, "__wrapped__", process)
+            # Never wait for the processor on the camera thread: skip the estimate if it is busy
+            if self._processor_call_lock.acquire(blocking=False):
+                try:
+                    process(pose, frame_time=timestamp, predicted=True)
+                except Exception as exc:
+                    logger.debug("Processor failed on a predicted pose: %s", exc)
+                finally:
+                    self._processor_call_lock.release()
+        packet = PosePacket(
+            keypoints=pose,
+            source=PoseSource(
+                backend=PoseBackends.DLC_LIVE, model_type=self._settings.model_type, model_id=self._settings.model_id
+            ),
+            predicted=True,
+        )
+        self._publish_pose(PoseResult(pose=pose, timestamp=timestamp, packet=packet))
+        with self._stats_lock:
+            self._frames_predicted += 1
+
+    @staticmethod
+    def _replace_queued(q: queue.Queue, item) -> bool:
+        """Swap the frame waiting in ``q`` for ``item`` (the freshest frame wins)."""
+        try:
+            q.get_nowait()
+            q.task_done()
+        except queue.Empty:
+            pass  # the worker took it meanwhile
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            return False
+        return True
 
     def get_stats(self) -> ProcessorStats:
         """Get current processing statistics."""
         queue_size = self._queue.qsize() if self._queue is not None else 0
+        rate_fields = {}
+        rate = self._rate
+        if rate is not None:
+            rate_fields = {
+                "rate_control_active": True,
+                "frames_skipped": rate.skipped,
+                "current_resize": rate.resize,
+                "resize_changes": rate.resize_changes,
+                "last_rate_decision": rate.last_decision,
+            }
+        host_fields = {}
+        if isinstance(self._processor, ProcessorHost):
+            host = self._processor.host_stats()
+            host_fields = {
+                "processor_host_active": True,
+                "processor_host_pending": host.pending,
+                "processor_host_dropped": host.dropped,
+                "avg_processor_host_time": host.avg_process_time,
+            }
 
         with self._stats_lock:
             avg_latency = sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
@@ -300,6 +639,10 @@ class DLCLiveProcessor(QObject):
                 if self._processor_overhead_times
                 else 0.0
             )
+            avg_preprocess = (
+                sum(self._preprocess_times) / len(self._preprocess_times) if self._preprocess_times else 0.0
+            )
+            avg_ipc = sum(self._ipc_times) / len(self._ipc_times) if self._ipc_times else 0.0
 
             return ProcessorStats(
                 frames_enqueued=self._frames_enqueued,
@@ -313,28 +656,57 @@ class DLCLiveProcessor(QObject):
                 avg_inference_time=avg_inference,
                 avg_signal_emit_time=avg_signal_emit,
                 avg_total_process_time=avg_total,
+                avg_preprocess_time=avg_preprocess,
                 avg_gpu_inference_time=avg_gpu,
                 avg_processor_overhead=avg_proc_overhead,
+                avg_ipc_overhead=avg_ipc,
+                frames_replaced=self._frames_replaced,
+                frames_predicted=self._frames_predicted,
+                keypoints_masked=self._validator.masked_keypoints,
+                last_init_time=self._last_init_time,
+                last_init_cached=self._last_init_cached,
+                cached_models=len(self._model_cache),
+                model_cache_bytes=self._model_cache.memory_bytes(),
+                **host_fields,
+                **rate_fields,
             )
 
-    def _start_worker_locked(self, init_frame: np.ndarray, init_timestamp: float) -> None:
+    def _start_worker_locked(self, init_frame: np.ndarray, init_timestamp: float, init_offset=None) -> None:
         # lifecycle_lock must already be held
         if self._worker_thread is not None and self._worker_thread.is_alive():
             return
         self._queue = queue.Queue(maxsize=1)
+        self._rate = self._make_rate_controller()
+        self._validator = PoseValidator()  # the model may differ: validate its first pose in full
+        s = self._settings
+        self._motion = make_pose_predictor(
+            s.motion_model, min_confidence=s.motion_min_confidence, max_horizon=s.motion_max_horizon_ms / 1000.0
+        )
         self._stop_event.clear()
         self._state = WorkerState.STARTING
         self._worker_thread = threading.Thread(
             target=self._worker_loop,
-            args=(init_frame, init_timestamp),
+            args=(init_frame, init_timestamp, init_offset),
             name="DLCLiveWorker",
             daemon=True,
         )
         self._worker_thread.start()
 
-    def _start_worker(self, init_frame: np.ndarray, init_timestamp: float) -> None:
+    def _make_rate_controller(self) -> InferenceRateController | None:
+        s = self._settings
+        if not s.target_fps and not s.target_latency_ms:
+            return None
+        return InferenceRateController(
+            target_fps=s.target_fps,
+            target_latency=s.target_latency_ms / 1000.0 if s.target_latency_ms else None,
+            adapt_resize=s.adaptive_resize,
+            resize=s.resize,
+            min_resize=s.min_resize,
+        )
+
+    def _start_worker(self, init_frame: np.ndarray, init_timestamp: float, init_offset=None) -> None:
         with self._lifecycle_lock:
-            self._start_worker_locked(init_frame, init_timestamp)
+            self._start_worker_locked(init_frame, init_timestamp, init_offset)
 
     def _stop_worker(self) -> bool:
         with self._lifecycle_lock:
@@ -380,7 +752,7 @@ class DLCLiveProcessor(QObject):
                         self._stop_event.clear()
 
                         if self._pending_reset:
-                            self._dlc = None
+                            self._release_dlc(cache=False)  # the worker hung: do not reuse its runner
                             self._initialized = False
                             self._pending_reset = False
 
@@ -395,12 +767,16 @@ class DLCLiveProcessor(QObject):
         threading.Thread(target=reap, name="DLCLiveReaper", daemon=True).start()
 
     @contextmanager
-    def _timed_processor(self):
+    def _timed_processor(self, scale: tuple[float, float] | None = None, offset=None):
         """
         If a socket processor is attached, temporarily wrap its .process()
         to measure processor overhead time independently of GPU inference.
         Yields a one-element list [processor_overhead_seconds] or None when no processor.
         Always restores the original .process reference.
+
+        With ``scale``/``offset`` (frame was resized or cropped to the ROI before DLCLive), the
+        processor sees the pose in full-frame coordinates and its result is mapped back to
+        model-input coordinates.
         """
         if self._processor is None:
             yield None
@@ -409,13 +785,22 @@ class DLCLiveProcessor(QObject):
         original = self._processor.process
         holder = [0.0]
 
-        def timed_process(pose, _op=original, _holder=holder, **kwargs):
-            start = time.perf_counter()
-            try:
-                return _op(pose, **kwargs)
-            finally:
-                _holder[0] = time.perf_counter() - start
+        mapped = scale is not None or offset is not None
 
+        def timed_process(pose, _op=original, _holder=holder, **kwargs):
+            if mapped:
+                pose = to_frame_coords(pose, scale, offset)
+            with self._processor_call_lock:
+                start = time.perf_counter()
+                try:
+                    result = _op(pose, **kwargs)
+                finally:
+                    _holder[0] = time.perf_counter() - start
+            if mapped and result is not None:
+                result = to_model_coords(result, scale, offset)
+            return result
+
+        timed_process.__wrapped__ = original
         self._processor.process = timed_process
         try:
             yield holder
@@ -430,25 +815,38 @@ class DLCLiveProcessor(QObject):
         enqueue_time: float,
         *,
         queue_wait_time: float = 0.0,
+        preprocess_time: float = 0.0,
+        scale: tuple[float, float] | None = None,
+        offset: tuple[int, int] | None = None,
     ) -> None:
         """
-        Single source of truth for: inference -> (optional) processor timing -> signal emit -> stats.
+        Single source of truth for: inference -> (optional) processor timing -> pose publish -> stats.
         Updates: frames_processed, latency, processing timeline, profiling metrics.
+
+        ``scale`` (preprocess resize) and ``offset`` (ROI origin) map keypoints back to full-frame coordinates.
         """
         if self._dlc is None:
             raise RuntimeError("DLCLive instance is not initialized.")
         # Time GPU inference (and processor overhead when present)
-        with self._timed_processor() as proc_holder:
+        with self._timed_processor(scale, offset) as proc_holder, self._inference_gate or nullcontext():
             inference_start = time.perf_counter()
             raw_pose: Any = self._dlc.get_pose(frame, frame_time=timestamp)
             inference_time = time.perf_counter() - inference_start
-        pose_arr: np.ndarray = validate_pose_array(raw_pose, source_backend=PoseBackends.DLC_LIVE)
+        pose_arr: np.ndarray = self._validator(raw_pose)
+        if scale is not None or offset is not None:
+            pose_arr = to_frame_coords(pose_arr, scale, offset)
+        motion = self._motion
+        if motion is not None:
+            with self._motion_lock:
+                motion.update(timestamp, pose_arr)
         pose_packet = PosePacket(
             schema_version=0,
             keypoints=pose_arr,
             keypoint_names=None,
             individual_ids=None,
-            source=PoseSource(backend=PoseBackends.DLC_LIVE, model_type=self._settings.model_type),
+            source=PoseSource(
+                backend=PoseBackends.DLC_LIVE, model_type=self._settings.model_type, model_id=self._settings.model_id
+            ),
             raw=raw_pose,
         )
 
@@ -457,10 +855,13 @@ class DLCLiveProcessor(QObject):
         if proc_holder is not None:
             processor_overhead = proc_holder[0]
             gpu_inference_time = max(0.0, inference_time - processor_overhead)
+        ipc_time = getattr(self._dlc, "last_ipc_time", None)
+        if ipc_time is not None:
+            gpu_inference_time = max(0.0, gpu_inference_time - ipc_time)
 
-        # Emit pose (measure signal overhead)
+        # Publish pose (measure publish/signal overhead)
         signal_start = time.perf_counter()
-        self.pose_ready.emit(PoseResult(pose=pose_packet.keypoints, timestamp=timestamp, packet=pose_packet))
+        self._publish_pose(PoseResult(pose=pose_packet.keypoints, timestamp=timestamp, packet=pose_packet))
         signal_time = time.perf_counter() - signal_start
 
         end_ts = time.perf_counter()
@@ -469,6 +870,9 @@ class DLCLiveProcessor(QObject):
         # Actual end-to-end time from enqueue to signal emit
         total_process_time = end_ts - enqueue_time
 
+        if self._rate is not None:
+            self._rate.record_latency(latency)
+
         with self._stats_lock:
             self._frames_processed += 1
             self._latencies.append(latency)
@@ -480,72 +884,247 @@ class DLCLiveProcessor(QObject):
                 self._total_process_times.append(total_process_time)
                 self._gpu_inference_times.append(gpu_inference_time)
                 self._processor_overhead_times.append(processor_overhead)
+                if scale is not None:
+                    self._preprocess_times.append(preprocess_time)
+                if ipc_time is not None:
+                    self._ipc_times.append(ipc_time)
+
+    def _crop_to_roi(self, frame: np.ndarray) -> tuple[np.ndarray, tuple[int, int] | None]:
+        """Copy of ``frame`` restricted to the inference ROI (plus margin) and the ROI origin, or the full frame."""
+        roi = self._settings.roi
+        if roi is not None:
+            bounds = roi_bounds(roi, self._settings.roi_margin, frame.shape[1], frame.shape[0])
+            if bounds is not None:
+                x0, y0, x1, y1 = bounds
+                return frame[y0:y1, x0:x1].copy(), (x0, y0)
+        return frame.copy(), None
+
+    def _preprocess(self, frame: np.ndarray, factor: float) -> tuple[np.ndarray, tuple[float, float]]:
+        """Resize ``frame`` by ``factor`` into a pooled buffer; returns it and the (x, y) scale back."""
+        if factor == 1.0:
+            return frame, (1.0, 1.0)  # frame is already our own copy
+        h, w = frame.shape[:2]
+        size = (max(1, round(w * factor)), max(1, round(h * factor)))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        buf = self._prep_buffers[self._prep_index]
+        if buf is None or buf.shape != shape or buf.dtype != frame.dtype:
+            buf = np.empty(shape, dtype=frame.dtype)
+            self._prep_buffers[self._prep_index] = buf
+        self._prep_index = (self._prep_index + 1) % PREPROCESS_BUFFERS
+        cv2.resize(frame, size, dst=buf)  # same interpolation as DLCLive's own resize
+        return buf, (w / size[0], h / size[1])
+
+    def _preprocess_loop(self, q: queue.Queue, prepared: queue.Queue, slot: threading.Semaphore, factor: float):
+        """
+        Preprocess stage: resize frame N+1 while frame N is in inference.
+
+        ``slot`` is released by the inference thread when it takes a prepared frame, so a
+        raw frame is only picked once the previous one is in inference: the frame that gets
+        inferred next is as fresh as with a single queue, only already resized.
+        """
+        while True:
+            if self._stop_event.is_set() and q.empty():
+                break
+            if not slot.acquire(timeout=0.05):
+                continue
+            try:
+                wait_start = time.perf_counter()
+                frame, ts, enq, offset = q.get(timeout=0.05)
+            except queue.Empty:
+                slot.release()
+                continue
+            queue_wait_time = time.perf_counter() - wait_start
+            try:
+                prep_start = time.perf_counter()
+                rate = self._rate
+                if rate is not None and rate.adapt_resize:
+                    factor = rate.resize
+                prepared_frame, scale = self._preprocess(frame, factor)
+                prep_time = time.perf_counter() - prep_start
+                prepared.put((prepared_frame, ts, enq, offset, queue_wait_time, prep_time, scale))
+            except Exception as exc:
+                slot.release()
+                logger.exception("Frame preprocessing failed", exc_info=exc)
+                self.error.emit(str(exc))
+            finally:
+                q.task_done()
+
+    @staticmethod
+    def _runner_options(settings: DLCProcessorSettings, adaptive: bool = False) -> tuple[dict, float | None]:
+        """DLCLive options for ``settings`` and the factor resized in the preprocess stage (None: in DLCLive)."""
+        dyn = settings.dynamic
+        if not isinstance(dyn, (list, tuple)) or len(dyn) != 3:
+            try:
+                dyn = dyn.to_tuple()
+            except Exception as e:
+                raise RuntimeError("Invalid dynamic crop settings format.") from e
+        enabled, margin, max_missing = dyn
+        # Resize in the preprocess stage instead of inside DLCLive.get_pose when it can be pipelined
+        # (always when rate control adapts the resize factor on the fly)
+        preresize = None
+        if not enabled and (adaptive or (settings.pipeline_preprocess and settings.resize != 1.0)):
+            preresize = float(settings.resize)
+
+        options = {
+            "model_path": settings.model_path,
+            "model_type": settings.model_type,
+            "processor": None,
+            "dynamic": [enabled, margin, max_missing],
+            "resize": 1.0 if preresize else settings.resize,
+            "precision": settings.precision,
+            "single_animal": settings.single_animal,
+        }
+        if settings.device is not None:
+            options["device"] = settings.device
+        return options, preresize
 
-        self.frame_processed.emit()
+    @staticmethod
+    def _build_runner(options: dict, inference_mode: str):
+        if inference_mode == "process":
+            # The processor stays here and is applied to the poses coming back
+            options = dict(options)
+            processor = options.pop("processor", None)
+            return RemoteDLCLive(options, processor=processor)
+        if DLCLive is None:
+            raise RuntimeError(
+                "DLCLive class is not available. Ensure the dlclive package is installed and can be imported."
+            )
+        return DLCLive(**options)
+
+    def preload(self, settings: DLCProcessorSettings, frame_shape: tuple[int, ...]) -> bool:
+        """
+        Load and initialize the model for ``settings`` in the background.
 
-    def _worker_loop(self, init_frame: np.ndarray, init_timestamp: float) -> None:
+        The runner is warmed up with a blank frame of ``frame_shape`` (the expected camera
+        resolution) and parked in the model cache, so the next inference session with the
+        same settings and resolution starts without loading the model. Emits
+        :attr:`preloaded` when done. Returns False if there is nothing to do (no model,
+        caching disabled, or the model is already cached).
+        """
+        if not settings.model_path or self._model_cache.capacity == 0:
+            return False
+        adaptive = bool(settings.adaptive_resize and settings.target_latency_ms)
+        options, preresize = self._runner_options(settings, adaptive)
+
+        frame = np.zeros(tuple(frame_shape), dtype=np.uint8)
+        if settings.roi is not None:
+            bounds = roi_bounds(settings.roi, settings.roi_margin, frame.shape[1], frame.shape[0])
+            if bounds is not None:
+                x0, y0, x1, y1 = bounds
+                frame = np.ascontiguousarray(frame[y0:y1, x0:x1])
+        if preresize and preresize != 1.0:
+            h, w = frame.shape[:2]
+            frame = cv2.resize(frame, (max(1, round(w * preresize)), max(1, round(h * preresize))))
+        key = ModelKey.from_options(options, frame.shape, settings.inference_mode)
+
+        with self._lifecycle_lock:
+            previous = self._preload_thread
+            if previous is not None and previous.is_alive() and self._preload_key == key:
+                return True
+            if key in self._model_cache or key == self._dlc_key:
+                return False  # already warm, or in use by the running session
+            self._preload_key = key
+            self._preload_thread = threading.Thread(
+                target=self._preload_run,
+                args=(key, options, frame, settings.inference_mode, previous, self._preload_generation),
+                name="DLCLivePreload",
+                daemon=True,
+            )
+            self._preload_thread.start()
+        return True
+
+    def _preload_run(
+        self, key: ModelKey, options: dict, frame: np.ndarray, inference_mode: str, previous, generation: int
+    ) -> None:
+        if previous is not None:
+            previous.join()  # one model load at a time
+        start = time.perf_counter()
+        try:
+            runner = self._build_runner(options, inference_mode)
+            runner.init_inference(frame)
+        except Exception as exc:
+            logger.warning("Background preload of model '%s' failed: %s", options["model_path"], exc)
+            self.preloaded.emit(False, str(exc))
+            return
+        if generation != self._preload_generation:  # shut down meanwhile
+            close_runner(runner)
+            return
+        self._model_cache.put(key, runner)
+        logger.info("Preloaded model '%s' in %.3fs", options["model_path"], time.perf_counter() - start)
+        self.preloaded.emit(True, str(options["model_path"]))
+
+    def _worker_loop(self, init_frame: np.ndarray, init_timestamp: float, init_offset=None) -> None:
         try:
             # -------- Initialization (unchanged) --------
             if not self._settings.model_path:
                 raise RuntimeError("No DLCLive model path configured.")
 
             init_start = time.perf_counter()
-            dyn = self._settings.dynamic
-            if not isinstance(dyn, (list, tuple)) or len(dyn) != 3:
+            adaptive = self._rate is not None and self._rate.adapt_resize
+            options, preresize = self._runner_options(self._settings, adaptive)
+            if adaptive and not preresize:
+                logger.warning("Adaptive resize is not available with dynamic cropping; using a fixed resize")
+                self._rate.adapt_resize = False
+            options["processor"] = self._processor
+
+            init_scale = None
+            if preresize:
+                init_frame, init_scale = self._preprocess(init_frame, preresize)
+            key = ModelKey.from_options(options, init_frame.shape, self._settings.inference_mode)
+            preload = self._preload_thread
+            if preload is not None and preload.is_alive() and self._preload_key == key:
+                logger.info("Waiting for the background preload of this model to finish")
+                preload.join()
+            runner = self._model_cache.take(key)
+            init_inference_time = 0.0
+            if runner is not None:
+                # Warm start: weights and runtime are already initialized for this input
+                runner.processor = self._processor
+                self._dlc = runner
+            else:
                 try:
-                    dyn = dyn.to_tuple()
-                except Exception as e:
-                    raise RuntimeError("Invalid dynamic crop settings format.") from e
-            enabled, margin, max_missing = dyn
-
-            options = {
-                "model_path": self._settings.model_path,
-                "model_type": self._settings.model_type,
-                "processor": self._processor,
-                "dynamic": [enabled, margin, max_missing],
-                "resize": self._settings.resize,
-                "precision": self._settings.precision,
-                "single_animal": self._settings.single_animal,
-            }
-            if self._settings.device is not None:
-                options["device"] = self._settings.device
-
-            try:
-                if DLCLive is None:
+                    self._dlc = self._build_runner(options, self._settings.inference_mode)
+                except Exception as exc:
+                    with self._lifecycle_lock:
+                        self._state = WorkerState.FAULTED
                     raise RuntimeError(
-                        "DLCLive class is not available. Ensure the dlclive package is installed and can be imported."
-                    )
-                self._dlc = DLCLive(**options)
-            except Exception as exc:
-                with self._lifecycle_lock:
-                    self._state = WorkerState.FAULTED
-                raise RuntimeError(
-                    f"Failed to initialize DLCLive with model '{self._settings.model_path}': {exc}"
-                ) from exc
+                        f"Failed to initialize DLCLive with model '{self._settings.model_path}': {exc}"
+                    ) from exc
 
-            # First inference to initialize
-            init_inference_start = time.perf_counter()
-            self._dlc.init_inference(init_frame)
-            init_inference_time = time.perf_counter() - init_inference_start
+                # First inference to initialize
+                init_inference_start = time.perf_counter()
+                self._dlc.init_inference(init_frame)
+                init_inference_time = time.perf_counter() - init_inference_start
+            self._dlc_key = key
 
             # Pass DLCLive cfg to processor if available
             if hasattr(self._dlc, "processor") and hasattr(self._dlc.processor, "set_dlc_cfg"):
                 self._dlc.processor.set_dlc_cfg(getattr(self._dlc, "cfg", None))
 
+            total_init_time = time.perf_counter() - init_start
+            self._last_init_time = total_init_time
+            self._last_init_cached = runner is not None
             self._initialized = True
             self.initialized.emit(True)
             with self._lifecycle_lock:
                 self._state = WorkerState.RUNNING
 
-            total_init_time = time.perf_counter() - init_start
             logger.info(
-                "DLCLive model initialized successfully (total: %.3fs, init_inference: %.3fs)",
+                "DLCLive model initialized successfully (total: %.3fs, init_inference: %.3fs%s)",
                 total_init_time,
                 init_inference_time,
+                ", cached model" if runner is not None else "",
             )
 
             # Emit pose for init frame & update stats (not dequeued)
-            self._process_frame(init_frame, init_timestamp, time.perf_counter(), queue_wait_time=0.0)
+            self._process_frame(
+                init_frame,
+                init_timestamp,
+                time.perf_counter(),
+                queue_wait_time=0.0,
+                scale=init_scale,
+                offset=init_offset,
+            )
             with self._stats_lock:
                 self._frames_enqueued += 1
 
@@ -567,6 +1146,32 @@ class DLCLiveProcessor(QObject):
             self.error.emit("Worker started without a queue")
             return
 
+        # With pipelined preprocessing, the inference loop consumes prepared frames instead
+        slot = None
+        if preresize:
+            prepared: queue.Queue[Any] = queue.Queue(maxsize=1)
+            slot = threading.Semaphore(1)
+            self._preprocess_thread = threading.Thread(
+                target=self._preprocess_loop,
+                args=(q, prepared, slot, preresize),
+                name="DLCLivePreprocess",
+                daemon=True,
+            )
+            self._preprocess_thread.start()
+            q = prepared
+        prep_thread = self._preprocess_thread
+
+        def run_item(item, queue_wait_time: float) -> None:
+            if slot is None:
+                frame, ts, enq, offset = item
+                self._process_frame(frame, ts, enq, queue_wait_time=queue_wait_time, offset=offset)
+                return
+            slot.release()  # let the preprocess stage pick up the next frame
+            frame, ts, enq, offset, raw_wait, prep_time, scale = item
+            self._process_frame(
+                frame, ts, enq, queue_wait_time=raw_wait, preprocess_time=prep_time, scale=scale, offset=offset
+            )
+
         # -------- Main processing loop: stop-flag + timed get + drain --------
         # NOTE: We never exit early unless _stop_event is set.
         while True:
@@ -574,14 +1179,18 @@ class DLCLiveProcessor(QObject):
             if self._stop_event.is_set():
                 if q is not None:
                     try:
-                        frame, ts, enq = q.get_nowait()
+                        item = q.get_nowait()
                     except queue.Empty:
+                        if prep_thread is not None and prep_thread.is_alive():
+                            # The preprocess stage is still draining raw frames
+                            time.sleep(0.005)
+                            continue
                         # NOW it is safe to exit
                         break
                     else:
                         # Still work to do, process one
                         try:
-                            self._process_frame(frame, ts, enq, queue_wait_time=0.0)
+                            run_item(item, 0.0)
                         except Exception as exc:
                             logger.exception("Pose inference failed", exc_info=exc)
                             self.error.emit(str(exc))
@@ -607,8 +1216,7 @@ class DLCLiveProcessor(QObject):
                 break
 
             try:
-                frame, ts, enq = item
-                self._process_frame(frame, ts, enq, queue_wait_time=queue_wait_time)
+                run_item(item, queue_wait_time)
             except Exception as exc:
                 logger.exception("Pose inference failed", exc_info=exc)
                 self.error.emit(str(exc))
@@ -618,6 +1226,9 @@ class DLCLiveProcessor(QObject):
                 except ValueError:
                     pass
 
+        if prep_thread is not None:
+            prep_thread.join(timeout=1.0)
+            self._preprocess_thread = None
         logger.info("DLC worker thread exiting")
 
 
@@ -627,7 +1238,6 @@ class DLCService:
     def __init__(self):
         self._proc = DLCLiveProcessor()
         self.active = False
-        self._last_pose: PoseResult | None = None
         self._processor_info = None
 
     @property
@@ -647,9 +1257,17 @@ class DLCService:
     def initialized(self):
         return self._proc.initialized
 
+    @property
+    def preloaded(self):
+        return self._proc.preloaded
+
     def enqueue(self, frame, ts):
         self._proc.enqueue_frame(frame, ts)
 
+    def preload(self, settings: DLCProcessorSettings, frame_shape: tuple[int, ...]) -> bool:
+        """Start loading the model of ``settings`` in the background (see :meth:`DLCLiveProcessor.preload`)."""
+        return self._proc.preload(settings, frame_shape)
+
     def configure(self, settings: DLCProcessorSettings, scanned_processors: dict, selected_key) -> bool:
         with self._proc._lifecycle_lock:
             if self._proc._state != WorkerState.STOPPED:
@@ -658,7 +1276,7 @@ class DLCService:
         processor = None
         if selected_key is not None and scanned_processors:
             try:
-                processor = instantiate_from_scan(scanned_processors, selected_key)
+                processor = create_processor(scanned_processors, selected_key, settings)
             except Exception as exc:
                 logger.error("Failed to instantiate processor: %s", exc)
                 return False
@@ -672,10 +1290,9 @@ class DLCService:
     def stop(self):
         self.active = False
         self._proc.reset()
-        self._last_pose = None
 
     def stats(self) -> ProcessorStats:
         return self._proc.get_stats()
 
     def last_pose(self) -> PoseResult | None:
-        return self._last_pose
+        return self._proc.latest_pose.read()[1]
@@ -0,0 +1,252 @@
+"""Run DLCLive in a separate process.
+
+With ``DLCProcessorSettings.inference_mode="process"`` the model no longer runs on a
+thread of the GUI process (where it competes for the GIL with Qt, camera workers and
+recorders), and a crash of the model or its runtime no longer takes the GUI down.
+
+:class:`RemoteDLCLive` is a drop-in for the ``DLCLive`` object used by the worker
+thread of :class:`~dlclivegui.services.dlc_processor.DLCLiveProcessor`:
+
+* frames are copied into a shared-memory segment with :data:`FRAME_SLOTS` slots used in
+  turn (a slot is never rewritten while the child might still read it after a timeout);
+  only the slot index, shape and dtype go over the pipe;
+* the child runs ``DLCLive.get_pose`` and sends back the (small) pose array and its own
+  inference time, so the round trip minus that time is the IPC overhead;
+* the user processor stays in the GUI process and is applied to the returned pose, as
+  ``DLCLive`` would do.
+"""
+
+# dlclivegui/services/inference_process.py
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import os
+import pickle
+import time
+from importlib import import_module
+from itertools import count
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from dlclivegui.processors.shared_pose import _attach
+
+logger = logging.getLogger(__name__)
+
+DLCLIVE_FACTORY = "dlclive:DLCLive"  # "module:attribute" the child calls with the DLCLive options
+FRAME_SLOTS = 2
+START_TIMEOUT = 300.0  # model loading can be slow (TensorRT, first CUDA context, ...)
+LIVENESS_POLL = 0.5
+STOP_TIMEOUT = 5.0
+
+_names = count()
+
+
+class InferenceProcessError(RuntimeError):
+    """The inference process failed or exited."""
+
+
+class RemoteDLCLive:
+    """
+    ``DLCLive`` stand-in whose model runs in a child process.
+
+    Args:
+        options: Keyword arguments for ``DLCLive`` (without ``processor``; must be picklable).
+        processor: Processor applied to every pose in this process (its ``process()``
+            is looked up on each call, so wrappers installed by the caller are honoured).
+        factory: ``"module:attribute"`` of the DLCLive class to construct in the child.
+    """
+
+    def __init__(self, options: dict, processor: Any | None = None, *, factory: str | None = None):
+        self.processor = processor
+        self.cfg = None
+        self.last_ipc_time = 0.0
+        self.last_remote_time = 0.0
+
+        self._ctx = mp.get_context("spawn")
+        self._shm: shared_memory.SharedMemory | None = None
+        self._slot_size = 0
+        self._next_slot = 0
+        self._conn, child_conn = self._ctx.Pipe()
+        self._process = self._ctx.Process(
+            target=_inference_main,
+            args=(dict(options), factory or DLCLIVE_FACTORY, child_conn),
+            name="DLCLiveInference",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        kind, payload = self._receive(timeout=START_TIMEOUT)
+        if kind != "ready":
+            self.close()
+            raise InferenceProcessError(f"DLCLive failed to initialize in the inference process: {payload}")
+        self.cfg = payload
+        logger.info("DLCLive running in inference process %s", self._process.pid)
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self._process.is_alive()
+
+    def init_inference(self, frame: np.ndarray, **kwargs):
+        return self._infer("init", frame, kwargs)
+
+    def get_pose(self, frame: np.ndarray, frame_time=None, **kwargs):
+        kwargs["frame_time"] = frame_time
+        pose = self._infer("pose", frame, kwargs)
+        if self.processor is not None:
+            pose = self.processor.process(pose, **kwargs)
+        return pose
+
+    def close(self, timeout: float = STOP_TIMEOUT) -> None:
+        proc = self._process
+        if proc.is_alive():
+            try:
+                self._conn.send(("stop",))
+            except (OSError, ValueError):
+                pass
+            proc.join(timeout=timeout)
+            if proc.is_alive():
+                logger.warning("Inference process did not exit in time; terminating it")
+                proc.terminate()
+                proc.join(timeout=1.0)
+        self._conn.close()
+        self._release_frames()
+
+    # ------------------------------------------------------------------ internals
+
+    def _infer(self, kind: str, frame: np.ndarray, kwargs: dict):
+        start = time.perf_counter()
+        frame = np.ascontiguousarray(frame)
+        slot = self._write_frame(frame)
+        try:
+            self._conn.send((kind, slot, frame.shape, frame.dtype.str, kwargs))
+        except (OSError, ValueError) as exc:
+            raise self._exited_error() from exc
+        reply, payload = self._receive()
+        if reply == "failed":
+            raise InferenceProcessError(payload)
+        result, remote_time = payload
+        self.last_remote_time = remote_time
+        self.last_ipc_time = max(0.0, time.perf_counter() - start - remote_time)
+        return result
+
+    def _write_frame(self, frame: np.ndarray) -> int:
+        if frame.nbytes > self._slot_size:
+            self._open_frames(frame.nbytes)
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % FRAME_SLOTS
+        offset = slot * self._slot_size
+        dst = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._shm.buf, offset=offset)
+        dst[...] = frame
+        return slot
+
+    def _open_frames(self, nbytes: int) -> None:
+        """(Re)allocate the frame slots, e.g. for the first frame or a larger resolution."""
+        self._release_frames()
+        size = max(nbytes, 1)
+        # Short name: macOS limits shared-memory names to 31 characters
+        name = f"dlcf_{os.getpid()}_{next(_names)}"
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size * FRAME_SLOTS)
+        self._slot_size = size
+        self._next_slot = 0
+        self._conn.send(("frames", name, size))
+
+    def _release_frames(self) -> None:
+        shm = self._shm
+        self._shm = None
+        self._slot_size = 0
+        if shm is not None:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _receive(self, timeout: float | None = None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                if self._conn.poll(LIVENESS_POLL):
+                    return self._conn.recv()
+            except (EOFError, OSError) as exc:
+                raise self._exited_error() from exc
+            if not self._process.is_alive():
+                raise self._exited_error()
+            if deadline is not None and time.monotonic() > deadline:
+                raise InferenceProcessError(f"Inference process did not answer within {timeout:.0f}s")
+
+    def _exited_error(self) -> InferenceProcessError:
+        self._process.join(timeout=0.5)
+        return InferenceProcessError(f"Inference process exited unexpectedly (exit code {self._process.exitcode})")
+
+    def __repr__(self):
+        return f"RemoteDLCLive(pid={self.pid}, alive={self.alive})"
+
+
+# ---------------------------------------------------------------------- child process
+
+
+def _picklable_or_none(obj):
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return None
+    return obj
+
+
+def _inference_main(options: dict, factory: str, conn) -> None:
+    try:
+        module_name, _, attr = factory.partition(":")
+        dlc = getattr(import_module(module_name), attr)(**options)
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        conn.close()
+        return
+    conn.send(("ready", _picklable_or_none(getattr(dlc, "cfg", None))))
+
+    shm = None
+    slot_size = 0
+    frame = None
+    try:
+        while True:
+            try:
+                msg = conn.recv()
+            except (EOFError, OSError):
+                break  # GUI process went away
+            kind = msg[0]
+            if kind == "stop":
+                break
+            if kind == "frames":
+                frame = None
+                if shm is not None:
+                    shm.close()
+                shm = _attach(msg[1])
+                slot_size = msg[2]
+                continue
+
+            _, slot, shape, dtype, kwargs = msg
+            frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=slot * slot_size)
+            start = time.perf_counter()
+            try:
+                if kind == "init":
+                    result = dlc.init_inference(frame)
+                else:
+                    result = dlc.get_pose(frame, **kwargs)
+            except Exception as exc:
+                conn.send(("failed", f"{type(exc).__name__}: {exc}"))
+                continue
+            elapsed = time.perf_counter() - start
+            if kind == "init":
+                result = _picklable_or_none(result)
+            conn.send(("result", (result, elapsed)))
+    finally:
+        frame = None  # release the view before closing the segment
+        if shm is not None:
+            shm.close()
+        conn.close()
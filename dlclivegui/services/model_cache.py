@@ -0,0 +1,197 @@
+"""Keep initialized DLCLive runners alive between inference sessions.
+
+Starting pose inference used to build a new ``DLCLive`` (weights loading, runtime
+and graph/engine construction) and run ``init_inference`` every time, even when the
+user only stopped and restarted inference with the same model. ``ModelCache`` keeps
+the runners released by :class:`~dlclivegui.services.dlc_processor.DLCLiveProcessor`
+and hands them back when the next session asks for the same :class:`ModelKey`.
+
+A runner is only reused for an identical key: model path (and its modification
+time, so a re-exported model is reloaded), model type, precision, resize, device,
+dynamic cropping, single-animal mode, inference mode and the input frame shape.
+The least recently used runners are evicted beyond ``capacity``; evicted runners
+are closed if they have a ``close()`` method (e.g. the inference process of
+:class:`~dlclivegui.services.inference_process.RemoteDLCLive`).
+"""
+
+# dlclivegui/services/model_cache.py
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class ModelKey(NamedTuple):
+    model_path: str
+    model_mtime: float
+    model_type: str
+    precision: str
+    resize: float
+    device: str | None
+    dynamic: tuple
+    single_animal: bool
+    inference_mode: str
+    input_shape: tuple[int, ...]
+
+    @classmethod
+    def from_options(cls, options: dict, input_shape: tuple[int, ...], inference_mode: str = "thread") -> ModelKey:
+        """Build the key from the ``DLCLive`` options the runner is (or would be) created with."""
+        path = str(options["model_path"])
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = 0.0
+        return cls(
+            model_path=os.path.abspath(path),
+            model_mtime=mtime,
+            model_type=str(options.get("model_type", "")),
+            precision=str(options.get("precision", "")),
+            resize=float(options.get("resize", 1.0)),
+            device=options.get("device"),
+            dynamic=tuple(options.get("dynamic") or ()),
+            single_animal=bool(options.get("single_animal", True)),
+            inference_mode=inference_mode,
+            input_shape=tuple(int(d) for d in input_shape),
+        )
+
+
+@dataclass
+class CachedModel:
+    """Description of a cache entry (see :meth:`ModelCache.entries`)."""
+
+    key: ModelKey
+    runner: Any
+    size_bytes: int  # weights size on disk, used as an estimate of the memory the runner holds
+
+
+def model_size_bytes(model_path: str) -> int:
+    """Size of a model file, or of all files of a model directory (TensorFlow exports)."""
+    path = Path(model_path)
+    try:
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def close_runner(runner: Any) -> None:
+    close = getattr(runner, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            logger.exception("Failed to close cached model runner %r", runner)
+
+
+class ModelCache:
+    """
+    Thread-safe LRU cache of initialized model runners.
+
+    Args:
+        capacity: Maximum number of runners kept (0 disables caching).
+    """
+
+    def __init__(self, capacity: int = 1):
+        self._capacity = max(0, int(capacity))
+        self._entries: OrderedDict[ModelKey, CachedModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        with self._lock:
+            self._capacity = max(0, int(value))
+            evicted = self._shrink(self._capacity)
+        self._close_all(evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: ModelKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def take(self, key: ModelKey) -> Any | None:
+        """Remove and return the runner cached for ``key``, or None.
+
+        On a miss, other entries are evicted as needed so that the runner about to be
+        built fits in the cache when it is released, instead of two models sitting in
+        memory at the same time.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.hits += 1
+                return entry.runner
+            self.misses += 1
+            evicted = self._shrink(max(0, self._capacity - 1))
+        self._close_all(evicted)
+        return None
+
+    def put(self, key: ModelKey, runner: Any) -> None:
+        """Store ``runner`` as the most recently used entry (closing what no longer fits)."""
+        if self._capacity == 0:
+            close_runner(runner)
+            return
+        entry = CachedModel(key=key, runner=runner, size_bytes=model_size_bytes(key.model_path))
+        with self._lock:
+            old = self._entries.pop(key, None)
+            self._entries[key] = entry
+            evicted = self._shrink(self._capacity)
+        if old is not None and old.runner is not runner:
+            evicted.append(old)
+        self._close_all(evicted)
+
+    def evict(self, model_path: str | None = None) -> int:
+        """Close and drop the runners of ``model_path`` (all runners if None); return how many."""
+        with self._lock:
+            if model_path is None:
+                evicted = list(self._entries.values())
+                self._entries.clear()
+            else:
+                target = os.path.abspath(model_path)
+                evicted = [self._entries.pop(k) for k in list(self._entries) if k.model_path == target]
+        self._close_all(evicted)
+        return len(evicted)
+
+    clear = evict
+
+    def entries(self) -> list[CachedModel]:
+        """Cached entries, least recently used first."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def memory_bytes(self) -> int:
+        """Estimated memory held by the cached runners (sum of their weights sizes)."""
+        with self._lock:
+            return sum(e.size_bytes for e in self._entries.values())
+
+    # ------------------------------------------------------------------ internals
+
+    def _shrink(self, size: int) -> list[CachedModel]:
+        # lock must be held
+        evicted = []
+        while len(self._entries) > size:
+            _, entry = self._entries.popitem(last=False)
+            evicted.append(entry)
+        return evicted
+
+    @staticmethod
+    def _close_all(entries: list[CachedModel]) -> None:
+        for entry in entries:
+            logger.info("Evicting cached model %s (input %s)", entry.key.model_path, entry.key.input_shape)
+            close_runner(entry.runner)
@@ -0,0 +1,142 @@
+"""Run several DLCLive models on the same frame stream.
+
+``PoseModelGroup`` owns one :class:`~dlclivegui.services.dlc_processor.DLCLiveProcessor`
+per model (e.g. a body model and a paw model on the same camera). Every model has its
+own worker thread, queue, rate control and ROI, so a slow model never holds back a fast
+one; each produces its own :class:`~dlclivegui.services.dlc_processor.PoseResult` stream
+whose ``packet.source.model_id`` names the model. Read the newest pose of every model
+with :meth:`PoseModelGroup.latest_poses`; ``pose_ready`` forwards every pose but is
+only emitted while connected.
+
+Sharing the hardware: models with ``device="auto"`` run where DLCLive puts them; give
+them explicit devices (``"cuda:0"``, ``"cuda:1"``, ``"cpu"``) to spread them. With
+``max_concurrent`` > 0 a shared semaphore limits how many models run inference at
+the same time (e.g. 1 for a single GPU, so that models take turns instead of
+contending), and each model can be throttled with its own ``target_fps``.
+"""
+
+# dlclivegui/services/multi_model.py
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+import numpy as np
+from PySide6.QtCore import QMetaMethod, QObject, Qt, Signal
+
+from dlclivegui.config import DLCProcessorSettings
+from dlclivegui.services.dlc_processor import DLCLiveProcessor, PoseResult, ProcessorStats
+
+logger = logging.getLogger(__name__)
+
+
+class PoseModelGroup(QObject):
+    """Several DLCLive models fed with the same frames."""
+
+    # (model_id, PoseResult)
+    pose_ready = Signal(str, object)
+    # (model_id, message)
+    error = Signal(str, str)
+    # (model_id, success)
+    initialized = Signal(str, bool)
+
+    def __init__(self, max_concurrent: int = 0) -> None:
+        super().__init__()
+        self._processors: dict[str, DLCLiveProcessor] = {}
+        self._gate: threading.Semaphore | None = None
+        self._pose_ready_method = QMetaMethod.fromSignal(self.pose_ready)
+        self.max_concurrent = max_concurrent
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, value: int) -> None:
+        self._max_concurrent = max(0, int(value))
+        self._gate = threading.BoundedSemaphore(self._max_concurrent) if self._max_concurrent else None
+        for proc in self._processors.values():
+            proc.set_inference_gate(self._gate)
+
+    @property
+    def gate(self) -> threading.Semaphore | None:
+        """Semaphore shared by the models of the group; hand it to other processors on the same frames."""
+        return self._gate
+
+    @property
+    def model_ids(self) -> list[str]:
+        return list(self._processors)
+
+    def processor(self, model_id: str) -> DLCLiveProcessor:
+        return self._processors[model_id]
+
+    def __len__(self) -> int:
+        return len(self._processors)
+
+    def configure(self, models: list[DLCProcessorSettings], processors: dict[str, Any] | None = None) -> None:
+        """
+        (Re)configure the group with one entry per model; all models must be stopped.
+
+        Processors of models that are still configured are reused (keeping their model
+        cache), the others are shut down. ``processors`` optionally maps model ids to a
+        pose processor for that model.
+        """
+        ids = [m.model_id for m in models]
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"Model ids must be unique, got {ids}")
+        processors = processors or {}
+        for model_id in list(self._processors):
+            if model_id not in ids:
+                self._processors.pop(model_id).shutdown()
+
+        for settings in models:
+            proc = self._processors.get(settings.model_id)
+            if proc is None:
+                proc = DLCLiveProcessor()
+                self._connect(settings.model_id, proc)
+                self._processors[settings.model_id] = proc
+            proc.configure(settings, processor=processors.get(settings.model_id))
+            proc.set_inference_gate(self._gate)
+
+    def enqueue_frame(self, frame: np.ndarray, timestamp: float) -> None:
+        """Submit ``frame`` to every model (each copies what it needs)."""
+        for proc in self._processors.values():
+            proc.enqueue_frame(frame, timestamp)
+
+    def preload(self, frame_shape: tuple[int, ...]) -> None:
+        for proc in self._processors.values():
+            proc.preload(proc.settings, frame_shape)
+
+    def reset(self) -> None:
+        for proc in self._processors.values():
+            proc.reset()
+
+    def shutdown(self) -> None:
+        for proc in self._processors.values():
+            proc.shutdown()
+
+    def latest_poses(self) -> dict[str, tuple[int, PoseResult | None]]:
+        """``(sequence, result)`` of the newest pose of every model (see ``LatestPoseSlot.read``)."""
+        return {model_id: proc.latest_pose.read() for model_id, proc in self._processors.items()}
+
+    def get_stats(self) -> dict[str, ProcessorStats]:
+        return {model_id: proc.get_stats() for model_id, proc in self._processors.items()}
+
+    def _connect(self, model_id: str, proc: DLCLiveProcessor) -> None:
+        def on_pose(result: PoseResult, _id=model_id):
+            if self.isSignalConnected(self._pose_ready_method):
+                self.pose_ready.emit(_id, result)
+
+        def on_error(message: str, _id=model_id):
+            logger.error("Model %r failed: %s", _id, message)
+            self.error.emit(_id, message)
+
+        def on_initialized(success: bool, _id=model_id):
+            self.initialized.emit(_id, success)
+
+        # Direct connections: re-emit from the worker thread, the group's own signals are
+        # then delivered to receivers in their threads like the processor's would be
+        proc.pose_ready.connect(on_pose, Qt.ConnectionType.DirectConnection)
+        proc.error.connect(on_error, Qt.ConnectionType.DirectConnection)
+        proc.initialized.connect(on_initialized, Qt.ConnectionType.DirectConnection)
@@ -0,0 +1,170 @@
+"""Predict keypoints between inference frames.
+
+When the camera runs faster than inference, the overlay and the processors only
+see a new pose every few frames. A motion model is updated with every inferred
+pose (in full-frame coordinates) and asked for a prediction at the timestamp of
+each camera frame in between; predicted poses are flagged as such
+(``PosePacket.predicted``).
+
+Both models are vectorized over all keypoints (single- or multi-animal poses) and
+keep an independent state per keypoint: keypoints that are missing (non-finite) or
+below ``min_confidence`` are not updated and keep moving along their last
+estimate. Predictions never extrapolate more than ``max_horizon`` seconds past the
+last update of a keypoint. The likelihood column of a prediction is the one of the
+last observation. This module only depends on NumPy.
+"""
+
+# dlclivegui/services/pose_tracking.py
+from __future__ import annotations
+
+import numpy as np
+
+
+class ConstantVelocityPredictor:
+    """
+    Extrapolate each keypoint with its (smoothed) last velocity.
+
+    Args:
+        min_confidence: Observations below this likelihood do not update the model.
+        max_horizon: Longest extrapolation in seconds.
+        smoothing: Weight of the newest velocity estimate (1 = no smoothing).
+    """
+
+    def __init__(self, *, min_confidence: float = 0.0, max_horizon: float = 0.1, smoothing: float = 0.6):
+        self.min_confidence = min_confidence
+        self.max_horizon = max_horizon
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self) -> None:
+        self.xy = None  # (..., 2) last position estimate, NaN until a keypoint is observed
+        self.velocity = None
+        self.has_velocity = None  # (..., 1) a velocity was measured (the first one is not smoothed)
+        self.likelihood = None
+        self.t_last = None  # (..., 1) time of the last update per keypoint
+        self.last_update = None  # time of the last update() call
+
+    def _valid(self, pose: np.ndarray) -> np.ndarray:
+        valid = np.isfinite(pose).all(axis=-1)
+        if self.min_confidence > 0:
+            valid &= pose[..., 2] >= self.min_confidence
+        return valid[..., None]
+
+    def update(self, t: float, pose) -> None:
+        """Feed the pose (``(..., 3)``: x, y, likelihood) observed at time ``t``."""
+        pose = np.asarray(pose, dtype=np.float64)
+        t = float(t)
+        valid = self._valid(pose)
+        xy = pose[..., :2]
+        if self.xy is None or self.xy.shape != xy.shape:
+            self.xy = np.where(valid, xy, np.nan)
+            self.velocity = np.zeros_like(xy)
+            self.has_velocity = np.zeros(valid.shape, dtype=bool)
+            self.likelihood = np.where(valid[..., 0], pose[..., 2], 0.0)
+            self.t_last = np.full(valid.shape, t)
+            self.last_update = t
+            return
+
+        seen = ~np.isnan(self.xy[..., :1])
+        dt = t - self.t_last
+        step = valid & seen & (dt > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v = (xy - self.xy) / dt
+        smoothed = np.where(self.has_velocity, self.smoothing * v + (1 - self.smoothing) * self.velocity, v)
+        self.velocity = np.where(step, smoothed, self.velocity)
+        self.has_velocity |= step
+        self.xy = np.where(valid, xy, self.xy)
+        self.likelihood = np.where(valid[..., 0], pose[..., 2], self.likelihood)
+        self.t_last = np.where(valid, t, self.t_last)
+        self.last_update = t
+
+    def predict(self, t: float) -> np.ndarray | None:
+        """Pose (``(..., 3)``) expected at time ``t``, or None before the first update."""
+        if self.xy is None:
+            return None
+        dt = np.clip(float(t) - self.t_last, 0.0, self.max_horizon)
+        out = np.empty(self.xy.shape[:-1] + (3,))
+        out[..., :2] = self.xy + self.velocity * dt
+        out[..., 2] = self.likelihood
+        return out
+
+
+class KalmanPredictor(ConstantVelocityPredictor):
+    """
+    Constant-velocity Kalman filter per keypoint coordinate.
+
+    State ``(position, velocity)`` per coordinate with a white-acceleration process model.
+    Compared to :class:`ConstantVelocityPredictor` it weighs each new observation
+    against the prediction, so single noisy detections move the estimate less.
+
+    Args:
+        min_confidence: Observations below this likelihood do not update the model.
+        max_horizon: Longest extrapolation in seconds.
+        process_noise: Acceleration noise density in (px/s²)² · s.
+        measurement_noise: Detection noise variance in px².
+    """
+
+    def __init__(
+        self,
+        *,
+        min_confidence: float = 0.0,
+        max_horizon: float = 0.1,
+        process_noise: float = 5e4,
+        measurement_noise: float = 4.0,
+    ):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        super().__init__(min_confidence=min_confidence, max_horizon=max_horizon)
+
+    def reset(self) -> None:
+        super().reset()
+        self.p_xx = self.p_xv = self.p_vv = None  # covariance entries per coordinate
+
+    def update(self, t: float, pose) -> None:
+        pose = np.asarray(pose, dtype=np.float64)
+        t = float(t)
+        xy = pose[..., :2]
+        if self.xy is None or self.xy.shape != xy.shape:
+            super().update(t, pose)
+            self.p_xx = np.full(xy.shape, self.measurement_noise)
+            self.p_xv = np.zeros(xy.shape)
+            self.p_vv = np.full(xy.shape, 1e6)  # unknown initial velocity
+            return
+
+        valid = self._valid(pose)
+        seen = ~np.isnan(self.xy[..., :1])
+        dt = np.maximum(t - self.t_last, 0.0)
+        q = self.process_noise
+
+        # Predict to t
+        x = self.xy + self.velocity * dt
+        p_xx = self.p_xx + 2 * dt * self.p_xv + dt * dt * self.p_vv + q * dt**3 / 3
+        p_xv = self.p_xv + dt * self.p_vv + q * dt**2 / 2
+        p_vv = self.p_vv + q * dt
+
+        # Correct with the observation
+        s = p_xx + self.measurement_noise
+        k_x = p_xx / s
+        k_v = p_xv / s
+        innovation = xy - x
+        step = valid & seen
+        first = valid & ~seen
+        self.xy = np.where(step, x + k_x * innovation, np.where(first, xy, self.xy))
+        self.velocity = np.where(step, self.velocity + k_v * innovation, self.velocity)
+        self.p_xx = np.where(step, (1 - k_x) * p_xx, np.where(first, self.measurement_noise, self.p_xx))
+        self.p_xv = np.where(step, (1 - k_x) * p_xv, self.p_xv)
+        self.p_vv = np.where(step, p_vv - k_v * p_xv, self.p_vv)
+        self.likelihood = np.where(valid[..., 0], pose[..., 2], self.likelihood)
+        self.t_last = np.where(valid, t, self.t_last)
+        self.last_update = t
+
+
+def make_pose_predictor(kind: str, *, min_confidence: float = 0.0, max_horizon: float = 0.1):
+    """Motion model for ``DLCProcessorSettings.motion_model`` (None for ``"off"``)."""
+    if kind == "constant_velocity":
+        return ConstantVelocityPredictor(min_confidence=min_confidence, max_horizon=max_horizon)
+    if kind == "kalman":
+        return KalmanPredictor(min_confidence=min_confidence, max_horizon=max_horizon)
+    if kind == "off":
+        return None
+    raise ValueError(f"Unknown motion model {kind!r}")
@@ -0,0 +1,488 @@
+"""Run a user processor in a separate process.
+
+Processors normally run inline in ``DLCLive.get_pose`` on the inference thread, so a
+slow or GIL-heavy ``process()`` (pandas, filtering, socket I/O) directly lowers the
+inference rate. :class:`ProcessorHost` is a stand-in processor that only hands each
+pose over to a child process running the real processor:
+
+* poses go through a :class:`~dlclivegui.processors.shared_pose.SharedPosePublisher`
+  ring (one ``float32`` record per pose, no pickling);
+* the queue is bounded by ``queue_size``: a ``free`` semaphore counts slots the child
+  has finished with and a ``ready`` semaphore counts poses waiting. When the queue is
+  full, ``process()`` either drops the pose (``blocking=False``) or waits for the child
+  (``blocking=True``, nothing is lost but inference is throttled to the processor);
+* commands (``start_recording``, ``save``, ...), recording events and a status snapshot
+  (clients, recording state, ...) go over a pipe.
+
+``process()`` returns the pose it was given: the processor's return value is not fed
+back to DLCLive. The child process imports the processor from its scan entry, so only
+processors discovered with :func:`scan_processor_folder` / :func:`scan_processor_package`
+can be hosted.
+"""
+
+# dlclivegui/services/processor_host.py
+from __future__ import annotations
+
+import itertools
+import logging
+import math
+import multiprocessing as mp
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from dlclivegui.processors.processor_utils import _import_processor_class
+from dlclivegui.processors.shared_pose import SharedPosePublisher, SharedPoseReader
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE = 8
+START_TIMEOUT = 30.0  # spawning imports the processor module (and its dependencies)
+STOP_TIMEOUT = 5.0
+CALL_TIMEOUT = 10.0
+STATUS_INTERVAL = 0.25  # seconds between status snapshots sent by the child
+_TIME_SMOOTHING = 0.1
+
+# Child stats layout in the shared array
+_PROCESSED, _ERRORS, _AVG_TIME, _LAST_TIME = range(4)
+
+# Processor attributes mirrored to the parent (read by the GUI status panel)
+_STATUS_ATTRS = ("_recording", "recording", "_vid_recording", "video_recording", "session_name")
+# Only these types are mirrored, so a snapshot always pickles
+_STATUS_TYPES = (bool, int, float, str, type(None))
+
+_names = itertools.count()
+_NO_RESULT = object()
+
+
+@dataclass
+class ProcessorHostStats:
+    """Hand-over and child-side statistics of a :class:`ProcessorHost`."""
+
+    submitted: int = 0
+    dropped: int = 0  # poses not handed over because the queue was full
+    processed: int = 0
+    pending: int = 0
+    errors: int = 0
+    avg_process_time: float = 0.0  # seconds in the child's process(), moving average
+    last_process_time: float = 0.0
+
+
+def processor_spec(scanned_processors: dict, processor_key) -> dict:
+    """Picklable description of a scanned processor, enough for the child to import it."""
+    if processor_key not in scanned_processors:
+        available = ", ".join(scanned_processors.keys())
+        raise ValueError(f"Unknown processor '{processor_key}'. Available: {available}")
+    info = scanned_processors[processor_key]
+    return {
+        "class_name": info["class_name"],
+        "file_path": info.get("file_path", ""),
+        "module": info.get("module"),
+        "name": info.get("name", info["class_name"]),
+    }
+
+
+class ProcessorHost:
+    """
+    Processor proxy that runs the real processor in a child process.
+
+    Args:
+        spec: Result of :func:`processor_spec`.
+        kwargs: Constructor arguments for the processor (must be picklable).
+        queue_size: Max poses handed over but not yet processed.
+        blocking: When the queue is full, wait for the child instead of dropping the pose.
+    """
+
+    def __init__(
+        self,
+        spec: dict,
+        kwargs: dict | None = None,
+        *,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        blocking: bool = False,
+    ):
+        self.spec = dict(spec)
+        self.kwargs = dict(kwargs or {})
+        self.queue_size = max(1, int(queue_size))
+        self.blocking = bool(blocking)
+
+        self._ctx = mp.get_context("spawn")
+        self._process: mp.process.BaseProcess | None = None
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._events_thread: threading.Thread | None = None
+        self._free = None
+        self._ready = None
+        self._shared = None
+        self._publisher: SharedPosePublisher | None = None
+        self._shape_warned = False
+
+        self._submitted = 0
+        self._dropped = 0
+        self._status: dict[str, Any] = {}
+        self._listeners: list = []
+        self._calls: dict[int, list] = {}
+        self._call_ids = itertools.count()
+
+    @classmethod
+    def from_scan(cls, scanned_processors: dict, processor_key, **kwargs) -> ProcessorHost:
+        """Create and start a host for a :func:`scan_processor_folder` entry."""
+        host = cls(processor_spec(scanned_processors, processor_key), **kwargs)
+        host.start()
+        return host
+
+    # ------------------------------------------------------------------ lifecycle
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self, timeout: float = START_TIMEOUT) -> None:
+        """Spawn the child and wait until the processor is constructed (raises on failure)."""
+        if self.running:
+            return
+        self._free = self._ctx.Semaphore(self.queue_size)
+        self._ready = self._ctx.Semaphore(0)
+        self._shared = self._ctx.Array("d", 4, lock=False)
+        parent_conn, child_conn = self._ctx.Pipe()
+        self._process = self._ctx.Process(
+            target=_host_main,
+            args=(self.spec, self.kwargs, child_conn, self._free, self._ready, self._shared),
+            name=f"ProcessorHost-{self.spec['class_name']}",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        error = None
+        try:
+            if not parent_conn.poll(timeout):
+                error = f"processor host did not start within {timeout:.0f}s"
+            else:
+                kind, payload = parent_conn.recv()
+                if kind == "error":
+                    error = payload
+                elif kind == "status":
+                    self._status = payload
+        except (EOFError, OSError) as exc:
+            error = f"processor host exited during startup ({exc})"
+        if error is not None:
+            self.close(timeout=1.0)
+            raise RuntimeError(f"Failed to start processor '{self.spec.get('name')}' in a separate process: {error}")
+
+        self._events_thread = threading.Thread(target=self._events_loop, name="ProcessorHostEvents", daemon=True)
+        self._events_thread.start()
+        logger.info("Processor '%s' running in process %s", self.spec.get("name"), self._process.pid)
+
+    def close(self, timeout: float = STOP_TIMEOUT) -> None:
+        """Let the child process the queued poses, stop the processor and exit."""
+        proc = self._process
+        if proc is not None:
+            self._send(("stop",))
+            proc.join(timeout=timeout)
+            if proc.is_alive():
+                logger.warning("Processor host did not exit in time; terminating it")
+                proc.terminate()
+                proc.join(timeout=1.0)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+        if self._events_thread is not None:
+            self._events_thread.join(timeout=1.0)
+            self._events_thread = None
+        self._conn = None
+        if self._publisher is not None:
+            self._publisher.close()
+            self._publisher = None
+        for holder in list(self._calls.values()):
+            holder[0].set()
+
+    stop = close
+
+    # ------------------------------------------------------------------ processor interface
+
+    def process(self, pose, **kwargs):
+        """Hand ``pose`` to the child (or drop it when the queue is full) and return it unchanged."""
+        if self._free is None or not self.running:
+            return pose
+        arr = np.asarray(pose)
+        publisher = self._publisher
+        if publisher is None:
+            publisher = self._open_channel(arr.shape)
+        elif arr.shape != publisher.shape:
+            if not self._shape_warned:
+                logger.error("Pose shape changed from %s to %s; not forwarding it", publisher.shape, arr.shape)
+                self._shape_warned = True
+            self._dropped += 1
+            return pose
+
+        if not self._acquire_slot():
+            self._dropped += 1
+            return pose
+        publisher.publish(
+            arr,
+            frame_id=self._submitted,
+            timestamp=time.time(),
+            frame_time=kwargs.get("frame_time"),
+            pose_time=kwargs.get("pose_time"),
+            predicted=bool(kwargs.get("predicted", False)),
+        )
+        self._submitted += 1
+        self._ready.release()
+        return pose
+
+    def _acquire_slot(self) -> bool:
+        if not self.blocking:
+            return self._free.acquire(False)
+        while not self._free.acquire(timeout=0.1):
+            if not self.running:
+                return False
+        return True
+
+    def _open_channel(self, shape) -> SharedPosePublisher:
+        # Short name: macOS limits shared-memory names to 31 characters
+        name = f"dlch_{os.getpid()}_{next(_names)}"
+        self._publisher = SharedPosePublisher(name, shape, capacity=self.queue_size)
+        self._send(("attach", name))
+        return self._publisher
+
+    def set_dlc_cfg(self, cfg) -> None:
+        try:
+            self.call("set_dlc_cfg", cfg)
+        except Exception as exc:
+            logger.warning(f"Could not pass the DLC config to the processor host: {exc}")
+
+    def add_recording_listener(self, callback) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_recording_listener(self, callback) -> None:
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def call(self, method: str, *args, timeout: float = CALL_TIMEOUT, **kwargs):
+        """Call ``processor.method(*args, **kwargs)`` in the child and return the result."""
+        call_id = next(self._call_ids)
+        holder = [threading.Event(), _NO_RESULT, None]  # done, result, error
+        self._calls[call_id] = holder
+        try:
+            if not self._send(("call", call_id, method, args, kwargs)):
+                raise RuntimeError("Processor host is not running")
+            if not holder[0].wait(timeout):
+                raise TimeoutError(f"Processor host did not answer '{method}' within {timeout:.0f}s")
+        finally:
+            self._calls.pop(call_id, None)
+        if holder[2] is not None:
+            raise holder[2]
+        if holder[1] is _NO_RESULT:
+            raise RuntimeError("Processor host exited")
+        return holder[1]
+
+    def __getattr__(self, name):
+        # Status attributes mirrored from the child (recording, session_name, ...)
+        status = self.__dict__.get("_status", {})
+        if name in status:
+            return status[name]
+        raise AttributeError(name)
+
+    @property
+    def conns(self) -> tuple:
+        return tuple(self._status.get("conns", ()))
+
+    def get_client_stats(self) -> list[dict]:
+        return list(self._status.get("client_stats", []))
+
+    def host_stats(self) -> ProcessorHostStats:
+        shared = self._shared
+        if shared is None:
+            return ProcessorHostStats(submitted=self._submitted, dropped=self._dropped)
+        processed = int(shared[_PROCESSED])
+        return ProcessorHostStats(
+            submitted=self._submitted,
+            dropped=self._dropped,
+            processed=processed,
+            pending=max(0, self._submitted - processed),
+            errors=int(shared[_ERRORS]),
+            avg_process_time=shared[_AVG_TIME],
+            last_process_time=shared[_LAST_TIME],
+        )
+
+    # ------------------------------------------------------------------ parent side of the pipe
+
+    def _send(self, msg) -> bool:
+        conn = self._conn
+        if conn is None:
+            return False
+        try:
+            with self._send_lock:
+                conn.send(msg)
+            return True
+        except (OSError, ValueError, BrokenPipeError):
+            return False
+
+    def _events_loop(self) -> None:
+        conn = self._conn
+        while True:
+            try:
+                kind, *payload = conn.recv()
+            except (EOFError, OSError, TypeError):
+                break
+            if kind == "status":
+                self._status = payload[0]
+            elif kind == "recording":
+                for callback in list(self._listeners):
+                    try:
+                        callback(*payload)
+                    except Exception:
+                        logger.exception("Recording listener failed")
+            elif kind == "result":
+                call_id, result, error = payload
+                holder = self._calls.get(call_id)
+                if holder is not None:
+                    holder[1], holder[2] = result, error
+                    holder[0].set()
+        for holder in list(self._calls.values()):
+            holder[0].set()
+
+    def __repr__(self):
+        return f"ProcessorHost({self.spec.get('name')!r}, queue_size={self.queue_size}, blocking={self.blocking})"
+
+
+# ---------------------------------------------------------------------- child process
+
+
+def _status_value(value):
+    """Return *value* as a picklable primitive, or raise TypeError."""
+    if callable(getattr(value, "is_set", None)):  # threading.Event / multiprocessing.Event flags
+        return bool(value.is_set())
+    if isinstance(value, _STATUS_TYPES):
+        return value
+    raise TypeError(f"unsupported status value {type(value).__name__}")
+
+
+def _status_snapshot(processor) -> dict:
+    status = {}
+    for attr in _STATUS_ATTRS:
+        try:
+            status[attr] = _status_value(getattr(processor, attr))
+        except Exception:
+            continue
+    conns = getattr(processor, "conns", None)
+    if conns is not None:
+        status["conns"] = [str(c) for c in list(conns)]
+    if hasattr(processor, "get_client_stats"):
+        try:
+            status["client_stats"] = [
+                {key: value for key, value in dict(stats).items() if isinstance(value, _STATUS_TYPES)}
+                for stats in processor.get_client_stats()
+            ]
+        except Exception:
+            pass
+    return status
+
+
+def _host_main(spec, kwargs, conn, free, ready, shared) -> None:
+    send_lock = threading.Lock()
+
+    def send(msg) -> bool:
+        try:
+            with send_lock:
+                conn.send(msg)
+        except (OSError, ValueError):
+            return False
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.exception("Could not send %r message to the parent process", msg[0])
+            return False
+        return True
+
+    try:
+        processor = _import_processor_class(spec)(**kwargs)
+    except Exception as exc:
+        send(("error", f"{type(exc).__name__}: {exc}"))
+        conn.close()
+        return
+
+    if hasattr(processor, "add_recording_listener"):
+        processor.add_recording_listener(lambda *event: send(("recording", *event)))
+    send(("status", _status_snapshot(processor)))
+
+    reader: SharedPoseReader | None = None
+    cursor = 0
+    last_status = time.monotonic()
+    stopping = False
+
+    def handle(msg) -> None:
+        nonlocal reader, stopping
+        kind = msg[0]
+        if kind == "attach":
+            if reader is not None:
+                reader.close()
+            reader = SharedPoseReader(msg[1])
+        elif kind == "call":
+            _, call_id, method, args, call_kwargs = msg
+            try:
+                result, error = getattr(processor, method)(*args, **call_kwargs), None
+            except Exception as exc:
+                result, error = None, exc
+            if not send(("result", call_id, result, error)):  # unpicklable result or exception
+                send(("result", call_id, None, RuntimeError(f"{method}() failed: {error or 'unpicklable result'}")))
+        elif kind == "stop":
+            stopping = True
+
+    try:
+        while True:
+            try:
+                while conn.poll():
+                    handle(conn.recv())
+            except (EOFError, OSError):
+                stopping = True  # parent went away
+
+            if ready.acquire(timeout=0.05):
+                while reader is None:  # the attach message precedes the first pose
+                    handle(conn.recv())
+                msg = reader.read(cursor)
+                cursor += 1
+                if msg is not None:
+                    start = time.perf_counter()
+                    # Like DLCLiveProcessor, only motion-model estimates carry the predicted keyword
+                    extra = {"predicted": True} if msg.predicted else {}
+                    try:
+                        processor.process(
+                            msg.data,
+                            frame_time=None if math.isnan(msg.frame_time) else msg.frame_time,
+                            pose_time=None if math.isnan(msg.pose_time) else msg.pose_time,
+                            **extra,
+                        )
+                    except Exception:
+                        shared[_ERRORS] += 1
+                        logger.exception("Processor failed in host process")
+                    elapsed = time.perf_counter() - start
+                    avg = shared[_AVG_TIME]
+                    shared[_AVG_TIME] = elapsed if shared[_PROCESSED] == 0 else avg + _TIME_SMOOTHING * (elapsed - avg)
+                    shared[_LAST_TIME] = elapsed
+                shared[_PROCESSED] += 1
+                free.release()
+            elif stopping:
+                break
+
+            now = time.monotonic()
+            if now - last_status >= STATUS_INTERVAL:
+                last_status = now
+                send(("status", _status_snapshot(processor)))
+    finally:
+        if hasattr(processor, "stop"):
+            try:
+                processor.stop()
+            except Exception:
+                logger.exception("Processor stop() failed in host process")
+        if reader is not None:
+            reader.close()
+        conn.close()
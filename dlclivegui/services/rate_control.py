@@ -0,0 +1,115 @@
+"""Inference rate control for :class:`~dlclivegui.services.dlc_processor.DLCLiveProcessor`.
+
+When inference is slower than capture, the worker queue (one slot) overflows and
+frames are dropped arbitrarily. :class:`InferenceRateController` makes that choice
+explicit:
+
+* ``target_fps`` caps the submission rate: ``should_submit()`` lets through every
+  k-th frame (with a tolerance for capture jitter) before the frame is even copied;
+* ``target_latency`` sets an end-to-end budget. The worker then always gets the
+  freshest frame (a newer frame replaces the one waiting in the queue), and with
+  ``adapt_resize`` the controller lowers the resize factor while the measured latency
+  is over budget and raises it back (up to the configured ``resize``) when there is
+  headroom.
+
+The controller only decides; the processor applies the decisions and reports them in
+``ProcessorStats``.
+"""
+
+# dlclivegui/services/rate_control.py
+from __future__ import annotations
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+JITTER_TOLERANCE = 0.25  # fraction of the period a frame may arrive early and still be submitted
+LATENCY_SMOOTHING = 0.2
+RESIZE_STEP = 0.9  # multiplicative resize change per decision
+HEADROOM = 0.7  # raise resize again once latency is below this fraction of the budget
+DECISION_WINDOW = 10  # frames between two resize decisions
+
+
+class InferenceRateController:
+    """
+    Decide which frames to submit and at which resize factor.
+
+    Args:
+        target_fps: Max frames per second submitted to inference (None = no cap).
+        target_latency: End-to-end latency budget in seconds (None = none).
+        adapt_resize: Adjust :attr:`resize` to meet ``target_latency``.
+        resize: Configured (and maximum) resize factor.
+        min_resize: Lowest resize factor ``adapt_resize`` may use.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_fps: float | None = None,
+        target_latency: float | None = None,
+        adapt_resize: bool = False,
+        resize: float = 1.0,
+        min_resize: float = 0.25,
+    ):
+        self.period = 1.0 / target_fps if target_fps else 0.0
+        self.target_latency = target_latency
+        self.adapt_resize = bool(adapt_resize and target_latency)
+        self.max_resize = float(resize)
+        self.min_resize = min(float(min_resize), self.max_resize)
+        self.resize = self.max_resize
+
+        self.skipped = 0
+        self.resize_changes = 0
+        self.last_decision = ""
+        self._next_due = 0.0
+        self._latency_ema: float | None = None
+        self._since_decision = 0
+
+    @property
+    def keep_latest(self) -> bool:
+        """Replace a waiting frame by a newer one instead of dropping the newer one."""
+        return self.target_latency is not None
+
+    @property
+    def latency_estimate(self) -> float:
+        return self._latency_ema or 0.0
+
+    def should_submit(self, now: float) -> bool:
+        """Called for every captured frame; False means skip it (counted in :attr:`skipped`)."""
+        if not self.period:
+            return True
+        if now < self._next_due - JITTER_TOLERANCE * self.period:
+            self.skipped += 1
+            return False
+        if now - self._next_due < self.period:
+            self._next_due += self.period  # stay on the schedule
+        else:
+            self._next_due = now + self.period  # fell behind (or first frame): restart from now
+        return True
+
+    def record_latency(self, latency: float) -> None:
+        """Feed the end-to-end latency of a processed frame; may change :attr:`resize`."""
+        if self._latency_ema is None:
+            self._latency_ema = latency
+        else:
+            self._latency_ema += LATENCY_SMOOTHING * (latency - self._latency_ema)
+        if not self.adapt_resize:
+            return
+        self._since_decision += 1
+        if self._since_decision < DECISION_WINDOW:
+            return
+
+        old = self.resize
+        if self._latency_ema > self.target_latency:
+            new = max(self.min_resize, old * RESIZE_STEP)
+        elif self._latency_ema < HEADROOM * self.target_latency:
+            new = min(self.max_resize, old / RESIZE_STEP)
+        else:
+            new = old
+        if new != old:
+            self.resize = new
+            self.resize_changes += 1
+            self.last_decision = f"resize {old:.2f} -> {new:.2f} (latency {self._latency_ema * 1000:.0f} ms)"
+            logger.debug("Rate control: %s", self.last_decision)
+            self._since_decision = 0
+            self._latency_ema = None  # measure the new setting from scratch
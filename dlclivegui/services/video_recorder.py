@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import queue
 import threading
 import time
@@ -24,6 +25,9 @@ except ImportError:  # pragma: no cover - handled at runtime
 logger = logging.getLogger(__name__)
 
 STOP_JOIN_TIMEOUT = 5.0  # seconds
+SPILL_HIGH_WATERMARK = 0.8  # queue fill ratio above which new frames spill to disk
+DROP_LOG_INTERVAL = 1.0  # seconds between "queue full" warnings
+SPILL_MAX_UNWRITTEN = 64  # spilled frames waiting in memory for the spill thread before new ones are refused
 
 
 @dataclass
@@ -38,13 +42,240 @@ class RecorderStats:
     last_latency: float = 0.0
     write_fps: float = 0.0
     buffer_seconds: float = 0.0
+    enqueue_fps: float = 0.0
+    buffer_bytes: int = 0
+    # Backpressure: "normal", "spilling" (overflow goes to disk) or "dropping"
+    backpressure: str = "normal"
+    spilled_frames: int = 0
+    spill_pending: int = 0
+    spill_events: int = 0
 
 
 _SENTINEL = object()
 
 
+class FrameRingBuffer:
+    """Bounded in-memory ring of recent ``(frame, timestamp)`` pairs.
+
+    Used as a pre-trigger buffer: while no recording is active, frames are
+    appended here so that when recording starts the preceding window can be
+    flushed into the file first. The ring is bounded both by duration (based
+    on the frame timestamps) and by a byte budget; the oldest frames are
+    evicted first. Frames are stored by reference, callers must not mutate
+    them in place afterwards.
+    """
+
+    def __init__(self, max_seconds: float, max_bytes: int):
+        self._max_seconds = max(0.0, float(max_seconds))
+        self._max_bytes = max(0, int(max_bytes))
+        self._frames: deque[tuple[np.ndarray, float]] = deque()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_seconds(self) -> float:
+        return self._max_seconds
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return self._nbytes
+
+    @property
+    def duration(self) -> float:
+        """Time span covered by the buffered frames, in seconds."""
+        with self._lock:
+            if len(self._frames) < 2:
+                return 0.0
+            return self._frames[-1][1] - self._frames[0][1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+    def append(self, frame: np.ndarray, timestamp: float) -> None:
+        size = int(frame.nbytes)
+        if size > self._max_bytes or self._max_seconds <= 0.0:
+            return
+        with self._lock:
+            self._frames.append((frame, float(timestamp)))
+            self._nbytes += size
+            horizon = float(timestamp) - self._max_seconds
+            while self._frames and (self._nbytes > self._max_bytes or self._frames[0][1] < horizon):
+                old, _ = self._frames.popleft()
+                self._nbytes -= int(old.nbytes)
+
+    def drain(self) -> list[tuple[np.ndarray, float]]:
+        """Remove and return all buffered frames, oldest first."""
+        with self._lock:
+            items = list(self._frames)
+            self._frames.clear()
+            self._nbytes = 0
+        return items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._nbytes = 0
+
+
+class _SpillRecord:
+    __slots__ = ("offset", "shape", "dtype", "timestamp", "frame", "written", "cancelled")
+
+    def __init__(self, offset: int, frame: np.ndarray, timestamp: float):
+        self.offset = offset
+        self.shape = frame.shape
+        self.dtype = frame.dtype
+        self.timestamp = float(timestamp)
+        self.frame: np.ndarray | None = frame  # held until the spill thread has written it
+        self.written = False
+        self.cancelled = False  # popped before it reached the disk
+
+
+class _FrameSpill:
+    """Append-only raw overflow file for frames the encoder could not keep up with.
+
+    :meth:`push` only reserves space and hands the frame to a dedicated spill thread,
+    which writes it to disk; the caller (the camera/GUI thread) never waits for the
+    disk. At most ``max_unwritten`` frames wait in memory for that thread, beyond that
+    ``push`` refuses frames. An in-memory index keeps shape, dtype and timestamp so
+    frames can be read back in order; a frame popped before it was written is returned
+    from memory. Space is reused from the start of the file whenever it has been fully
+    drained, and the file is removed on :meth:`close`.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, max_unwritten: int = SPILL_MAX_UNWRITTEN):
+        self._path = path
+        self._max_bytes = max(0, int(max_bytes))
+        self._max_unwritten = max(1, int(max_unwritten))
+        self._lock = threading.Lock()  # index and offsets; never held during disk I/O
+        self._file_lock = threading.Lock()
+        self._wfile: Any | None = None
+        self._rfile: Any | None = None
+        self._index: deque[_SpillRecord] = deque()
+        self._write_offset = 0
+        self._unwritten = 0
+        self._reading = 0
+        self._pending_writes: queue.Queue[_SpillRecord | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._index)
+
+    def push(self, frame: np.ndarray, timestamp: float) -> bool:
+        """Queue ``frame`` for the spill file; returns False if the byte budget (or the write backlog) is full."""
+        with self._lock:
+            size = int(frame.nbytes)
+            if self._write_offset + size > self._max_bytes or self._unwritten >= self._max_unwritten:
+                return False
+            record = _SpillRecord(self._write_offset, frame, timestamp)
+            self._index.append(record)
+            self._write_offset += size
+            self._unwritten += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._spill_loop, name="VideoRecorderSpill", daemon=True)
+                self._thread.start()
+        self._pending_writes.put(record)
+        return True
+
+    def pop(self) -> tuple[np.ndarray, float] | None:
+        with self._lock:
+            if not self._index:
+                return None
+            record = self._index.popleft()
+            if not record.written:
+                record.cancelled = True
+                self._unwritten -= 1
+                self._reset_if_drained_locked()
+                return record.frame, record.timestamp
+            self._reading += 1
+        try:
+            frame = np.empty(record.shape, dtype=record.dtype)
+            with self._file_lock:
+                self._rfile.seek(record.offset)
+                self._rfile.readinto(memoryview(frame).cast("B"))
+        finally:
+            with self._lock:
+                self._reading -= 1
+                self._reset_if_drained_locked()
+        return frame, record.timestamp
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is not None:
+            self._pending_writes.put(None)
+            thread.join(timeout=STOP_JOIN_TIMEOUT)
+        with self._lock:
+            self._thread = None
+            self._index.clear()
+            self._write_offset = 0
+            self._unwritten = 0
+        with self._file_lock:
+            for handle in (self._wfile, self._rfile):
+                if handle is not None:
+                    try:
+                        handle.close()
+                    except Exception:
+                        pass
+            self._wfile = self._rfile = None
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Failed to remove spill file %s", self._path)
+
+    # ------------------------------------------------------------------ internals
+
+    def _reset_if_drained_locked(self) -> None:
+        # Nothing left to read: later frames can overwrite the file from the start
+        if not self._index and not self._reading:
+            self._write_offset = 0
+
+    def _spill_loop(self) -> None:
+        while True:
+            record = self._pending_writes.get()
+            if record is None:
+                return
+            with self._lock:
+                if record.cancelled:
+                    continue
+                frame = record.frame
+            try:
+                with self._file_lock:
+                    if self._wfile is None:
+                        self._path.parent.mkdir(parents=True, exist_ok=True)
+                        self._wfile = open(self._path, "w+b")
+                        self._rfile = open(self._path, "rb")
+                    self._wfile.seek(record.offset)
+                    self._wfile.write(memoryview(frame).cast("B"))
+                    self._wfile.flush()  # make it visible to the read handle
+            except Exception:
+                # Keep the frame in memory; the writer thread gets it from there
+                logger.exception("Failed to write spilled frame to %s", self._path)
+                continue
+            with self._lock:
+                if not record.cancelled:
+                    record.written = True
+                    record.frame = None
+                    self._unwritten -= 1
+
+
 class VideoRecorder:
-    """Thin wrapper around :class:`vidgear.gears.WriteGear`."""
+    """Thin wrapper around :class:`vidgear.gears.WriteGear`.
+
+    Backpressure: when ``spill_max_bytes`` > 0 and the queue fills beyond
+    ``SPILL_HIGH_WATERMARK``, new frames are spilled to a raw overflow file next
+    to the output instead of being dropped; a dedicated spill thread does the disk
+    writes, so :meth:`write` never waits for the disk. The writer thread encodes the queued
+    frames first and then the spilled ones, so frame order is preserved. Frames
+    are only dropped once the spill budget is exhausted (or spilling is disabled).
+    """
 
     def __init__(
         self,
@@ -54,6 +285,7 @@ class VideoRecorder:
         codec: str = "libx264",
         crf: int = 23,
         buffer_size: int = 240,
+        spill_max_bytes: int = 0,
     ):
         # Config
         self._output = Path(output)
@@ -63,6 +295,9 @@ class VideoRecorder:
         self._codec = codec
         self._crf = int(crf)
         self._buffer_size = max(1, int(buffer_size))
+        self._spill_max_bytes = max(0, int(spill_max_bytes))
+        self._spill_threshold = max(1, int(self._buffer_size * SPILL_HIGH_WATERMARK))
+        self._spill: _FrameSpill | None = None
         # Worker state
         self._queue: queue.Queue[Any] | None = None
         self._writer_thread: threading.Thread | None = None
@@ -77,9 +312,16 @@ class VideoRecorder:
         self._total_latency = 0.0
         self._last_latency = 0.0
         self._written_times: deque[float] = deque(maxlen=600)
+        self._enqueue_times: deque[float] = deque(maxlen=600)
+        self._frame_nbytes = 0
         self._encode_error: Exception | None = None
         self._last_log_time = 0.0
         self._frame_timestamps: list[float] = []
+        self._spilled_frames = 0
+        self._spill_events = 0
+        self._last_enqueue_mode = "normal"
+        self._drops_since_log = 0
+        self._last_drop_log_time = 0.0
 
     @property
     def is_running(self) -> bool:
@@ -131,7 +373,15 @@ class VideoRecorder:
             self._total_latency = 0.0
             self._last_latency = 0.0
             self._written_times.clear()
+            self._enqueue_times.clear()
+            self._frame_nbytes = 0
             self._frame_timestamps.clear()
+            self._spilled_frames = 0
+            self._spill_events = 0
+            self._last_enqueue_mode = "normal"
+            self._drops_since_log = 0
+            if self._spill_max_bytes > 0:
+                self._spill = _FrameSpill(self._output.with_name(self._output.name + ".spill"), self._spill_max_bytes)
             self._encode_error = None
             self._stop_event.clear()
             self._writer_thread = threading.Thread(
@@ -193,22 +443,58 @@ class VideoRecorder:
                     )
                 return False
 
+        spill = self._spill
+        if spill is not None and (spill.pending or q.qsize() >= self._spill_threshold):
+            # While frames are pending on disk, new frames must follow them to keep order.
+            must_spill = spill.pending > 0
+            if spill.push(frame, timestamp):
+                with self._stats_lock:
+                    self._note_enqueued_locked(frame)
+                    self._spilled_frames += 1
+                    if self._last_enqueue_mode != "spilling":
+                        self._spill_events += 1
+                        logger.warning(
+                            "Video recorder queue at %d/%d; spilling frames to disk", q.qsize(), self._buffer_size
+                        )
+                    self._last_enqueue_mode = "spilling"
+                return True
+            if must_spill:
+                self._record_drop(q)
+                return False
+
         try:
             q.put((frame, timestamp), block=False)
         except queue.Full:
-            with self._stats_lock:
-                self._dropped_frames += 1
-            queue_size = q.qsize()
-            logger.warning(
-                "Video recorder queue full; dropping frame. queue=%d buffer=%d",
-                queue_size,
-                self._buffer_size,
-            )
+            self._record_drop(q)
             return False
         with self._stats_lock:
-            self._frames_enqueued += 1
+            self._note_enqueued_locked(frame)
+            self._last_enqueue_mode = "normal"
         return True
 
+    def _note_enqueued_locked(self, frame: np.ndarray) -> None:
+        self._frames_enqueued += 1
+        self._enqueue_times.append(time.perf_counter())
+        self._frame_nbytes = int(frame.nbytes)
+
+    def _record_drop(self, q: queue.Queue) -> None:
+        now = time.perf_counter()
+        with self._stats_lock:
+            self._dropped_frames += 1
+            self._drops_since_log += 1
+            self._last_enqueue_mode = "dropping"
+            if now - self._last_drop_log_time < DROP_LOG_INTERVAL:
+                return
+            dropped = self._drops_since_log
+            self._drops_since_log = 0
+            self._last_drop_log_time = now
+        logger.warning(
+            "Video recorder queue full; dropped %d frame(s). queue=%d buffer=%d",
+            dropped,
+            q.qsize(),
+            self._buffer_size,
+        )
+
     def stop(self) -> None:
         with self._lifecycle_lock:
             already_stopped = (self._writer is None) and (not self.is_running)
@@ -236,7 +522,7 @@ class VideoRecorder:
                 pass
 
         if t is not None:
-            t.join(timeout=STOP_JOIN_TIMEOUT)
+            t.join(timeout=STOP_JOIN_TIMEOUT + self._pending_spill_seconds())
             if t.is_alive():
                 with self._stats_lock:
                     self._encode_error = RuntimeError(
@@ -256,6 +542,7 @@ class VideoRecorder:
                 return
 
         self._save_timestamps()
+        self._close_spill()
 
         with self._lifecycle_lock:
             self._writer = None
@@ -282,7 +569,18 @@ class VideoRecorder:
             avg_latency = self._total_latency / self._frames_written if self._frames_written else 0.0
             last_latency = self._last_latency
             write_fps = self._compute_write_fps_locked()
-        buffer_seconds = queue_size * avg_latency if avg_latency > 0 else 0.0
+            enqueue_fps = self._compute_enqueue_fps_locked()
+            frame_nbytes = self._frame_nbytes
+            spilled = self._spilled_frames
+            spill_events = self._spill_events
+            mode = self._last_enqueue_mode
+        spill = self._spill
+        spill_pending = spill.pending if spill is not None else 0
+        if mode == "normal" and spill_pending:
+            mode = "spilling"
+        # Footage held in the buffers, based on the measured input rate (falls back to the nominal rate)
+        input_fps = enqueue_fps or (float(self._frame_rate) if self._frame_rate else 0.0)
+        buffer_seconds = (queue_size + spill_pending) / input_fps if input_fps > 0 else 0.0
         return RecorderStats(
             frames_enqueued=frames_enqueued,
             frames_written=frames_written,
@@ -292,6 +590,12 @@ class VideoRecorder:
             last_latency=last_latency,
             write_fps=write_fps,
             buffer_seconds=buffer_seconds,
+            enqueue_fps=enqueue_fps,
+            buffer_bytes=queue_size * frame_nbytes,
+            backpressure=mode,
+            spilled_frames=spilled,
+            spill_pending=spill_pending,
+            spill_events=spill_events,
         )
 
     def _writer_loop(self) -> None:
@@ -304,9 +608,19 @@ class VideoRecorder:
 
         try:
             while True:
+                spill = self._spill
                 try:
-                    item = q.get(timeout=0.1)
+                    if spill is not None and spill.pending:
+                        item = q.get_nowait()
+                    else:
+                        item = q.get(timeout=0.1)
                 except queue.Empty:
+                    # Queue drained: catch up on frames that overflowed to disk
+                    spilled = spill.pop() if spill is not None else None
+                    if spilled is not None:
+                        if not self._encode_frame(*spilled):
+                            break
+                        continue
                     if self._stop_event.is_set():
                         break
                     continue
@@ -319,35 +633,11 @@ class VideoRecorder:
 
                 try:
                     if item is _SENTINEL:
+                        self._drain_spill()
+                        break
+                    frame, timestamp = item
+                    if not self._encode_frame(frame, timestamp):
                         break
-                    else:
-                        frame, timestamp = item
-                        start = time.perf_counter()
-
-                        try:
-                            writer = self._writer
-                            if writer is None:
-                                raise RuntimeError("WriteGear writer is not initialized")
-                            writer.write(frame)
-                        except Exception as exc:
-                            with self._stats_lock:
-                                self._encode_error = exc
-                            logger.exception("Video encoding failed while writing frame", exc_info=exc)
-                            self._stop_event.set()
-                            break
-                        else:
-                            elapsed = time.perf_counter() - start
-                            now = time.perf_counter()
-                            with self._stats_lock:
-                                self._frames_written += 1
-                                self._total_latency += elapsed
-                                self._last_latency = elapsed
-                                self._written_times.append(now)
-                                self._frame_timestamps.append(timestamp)
-                                if now - self._last_log_time >= 1.0:
-                                    self._compute_write_fps_locked()
-                                    self._last_log_time = now
-
                 finally:
                     # Ensure queue accounting is correct for every item pulled from q
                     try:
@@ -359,13 +649,62 @@ class VideoRecorder:
         finally:
             self._finalize_writer()
 
+    def _encode_frame(self, frame: np.ndarray, timestamp: float) -> bool:
+        start = time.perf_counter()
+        try:
+            writer = self._writer
+            if writer is None:
+                raise RuntimeError("WriteGear writer is not initialized")
+            writer.write(frame)
+        except Exception as exc:
+            with self._stats_lock:
+                self._encode_error = exc
+            logger.exception("Video encoding failed while writing frame", exc_info=exc)
+            self._stop_event.set()
+            return False
+        elapsed = time.perf_counter() - start
+        now = time.perf_counter()
+        with self._stats_lock:
+            self._frames_written += 1
+            self._total_latency += elapsed
+            self._last_latency = elapsed
+            self._written_times.append(now)
+            self._frame_timestamps.append(timestamp)
+            if now - self._last_log_time >= 1.0:
+                self._compute_write_fps_locked()
+                self._last_log_time = now
+        return True
+
+    def _drain_spill(self) -> None:
+        spill = self._spill
+        if spill is None or not spill.pending:
+            return
+        logger.info("Encoding %d spilled frame(s) before closing %s", spill.pending, self._output.name)
+        while True:
+            item = spill.pop()
+            if item is None or not self._encode_frame(*item):
+                return
+
+    def _pending_spill_seconds(self) -> float:
+        spill = self._spill
+        if spill is None or not spill.pending:
+            return 0.0
+        with self._stats_lock:
+            avg_latency = self._total_latency / self._frames_written if self._frames_written else 0.0
+        return spill.pending * max(avg_latency, 0.01)
+
+    def _close_spill(self) -> None:
+        spill = self._spill
+        self._spill = None
+        if spill is not None:
+            spill.close()
+
     def _finalize_writer(self) -> None:
         writer = self._writer
         self._writer = None
         if writer is not None:
             try:
-                writer.close()
-                time.sleep(0.2)  # give some time to finalize
+                writer.close()  # waits for ffmpeg to flush and exit
             except Exception:
                 logger.exception("Failed to close WriteGear during finalisation")
 
@@ -377,6 +716,14 @@ class VideoRecorder:
             return 0.0
         return (len(self._written_times) - 1) / duration
 
+    def _compute_enqueue_fps_locked(self) -> float:
+        if len(self._enqueue_times) < 2:
+            return 0.0
+        duration = self._enqueue_times[-1] - self._enqueue_times[0]
+        if duration <= 0:
+            return 0.0
+        return (len(self._enqueue_times) - 1) / duration
+
     def _current_error(self) -> Exception | None:
         with self._stats_lock:
             return self._encode_error
@@ -9,12 +9,16 @@ def format_recorder_stats(stats: RecorderStats) -> str:
     latency_ms = stats.last_latency * 1000.0
     avg_ms = stats.average_latency * 1000.0
     buffer_ms = stats.buffer_seconds * 1000.0
+    spill = ""
+    spilled = getattr(stats, "spilled_frames", 0)
+    if spilled:
+        spill = f" | spilled {spilled} ({getattr(stats, 'spill_pending', 0)} pending, {stats.backpressure})"
     return (
         f"{stats.frames_written}/{stats.frames_enqueued} frames | "
         f"write {stats.write_fps:.1f} fps | "
         f"latency {latency_ms:.1f} ms (avg {avg_ms:.1f} ms) | "
         f"queue {stats.queue_size} (~{buffer_ms:.0f} ms) | "
-        f"dropped {stats.dropped_frames}"
+        f"dropped {stats.dropped_frames}{spill}"
     )
 
 
@@ -32,14 +36,41 @@ def format_dlc_stats(stats: ProcessorStats) -> str:
             gpu_ms = stats.avg_gpu_inference_time * 1000.0
             proc_ms = stats.avg_processor_overhead * 1000.0
             gpu_breakdown = f" (GPU:{gpu_ms:.1f}ms+proc:{proc_ms:.1f}ms)"
+        prep_ms = getattr(stats, "avg_preprocess_time", 0.0) * 1000.0
+        prep = f"prep:{prep_ms:.1f}ms " if prep_ms > 0 else ""
+        ipc_ms = getattr(stats, "avg_ipc_overhead", 0.0) * 1000.0
+        ipc = f" ipc:{ipc_ms:.1f}ms" if ipc_ms > 0 else ""
         profile = (
-            f"\n[Profile] inf:{inf_ms:.1f}ms{gpu_breakdown} "
-            f"queue:{queue_ms:.1f}ms signal:{signal_ms:.1f}ms total:{total_ms:.1f}ms"
+            f"\n[Profile] {prep}inf:{inf_ms:.1f}ms{gpu_breakdown} "
+            f"queue:{queue_ms:.1f}ms signal:{signal_ms:.1f}ms{ipc} total:{total_ms:.1f}ms"
         )
 
+    host = ""
+    if getattr(stats, "processor_host_active", False):
+        host_ms = stats.avg_processor_host_time * 1000.0
+        host = (
+            f" | processor {host_ms:.1f} ms (pending {stats.processor_host_pending},"
+            f" dropped {stats.processor_host_dropped})"
+        )
+    predicted = ""
+    if getattr(stats, "frames_predicted", 0):
+        predicted = f" | predicted {stats.frames_predicted}"
+    rate = ""
+    if getattr(stats, "rate_control_active", False):
+        rate = f" | skipped {stats.frames_skipped}, resize {stats.current_resize:.2f}"
     return (
         f"{stats.frames_processed}/{stats.frames_enqueued} frames | "
         f"inference {stats.processing_fps:.1f} fps | "
         f"latency {latency_ms:.1f} ms (avg {avg_ms:.1f} ms) | "
-        f"queue {stats.queue_size} | dropped {stats.frames_dropped}{profile}"
+        f"queue {stats.queue_size} | dropped {stats.frames_dropped}{rate}{predicted}{host}{profile}"
+    )
+
+
+def format_model_stats(model_id: str, stats: ProcessorStats) -> str:
+    """One-line summary of an additional model (see services/multi_model.py)."""
+    return (
+        f"[{model_id}] {stats.frames_processed}/{stats.frames_enqueued} frames | "
+        f"inference {stats.processing_fps:.1f} fps | "
+        f"latency {stats.last_latency * 1000.0:.1f} ms (avg {stats.average_latency * 1000.0:.1f} ms) | "
+        f"dropped {stats.frames_dropped}"
     )
@@ -0,0 +1,64 @@
+"""Benchmark the vectorized One-Euro filter against one scalar filter per signal. For development/testing."""
+
+# scripts/bench_one_euro.py
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from dlclivegui.processors.one_euro import OneEuroFilter, OneEuroFilterArray
+
+
+def _time_per_frame(step, frames: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(frames):
+        step(i)
+    return (time.perf_counter() - t0) / frames
+
+
+def main() -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--animals", type=int, default=3, help="Number of animals (N)")
+    p.add_argument("--keypoints", type=int, default=30, help="Keypoints per animal (K)")
+    p.add_argument("--frames", type=int, default=2000, help="Frames to filter")
+    p.add_argument("--fps", type=float, default=60.0, help="Simulated frame rate")
+    args = p.parse_args()
+
+    rng = np.random.default_rng(0)
+    shape = (args.animals, args.keypoints, 2)
+    poses = np.cumsum(rng.normal(0, 1, (args.frames,) + shape), axis=0) + 300
+    times = np.arange(args.frames) / args.fps
+    kwargs = {"min_cutoff": 1.0, "beta": 0.02, "d_cutoff": 1.0}
+
+    scalar = np.empty(shape, dtype=object)
+    for idx in np.ndindex(shape):
+        scalar[idx] = OneEuroFilter(times[0], poses[0][idx], **kwargs)
+    scalar_out = np.empty(shape)
+
+    def scalar_step(i):
+        pose = poses[i]
+        for idx in np.ndindex(shape):
+            scalar_out[idx] = scalar[idx](times[i], pose[idx])
+
+    vectorized = OneEuroFilterArray(**kwargs)
+    vectorized(times[0], poses[0])
+    vector_out = []
+
+    def vector_step(i):
+        vector_out.append(vectorized(times[i], poses[i]))
+
+    t_scalar = _time_per_frame(scalar_step, args.frames)
+    t_vector = _time_per_frame(vector_step, args.frames)
+    max_diff = float(np.max(np.abs(scalar_out - vector_out[-1])))
+
+    print(f"{np.prod(shape)} signals ({args.animals} x {args.keypoints} x 2), {args.frames} frames")
+    print(f"scalar filters:    {t_scalar * 1e6:9.1f} us/frame")
+    print(f"vectorized filter: {t_vector * 1e6:9.1f} us/frame  ({t_scalar / t_vector:.0f}x faster)")
+    print(f"max |difference| on last frame: {max_diff:.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
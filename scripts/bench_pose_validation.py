@@ -0,0 +1,64 @@
+"""Benchmark per-frame pose validation: full check on every frame vs. PoseValidator's fast path. For development."""
+
+# scripts/bench_pose_validation.py
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from dlclivegui.services.dlc_processor import PoseValidator, validate_pose_array
+
+
+def _time_per_frame(step, poses) -> float:
+    t0 = time.perf_counter()
+    for pose in poses:
+        step(pose)
+    return (time.perf_counter() - t0) / len(poses)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--animals", type=int, default=1, help="Number of animals (1 = single-animal (K, 3) output)")
+    p.add_argument("--keypoints", type=int, default=30, help="Keypoints per animal")
+    p.add_argument("--frames", type=int, default=20000, help="Poses to validate")
+    p.add_argument("--nan-every", type=int, default=50, help="Put a NaN keypoint in every n-th pose (0 = never)")
+    args = p.parse_args()
+
+    rng = np.random.default_rng(0)
+    shape = (args.keypoints, 3) if args.animals == 1 else (args.animals, args.keypoints, 3)
+    poses = [rng.random(shape, dtype=np.float32) * 500 for _ in range(256)]
+    clean = [poses[i % len(poses)] for i in range(args.frames)]
+    dirty = list(clean)
+    if args.nan_every:
+        for i in range(0, args.frames, args.nan_every):
+            pose = dirty[i].copy()
+            pose.reshape(-1, 3)[0, 0] = np.nan
+            dirty[i] = pose
+
+    def full(pose):
+        try:
+            validate_pose_array(pose)
+        except ValueError:
+            pass  # the frame would be lost
+
+    validator = PoseValidator()
+    t_full = _time_per_frame(full, clean)
+    t_fast = _time_per_frame(validator, clean)
+    t_full_nan = _time_per_frame(full, dirty)
+    t_fast_nan = _time_per_frame(validator, dirty)
+
+    print(f"pose shape {shape}, {args.frames} frames")
+    print(f"full validation:     {t_full * 1e6:7.2f} us/frame")
+    print(f"PoseValidator:       {t_fast * 1e6:7.2f} us/frame  ({t_full / t_fast:.1f}x faster)")
+    print(
+        f"with NaN every {args.nan_every} frames: full {t_full_nan * 1e6:.2f} us/frame (frames rejected), "
+        f"PoseValidator {t_fast_nan * 1e6:.2f} us/frame ({validator.masked_keypoints} keypoints masked)"
+    )
+    print(f"full checks run by PoseValidator: {validator.full_checks}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -126,6 +126,12 @@ def register_fake_backend_session():
         unregister_backend("fake")
 
 
+@pytest.fixture(autouse=True)
+def isolated_processor_discovery_cache(tmp_path, monkeypatch):
+    """Keep the processor discovery cache out of the user's cache directory."""
+    monkeypatch.setenv("DLCLIVEGUI_CACHE_DIR", str(tmp_path / "cache"))
+
+
 @pytest.fixture(scope="session")
 def fake_backend_cls(register_fake_backend_session):
     """Return the registered fake backend class."""
@@ -355,6 +361,7 @@ class FakeVideoRecorder:
         self.frame_rate = frame_rate
         self.codec = codec
         self.crf = crf
+        self.kwargs = kwargs
         self.started = False
         self.stopped = False
         self.write_calls = []
@@ -4,6 +4,7 @@ from __future__ import annotations
 import importlib
 import pickle
 import sys
+import time
 import types
 from pathlib import Path
 
@@ -115,6 +116,39 @@ def test_base_recording_flags_and_session_name(socket_mod):
         proc.stop()
 
 
+def test_recording_listeners_receive_state_changes_with_step_and_frame_time(socket_mod):
+    BaseProcessorSocket = socket_mod.BaseProcessorSocket
+    proc = BaseProcessorSocket(bind=None)
+    events = []
+
+    def listener(active, step, session_name, frame_time):
+        events.append((active, step, session_name, frame_time))
+
+    def broken_listener(*_args):
+        raise RuntimeError("listener failure must not break the processor")
+
+    proc.add_recording_listener(broken_listener)
+    proc.add_recording_listener(listener)
+    proc.add_recording_listener(listener)  # idempotent
+    proc.session_name = "evt"
+
+    for i in range(3):
+        proc.process(_mk_pose(), frame_time=100.0 + i)
+    proc._handle_client_message({"cmd": "start_recording"})
+    for i in range(2):
+        proc.process(_mk_pose(), frame_time=200.0 + i)
+    proc._handle_client_message({"cmd": "stop_recording"})
+    proc._handle_client_message({"cmd": "stop_recording"})  # no change, no event
+
+    # step restarts with recording; frame_time is the camera clock of the last pose
+    assert events == [(True, 3, "evt", 102.0), (False, 2, "evt", 201.0)]
+
+    proc.remove_recording_listener(listener)
+    proc.start_recording()
+    assert len(events) == 2
+    proc.stop()
+
+
 def test_base_process_without_and_with_recording(socket_mod):
     """
     BaseProcessorSocket.process() should:
@@ -305,7 +339,7 @@ def test_base_broadcast_handles_bad_connections(socket_mod):
 
             self._socket = Sock()
 
-        def send(self, _payload):
+        def send_bytes(self, _data):
             raise RuntimeError("send fail")
 
         def close(self):
@@ -325,12 +359,246 @@ def test_base_broadcast_handles_bad_connections(socket_mod):
         proc.conns.add(bad)
         # Should not raise
         proc.broadcast(["ts", "payload"])
-        # bad conn should be discarded
+        # bad conn should be discarded by the sender thread
+        deadline = time.time() + 2.0
+        while bad in proc.conns and time.time() < deadline:
+            time.sleep(0.01)
         assert bad not in proc.conns
     finally:
         proc.stop()
 
 
+def test_broadcast_pickles_once_and_slow_clients_do_not_block(socket_mod, monkeypatch):
+    """
+    The payload is serialized once regardless of client count, broadcast() returns
+    immediately even if a client blocks, and a stuck client only loses its own oldest payloads.
+    """
+    import threading
+
+    class RecordingConn:
+        def __init__(self, block=None):
+            self.received = []
+            self.block = block
+
+        def send_bytes(self, data):
+            if self.block is not None:
+                self.block.wait(timeout=5.0)
+            self.received.append(pickle.loads(data))
+
+        def close(self):
+            pass
+
+    BaseProcessorSocket = socket_mod.BaseProcessorSocket
+    proc = BaseProcessorSocket(bind=None, client_queue_size=4)
+
+    dumps_calls = []
+    real_dumps = socket_mod.pickle.dumps
+    monkeypatch.setattr(
+        socket_mod.pickle, "dumps", lambda obj, *a, **kw: dumps_calls.append(1) or real_dumps(obj, *a, **kw)
+    )
+
+    release = threading.Event()
+    fast = [RecordingConn() for _ in range(4)]
+    slow = RecordingConn(block=release)
+    try:
+        proc.conns.update(fast)
+        proc.broadcast(["first", 0])
+        # Let the sender thread pick up the first payload for everyone
+        deadline = time.time() + 2.0
+        while not all(c.received for c in fast) and time.time() < deadline:
+            time.sleep(0.01)
+
+        proc.conns.add(slow)
+        t0 = time.perf_counter()
+        for i in range(1, 20):
+            proc.broadcast(["ts", i])
+        assert time.perf_counter() - t0 < 0.5
+        assert len(dumps_calls) == 20
+
+        release.set()
+        deadline = time.time() + 2.0
+        while len(slow.received) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        # The slow client keeps only the most recent payloads
+        assert slow.received[-1] == ["ts", 19]
+        assert proc.dropped_payloads.get(slow, 0) > 0
+    finally:
+        release.set()
+        proc.stop()
+
+
+def test_stalled_client_does_not_delay_other_clients(socket_mod):
+    """A client that stops reading (send_bytes blocks) must not hold back delivery to live clients."""
+    import threading
+
+    class Conn:
+        def __init__(self, stall=None):
+            self.received = []
+            self.stall = stall
+
+        def send_bytes(self, data):
+            if self.stall is not None:
+                self.stall.wait(timeout=5.0)  # socket buffer full
+            self.received.append(pickle.loads(data))
+
+        def close(self):
+            pass
+
+    proc = socket_mod.BaseProcessorSocket(bind=None, client_queue_size=4)
+    unstall = threading.Event()
+    stalled = Conn(stall=unstall)
+    live = Conn()
+    try:
+        proc.conns.update([stalled, live])
+        for i in range(50):
+            proc.broadcast(["ts", i])
+            time.sleep(0.002)
+        assert _wait_for(lambda: live.received and live.received[-1] == ["ts", 49], timeout=1.0)
+        assert not stalled.received  # still stuck in its first send
+        # The stalled client's queue stays bounded, dropping its oldest payloads
+        assert len(proc._send_queues[stalled]) <= 4
+        assert proc.dropped_payloads.get(stalled, 0) > 0
+    finally:
+        unstall.set()
+        proc.stop()
+
+
+def test_replies_do_not_evict_queued_broadcasts(socket_mod):
+    """Command replies jump the queue without pushing the newest pose out of a full client queue."""
+    import threading
+
+    sending, unstall = threading.Event(), threading.Event()
+
+    class Conn:
+        def __init__(self):
+            self.received = []
+
+        def send_bytes(self, data):
+            sending.set()
+            unstall.wait(timeout=5.0)
+            self.received.append(pickle.loads(data))
+
+        def close(self):
+            pass
+
+    proc = socket_mod.BaseProcessorSocket(bind=None, client_queue_size=4)
+    conn = Conn()
+    try:
+        proc.conns.add(conn)
+        proc.broadcast(["ts", 0])
+        assert sending.wait(timeout=2.0)  # the sender is stuck sending pose 0
+        for i in range(1, 6):
+            proc.broadcast(["ts", i])  # pose 5 drops pose 1, the oldest queued one
+        proc._send_reply(conn, {"pong": 1})
+        proc._send_reply(conn, {"pong": 2})
+        assert proc.dropped_payloads[conn] == 1
+        unstall.set()
+        assert _wait_for(lambda: len(conn.received) == 7)
+        assert conn.received == [["ts", 0], {"pong": 1}, {"pong": 2}, ["ts", 2], ["ts", 3], ["ts", 4], ["ts", 5]]
+    finally:
+        unstall.set()
+        proc.stop()
+
+
+@pytest.mark.parametrize("wire_format", ["pickle", "binary"])
+def test_predicted_poses_are_flagged_and_not_recorded(socket_mod, wire_format):
+    """Motion-model estimates reach clients marked as predicted but stay out of the step count and the data."""
+    from dlclivegui.processors.pose_protocol import decode_pose_message
+
+    class Conn:
+        def __init__(self):
+            self.received = []
+
+        def send_bytes(self, data):
+            self.received.append(data)
+
+        def close(self):
+            pass
+
+    proc = socket_mod.BaseProcessorSocket(bind=None, timing_info=True, save_original=True, wire_format=wire_format)
+    conn = Conn()
+    try:
+        proc.conns.add(conn)
+        proc.start_recording()
+        pose = np.ones((2, 3))
+        proc.process(pose, frame_time=1.0, pose_time=1.1)
+        proc.process(pose * 2, frame_time=1.5, predicted=True)
+        proc.process(pose * 3, frame_time=2.0, pose_time=2.1)
+
+        assert proc.curr_step == 2
+        assert proc.last_frame_time == 2.0
+        assert proc.step.to_array().tolist() == [1, 2]
+        assert proc.frame_time.to_array().tolist() == [1.0, 2.0]
+        assert proc.pose_time.to_array().tolist() == [1.1, 2.1]
+        assert len(proc.time_stamp) == len(proc.original_pose) == 2
+        np.testing.assert_array_equal(proc.original_pose[1], pose * 3)
+
+        assert _wait_for(lambda: len(conn.received) == 3)
+        if wire_format == "binary":
+            sent = [(m.frame_id, m.predicted) for m in map(decode_pose_message, conn.received)]
+        else:
+            sent = [(info["frame_id"], info["predicted"]) for *_, info in map(pickle.loads, conn.received)]
+        assert sent == [(1, False), (1, True), (2, False)]
+    finally:
+        proc.stop()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_asyncio_backend_serves_commands_and_broadcasts(socket_mod):
+    """The asyncio server accepts standard multiprocessing clients and handles the same commands."""
+    from multiprocessing import AuthenticationError
+    from multiprocessing.connection import Client
+
+    BaseProcessorSocket = socket_mod.BaseProcessorSocket
+    with pytest.raises(ValueError, match="server_backend"):
+        BaseProcessorSocket(bind=None, server_backend="trio")
+
+    proc = BaseProcessorSocket(bind=("127.0.0.1", 0), server_backend="asyncio")
+    clients = []
+    try:
+        assert proc.listener is None
+        assert proc.address[1] != 0
+
+        with pytest.raises(AuthenticationError):
+            Client(proc.address, authkey=b"wrong key")
+
+        clients = [Client(proc.address, authkey=proc.authkey) for _ in range(3)]
+        assert _wait_for(lambda: len(proc.conns) == 3)
+
+        clients[0].send({"cmd": "set_session_name", "session_name": "async_session"})
+        clients[0].send({"cmd": "start_recording"})
+        assert _wait_for(lambda: proc.recording)
+        assert proc.session_name == "async_session"
+
+        pose = _mk_pose(4)
+        proc.process(pose)
+        for client in clients:
+            assert client.poll(2.0)
+            ts, received = client.recv()
+            np.testing.assert_array_equal(received, pose)
+
+        clients[1].send({"cmd": "stop_recording"})
+        assert _wait_for(lambda: not proc.recording)
+
+        clients.pop().close()
+        assert _wait_for(lambda: len(proc.conns) == 2)
+    finally:
+        proc.stop()
+        for client in clients:
+            client.close()
+
+    assert len(proc.conns) == 0
+    # Server is gone after stop()
+    with pytest.raises(OSError):
+        Client(proc.address, authkey=proc.authkey)
+
+
 def test_save_writes_pkl_and_hdf5_with_labels(socket_mod, caplog):
     """
     End-to-end save() with save_original=True and a matching dlc_cfg bodypart list.
@@ -413,6 +681,55 @@ def test_save_writes_pkl_and_hdf5_with_labels(socket_mod, caplog):
             pass
 
 
+def test_stream_original_writes_hdf5_while_recording(socket_mod):
+    """Streamed poses end up in the same HDF5 layout as a one-shot save, under the requested name."""
+    pytest.importorskip("tables")
+    BaseProcessorSocket = socket_mod.BaseProcessorSocket
+    bodyparts = _mk_bodyparts(4)
+    data_dir = _module_data_dir(socket_mod)
+    streamed = BaseProcessorSocket(bind=None, save_original=True, stream_original=True)
+    reference = BaseProcessorSocket(bind=None, save_original=True)
+    paths = []
+    try:
+        for proc in (streamed, reference):
+            proc.set_dlc_cfg({"metadata": {"bodyparts": bodyparts}})
+        streamed.stream_chunk_rows = 4
+        streamed.session_name = "unit_test_stream"
+        live_path = data_dir / "unit_test_stream_dlc_processor_data_DLC.hdf5"
+        paths.append(live_path)
+
+        streamed.start_recording()
+        reference.start_recording()
+        for i in range(10):
+            pose = _mk_pose(4) + i
+            streamed.process(pose, frame_time=float(i), pose_time=i + 0.5)
+            reference.process(pose, frame_time=float(i), pose_time=i + 0.5)
+        # Two full blocks were handed to the writer during recording
+        assert streamed._streamed_rows == 8
+        assert _wait_for(lambda: streamed._pose_stream.rows_written == 8)
+        assert live_path.exists()
+
+        streamed.stop_recording()
+        reference.stop_recording()
+        assert streamed._streamed_file == (live_path, 10)
+
+        for proc, name in ((streamed, "unit_test_streamed.pkl"), (reference, "unit_test_reference.pkl")):
+            assert proc.save(name) == 1
+            paths += [data_dir / name, data_dir / (Path(name).stem + "_DLC.hdf5")]
+
+        assert not live_path.exists()  # moved to the requested name
+        df = pd.read_hdf(data_dir / "unit_test_streamed_DLC.hdf5", key="df_with_missing")
+        ref = pd.read_hdf(data_dir / "unit_test_reference_DLC.hdf5", key="df_with_missing")
+        # Timestamps differ between the two processors; pose values and layout must match
+        pd.testing.assert_frame_equal(df.drop(columns="pose_time"), ref.drop(columns="pose_time"))
+        assert list(df["pose_time"]) == list(streamed.time_stamp)
+    finally:
+        streamed.stop()
+        reference.stop()
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
 def test_save_without_dlc_cfg_unlabeled_columns(socket_mod, caplog):
     """
     Ensure that without dlc_cfg, save() still writes HDF5 with unlabeled columns
@@ -8,7 +8,9 @@ from pathlib import Path
 import pytest
 
 from dlclivegui.processors.processor_utils import (
+    clear_discovery_cache,
     default_processors_dir,
+    discovery_cache_path,
     display_processor_info,
     instantiate_from_scan,
     load_processors_from_file,
@@ -165,3 +167,49 @@ def test_display_processor_info_prints(capsys, tmp_path: Path):
     assert "Dummy Processor" in captured
     assert "Parameters:" in captured
     assert "- foo (int)" in captured or "foo" in captured  # depends on your formatter
+
+
+# ---------------------------------------------------------------------------
+# Tests: discovery cache
+# ---------------------------------------------------------------------------
+
+
+def test_scan_folder_uses_cache_until_file_changes(tmp_path: Path):
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    py_file = _write_temp_processor_file(plugins, stem="cached_proc")
+    marker = tmp_path / "imports.txt"
+    # Count imports of the plugin module
+    py_file.write_text(f"open({str(marker)!r}, 'a').write('x')\n" + py_file.read_text())
+
+    first = scan_processor_folder(plugins)
+    assert marker.read_text() == "x"
+    assert first["cached_proc.py::DummyProc"]["class"].__name__ == "DummyProc"
+    assert discovery_cache_path().exists()
+
+    # Unchanged file: metadata comes from the cache, nothing is imported
+    second = scan_processor_folder(plugins)
+    assert marker.read_text() == "x"
+    info = second["cached_proc.py::DummyProc"]
+    _assert_processor_info_shape(info)
+    assert info["class"] is None
+    assert info["name"] == "Dummy Processor"
+    assert info["params"]["foo"]["default"] == 1
+
+    # The module is imported only when the processor is created
+    instance = instantiate_from_scan(second, "cached_proc.py::DummyProc", foo=2)
+    assert instance.kwargs == {"foo": 2}
+    assert marker.read_text() == "xx"
+
+    # Editing the file invalidates its entry
+    py_file.write_text(py_file.read_text().replace("Dummy Processor", "Renamed Processor"))
+    third = scan_processor_folder(plugins)
+    assert third["cached_proc.py::DummyProc"]["name"] == "Renamed Processor"
+    assert marker.read_text() == "xxx"
+
+    # Bypassing or clearing the cache re-imports
+    scan_processor_folder(plugins, use_cache=False)
+    assert marker.read_text() == "xxxx"
+    clear_discovery_cache()
+    assert not discovery_cache_path().exists()
+    assert scan_processor_folder(plugins)["cached_proc.py::DummyProc"]["class"] is not None
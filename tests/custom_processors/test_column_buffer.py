@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from dlclivegui.processors.column_buffer import ColumnBuffer
+
+
+def test_scalar_column_spans_chunks():
+    col = ColumnBuffer(np.float64, chunk_size=4)
+    assert len(col) == 0
+    assert not col
+    assert col.to_array().shape == (0,)
+
+    for i in range(10):
+        col.append(i * 0.5)
+
+    assert len(col) == 10
+    assert col.shape == (10,)
+    assert col[0] == 0.0
+    assert col[-1] == 4.5
+    assert col[5] == 2.5
+    with pytest.raises(IndexError):
+        col[10]
+    assert [c.shape[0] for c in col.chunks()] == [4, 4, 2]
+
+    arr = col.to_array()
+    assert arr.dtype == np.float64
+    np.testing.assert_array_equal(arr, np.arange(10) * 0.5)
+    np.testing.assert_array_equal(np.array(col), arr)
+    assert list(col) == arr.tolist()
+
+    # Row ranges: a view inside one chunk, concatenated across chunks
+    assert col.rows(4, 8).base is not None
+    np.testing.assert_array_equal(col.rows(2, 9), arr[2:9])
+    np.testing.assert_array_equal(col.rows(8), arr[8:])
+    assert col.rows(10).shape == (0,)
+
+
+def test_single_chunk_is_a_view_and_survives_clear():
+    col = ColumnBuffer(np.int64, chunk_size=8)
+    for i in range(3):
+        col.append(i)
+    arr = col.to_array()
+    assert arr.base is not None  # no copy for a single chunk
+
+    col.clear()
+    assert len(col) == 0
+    col.append(99)
+    # Earlier results are not overwritten by new data after clear()
+    assert arr.tolist() == [0, 1, 2]
+    assert col.to_array().tolist() == [99]
+
+
+def test_pose_rows_infer_shape_and_copy_values():
+    col = ColumnBuffer(chunk_size=2)
+    pose = np.ones((5, 3), dtype=np.float32)
+    col.append(pose)
+    pose[:] = 7  # the buffer holds its own copy
+    col.append(pose)
+    col.append(pose)
+
+    arr = col.to_array()
+    assert arr.shape == (3, 5, 3)
+    assert arr.dtype == np.float32
+    np.testing.assert_array_equal(arr[0], 1)
+    np.testing.assert_array_equal(col[2], 7)
+
+    empty = ColumnBuffer()
+    assert empty.to_array().shape == (0,)
+
+
+def test_append_rejects_values_of_another_shape():
+    col = ColumnBuffer(name="original_pose")
+    col.append(np.ones((5, 3)))
+    with pytest.raises(ValueError, match=r"'original_pose'.*\(2, 5, 3\).*\(5, 3\)"):
+        col.append(np.ones((2, 5, 3)))  # animal count changed mid-recording
+    with pytest.raises(ValueError, match="original_pose"):
+        col.append(0.0)
+    assert len(col) == 1
+
+    scalars = ColumnBuffer(np.float64, name="frame_time")
+    scalars.append(1.0)
+    with pytest.raises(ValueError, match="frame_time"):
+        scalars.append([1.0, 2.0])
+    scalars.append(np.float64(2.0))
+    assert scalars.to_array().tolist() == [1.0, 2.0]
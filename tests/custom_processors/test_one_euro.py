@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import numpy as np
+
+from dlclivegui.processors.one_euro import OneEuroFilter, OneEuroFilterArray
+
+
+def test_array_filter_matches_scalar_filters():
+    rng = np.random.default_rng(1)
+    shape = (2, 4, 2)
+    poses = np.cumsum(rng.normal(0, 2, (50,) + shape), axis=0)
+    times = np.arange(50) / 30.0
+    kwargs = {"min_cutoff": 0.5, "beta": 0.05, "d_cutoff": 1.0}
+
+    scalar = {idx: OneEuroFilter(times[0], poses[0][idx], **kwargs) for idx in np.ndindex(shape)}
+    vectorized = OneEuroFilterArray(**kwargs)
+    np.testing.assert_array_equal(vectorized(times[0], poses[0]), poses[0])
+
+    for t, pose in zip(times[1:], poses[1:], strict=True):
+        out = vectorized(t, pose)
+        expected = np.array([scalar[idx](t, pose[idx]) for idx in np.ndindex(shape)]).reshape(shape)
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
+
+def test_low_confidence_and_nan_keypoints_hold_their_estimate():
+    filt = OneEuroFilterArray(min_cutoff=1.0, beta=0.0, min_confidence=0.5)
+    xy = np.array([[0.0, 0.0], [10.0, 10.0], [np.nan, np.nan]])
+    filt(0.0, xy, confidence=np.array([0.9, 0.9, 0.0]))
+
+    moved = np.array([[1.0, 1.0], [500.0, 500.0], [5.0, 5.0]])
+    out = filt(0.1, moved, confidence=np.array([0.9, 0.1, 0.9]))
+    assert 0.0 < out[0, 0] < 1.0  # smoothed
+    np.testing.assert_array_equal(out[1], [10.0, 10.0])  # gated: held
+    np.testing.assert_array_equal(out[2], [5.0, 5.0])  # first valid observation
+    assert filt.t_prev[1, 0] == 0.0  # gated keypoint keeps its last update time
+
+    out = filt(0.2, np.array([[1.0, 1.0], [np.nan, np.nan], [5.0, 5.0]]), confidence=np.ones(3))
+    np.testing.assert_array_equal(out[1], [10.0, 10.0])
+
+    # A new shape starts over
+    out = filt(0.3, np.zeros(4))
+    np.testing.assert_array_equal(out, np.zeros(4))
+
+
+def test_import_does_not_load_gui_dependencies():
+    code = (
+        "import sys, dlclivegui.processors.one_euro; "
+        "print(sorted(m for m in ('PySide6', 'cv2', 'dlclive', 'pydantic') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import importlib
+import math
+import pickle
+import subprocess
+import sys
+import time
+import types
+from multiprocessing.connection import Client
+
+import numpy as np
+import pytest
+
+from dlclivegui.processors.pose_protocol import (
+    FLAG_PREDICTED,
+    HEADER_SIZE,
+    ProtocolError,
+    decode_pose_message,
+    encode_pose_message,
+    sync_clock,
+)
+
+
+@pytest.fixture
+def socket_mod(monkeypatch):
+    fake = types.ModuleType("dlclive")
+
+    class Processor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    fake.Processor = Processor
+    monkeypatch.setitem(sys.modules, "dlclive", fake)
+    mod_name = "dlclivegui.processors.dlc_processor_socket"
+    if mod_name in sys.modules:
+        del sys.modules[mod_name]
+    return importlib.import_module(mod_name)
+
+
+def test_roundtrip_pose_message():
+    pose = np.random.default_rng(0).random((30, 3)) * 100
+    buf = encode_pose_message(pose, frame_id=42, timestamp=1.5, frame_time=1.25, pose_time=1.4)
+
+    # 40-byte header + 2 dims + 30x3 float32
+    assert len(buf) == HEADER_SIZE + 8 + 30 * 3 * 4 == 408
+
+    msg = decode_pose_message(buf)
+    assert msg.frame_id == 42
+    assert msg.timestamp == 1.5
+    assert msg.frame_time == 1.25
+    assert msg.pose_time == 1.4
+    assert msg.data.dtype == np.float32
+    assert msg.data.shape == (30, 3)
+    np.testing.assert_allclose(msg.data, pose.astype(np.float32))
+
+
+def test_missing_times_are_nan_and_vectors_supported():
+    msg = decode_pose_message(encode_pose_message([1.0, 2.0, 3.0, 4.0], frame_id=0, timestamp=0.0))
+    assert math.isnan(msg.frame_time)
+    assert math.isnan(msg.pose_time)
+    assert not msg.predicted
+    assert msg.data.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_float64_payload():
+    pose = np.arange(6, dtype=np.float64).reshape(2, 3)
+    msg = decode_pose_message(encode_pose_message(pose, frame_id=1, timestamp=0.0, dtype=np.float64), copy=True)
+    assert msg.data.dtype == np.float64
+    np.testing.assert_array_equal(msg.data, pose)
+
+
+@pytest.mark.parametrize(
+    "mutate, match",
+    [
+        (lambda b: b"XXXX" + b[4:], "magic"),
+        (lambda b: b[:4] + bytes([99]) + b[5:], "version"),
+        (lambda b: b[:-4], "size"),
+        (lambda b: b[:10], "too short"),
+    ],
+)
+def test_decode_rejects_malformed_messages(mutate, match):
+    buf = encode_pose_message(np.zeros((3, 3)), frame_id=0, timestamp=0.0)
+    with pytest.raises(ProtocolError, match=match):
+        decode_pose_message(mutate(buf))
+
+
+def test_processor_encodes_binary_payload(socket_mod):
+    proc = socket_mod.BaseProcessorSocket(bind=None, wire_format="binary")
+    proc.curr_step = 7
+    pose = np.ones((5, 3))
+
+    msg = decode_pose_message(proc._encode_payload([2.0, pose], frame_time=1.0, pose_time=1.9))
+    assert msg.frame_id == 7
+    assert msg.frame_time == 1.0
+    assert not msg.predicted
+    np.testing.assert_array_equal(msg.data, pose)
+
+    # Motion-model estimates set the predicted header flag
+    buf = proc._encode_payload([2.0, pose], frame_time=1.1, predicted=True)
+    assert buf[7] == FLAG_PREDICTED
+    assert decode_pose_message(buf).predicted
+
+    # Derived values from subclasses are sent as a flat vector
+    msg = decode_pose_message(proc._encode_payload([2.0, 10.0, 20.0, 90.0, 0.1]))
+    np.testing.assert_allclose(msg.data, [10.0, 20.0, 90.0, 0.1], rtol=1e-6)
+
+    # Default stays pickle
+    plain = socket_mod.BaseProcessorSocket(bind=None)
+    assert pickle.loads(plain._encode_payload([2.0, 1.0])) == [2.0, 1.0]
+
+    with pytest.raises(ValueError, match="wire_format"):
+        socket_mod.BaseProcessorSocket(bind=None, wire_format="json")
+
+
+def test_binary_broadcast_end_to_end(socket_mod):
+    proc = socket_mod.BaseProcessorSocket(bind=("127.0.0.1", 0), wire_format="binary")
+    try:
+        client = Client(proc.listener.address, authkey=proc.authkey)
+        deadline = time.time() + 2.0
+        while not proc.conns and time.time() < deadline:
+            time.sleep(0.01)
+
+        pose = np.full((4, 3), 3.0)
+        proc.process(pose, frame_time=5.0, pose_time=5.5)
+        assert client.poll(2.0)
+        msg = decode_pose_message(client.recv_bytes())
+        assert msg.frame_id == 1
+        assert msg.frame_time == 5.0
+        np.testing.assert_array_equal(msg.data, pose)
+        client.close()
+    finally:
+        proc.stop()
+
+
+@pytest.mark.parametrize("backend", ["threads", "asyncio"])
+def test_ping_clock_sync_timing_info_and_client_stats(socket_mod, backend):
+    proc = socket_mod.BaseProcessorSocket(bind=("127.0.0.1", 0), timing_info=True, server_backend=backend)
+    try:
+        address = proc.listener.address if proc.listener is not None else proc.address
+        client = Client(address, authkey=proc.authkey)
+        deadline = time.time() + 2.0
+        while not proc.conns and time.time() < deadline:
+            time.sleep(0.01)
+
+        # Processor and client share time.time(), so offsets are ~0
+        sync = sync_clock(client, samples=4)
+        assert 0 <= sync.rtt < 0.5
+        assert abs(sync.offset) <= sync.rtt
+        assert abs(sync.wall_offset) <= sync.rtt
+
+        frame_time = time.time() - 0.02
+        pose = np.zeros((3, 3))
+        proc.process(pose, frame_time=frame_time, pose_time=frame_time + 0.01)
+        assert client.poll(2.0)
+        ts, values, timing = client.recv()
+        np.testing.assert_array_equal(values, pose)
+        assert timing == {"frame_id": 1, "frame_time": frame_time, "pose_time": frame_time + 0.01, "predicted": False}
+        assert 0.02 <= sync.latency(timing["frame_time"], time.time()) < 1.0
+
+        stats = proc.get_client_stats()
+        assert len(stats) == 1
+        assert stats[0]["sent"] == 1
+        assert stats[0]["dropped"] == 0
+        assert stats[0]["send_lag_ms"] >= 0.0
+        client.close()
+    finally:
+        proc.stop()
+
+
+def test_import_does_not_load_gui_dependencies():
+    code = (
+        "import sys, dlclivegui.processors.pose_protocol; "
+        "print(sorted(m for m in ('PySide6', 'cv2', 'dlclive', 'pydantic') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
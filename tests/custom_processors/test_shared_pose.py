@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+import types
+import uuid
+
+import numpy as np
+import pytest
+
+from dlclivegui.processors.shared_pose import SharedPosePublisher, SharedPoseReader
+
+
+@pytest.fixture
+def shm_name():
+    return f"dlclivegui_test_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture
+def socket_mod(monkeypatch):
+    fake = types.ModuleType("dlclive")
+
+    class Processor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    fake.Processor = Processor
+    monkeypatch.setitem(sys.modules, "dlclive", fake)
+    mod_name = "dlclivegui.processors.dlc_processor_socket"
+    if mod_name in sys.modules:
+        del sys.modules[mod_name]
+    return importlib.import_module(mod_name)
+
+
+def test_latest_pose_roundtrip(shm_name):
+    pub = SharedPosePublisher(shm_name, (30, 3), capacity=8)
+    reader = SharedPoseReader(shm_name)
+    try:
+        assert reader.shape == (30, 3)
+        assert reader.latest() is None
+
+        for i in range(3):
+            pub.publish(np.full((30, 3), i, dtype=np.float32), frame_id=i, timestamp=10.0 + i, frame_time=i)
+
+        msg = reader.latest()
+        assert msg.frame_id == 2
+        assert msg.timestamp == 12.0
+        assert msg.frame_time == 2.0
+        assert np.isnan(msg.pose_time)
+        assert msg.data.shape == (30, 3)
+        assert np.all(msg.data == 2.0)
+    finally:
+        reader.close()
+        pub.close()
+
+
+def test_read_since_returns_ordered_backlog_and_wraps(shm_name):
+    pub = SharedPosePublisher(shm_name, (2,), capacity=4)
+    reader = SharedPoseReader(shm_name)
+    try:
+        pub.publish([0, 0], frame_id=0, timestamp=0.0)
+        msgs, cursor = reader.read_since(0)
+        assert [m.frame_id for m in msgs] == [0]
+
+        for i in range(1, 8):
+            pub.publish([i, i], frame_id=i, timestamp=float(i))
+        msgs, cursor = reader.read_since(cursor)
+        # Only the last `capacity` poses are still available
+        assert [m.frame_id for m in msgs] == [4, 5, 6, 7]
+        assert cursor == 8
+        assert reader.read_since(cursor) == ([], 8)
+
+        # Random access by index, None once overwritten or not yet published
+        assert reader.read(6).frame_id == 6
+        assert reader.read(3) is None
+        assert reader.read(8) is None
+    finally:
+        reader.close()
+        pub.close()
+
+
+def test_read_since_drops_slots_reused_while_reading(shm_name, monkeypatch):
+    pub = SharedPosePublisher(shm_name, (2,), capacity=4)
+    reader = SharedPoseReader(shm_name)
+    try:
+        for i in range(4):
+            pub.publish([i, i], frame_id=i, timestamp=float(i))
+        read_slot = reader._read_slot
+
+        def lapping_read_slot(slot):
+            msg = read_slot(slot)
+            if slot == 1:  # the writer laps the ring while the reader is half-way through it
+                for i in range(4, 7):
+                    pub.publish([i, i], frame_id=i, timestamp=float(i))
+            return msg
+
+        monkeypatch.setattr(reader, "_read_slot", lapping_read_slot)
+        msgs, cursor = reader.read_since(0)
+        # Slots 1 and 2 now hold poses 5 and 6; slot 3 still holds pose 3, so order is preserved
+        assert [m.frame_id for m in msgs] == [0, 3]
+        assert cursor == 4
+    finally:
+        reader.close()
+        pub.close()
+
+
+def test_reader_skips_record_being_written(shm_name):
+    pub = SharedPosePublisher(shm_name, (2,), capacity=2)
+    reader = SharedPoseReader(shm_name, max_retries=3)
+    try:
+        pub.publish([1, 1], frame_id=1, timestamp=1.0)
+        # Simulate a writer interrupted mid-record (odd sequence number)
+        pub._records["seq"][0] += 1
+        assert reader.latest() is None
+        pub._records["seq"][0] += 1
+        assert reader.latest().frame_id == 1
+    finally:
+        reader.close()
+        pub.close()
+
+
+def test_shape_mismatch_and_invalid_segment(shm_name):
+    pub = SharedPosePublisher(shm_name, (3, 3))
+    try:
+        with pytest.raises(ValueError, match="does not match"):
+            pub.publish(np.zeros((4, 3)), frame_id=0, timestamp=0.0)
+    finally:
+        pub.close()
+    with pytest.raises(FileNotFoundError):
+        SharedPoseReader(shm_name)
+
+
+def test_reader_in_other_process(shm_name):
+    pub = SharedPosePublisher(shm_name, (5, 3))
+    try:
+        pub.publish(np.arange(15).reshape(5, 3), frame_id=99, timestamp=1.0)
+        code = (
+            "from dlclivegui.processors.shared_pose import SharedPoseReader;"
+            f"r = SharedPoseReader({shm_name!r}); m = r.latest();"
+            "print(m.frame_id, float(m.data.sum())); r.close()"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        assert out.returncode == 0, out.stderr
+        assert out.stdout.split() == ["99", "105.0"]
+        # The reader process must not have unlinked the publisher's segment
+        reader = SharedPoseReader(shm_name)
+        assert reader.latest().frame_id == 99
+        reader.close()
+    finally:
+        pub.close()
+
+
+def test_processor_publishes_to_shared_memory(socket_mod, shm_name):
+    proc = socket_mod.BaseProcessorSocket(bind=None, shm_name=shm_name)
+    try:
+        pose = np.ones((4, 3))
+        proc.process(pose, frame_time=2.0)
+        reader = SharedPoseReader(shm_name)
+        msg = reader.latest()
+        assert msg.frame_id == 1
+        assert msg.frame_time == 2.0
+        assert not msg.predicted
+        np.testing.assert_array_equal(msg.data, pose)
+
+        proc.process(pose * 2, frame_time=2.5, predicted=True)
+        msg = reader.latest()
+        assert msg.predicted
+        assert (msg.frame_id, msg.frame_time) == (1, 2.5)  # estimates do not advance the step
+        reader.close()
+    finally:
+        proc.stop()
+    with pytest.raises(FileNotFoundError):
+        SharedPoseReader(shm_name)
+
+
+def test_import_does_not_load_gui_dependencies():
+    code = (
+        "import sys, dlclivegui.processors.shared_pose; "
+        "print(sorted(m for m in ('PySide6', 'cv2', 'dlclive', 'pydantic') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
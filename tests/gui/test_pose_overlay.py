@@ -90,3 +90,70 @@ def test_record_overlay_toggle_affects_frames_sent_to_recorder(window, recording
     assert not np.array_equal(recorded_on, raw)
     # verify our stub drew the marker at expected pixel
     assert (recorded_on[20, 10] == np.array([0, 255, 0])).all()
+
+
+@pytest.mark.gui
+@pytest.mark.timeout(10)
+def test_extra_model_overlays_can_be_toggled_per_model(window, monkeypatch):
+    from dlclivegui.config import DLCProcessorSettings
+    from dlclivegui.gui import main_window
+
+    window._display_timer.stop()
+    window._metrics_timer.stop()
+    drawn = []
+
+    def _record_draw_pose(frame, pose, colormap=None, **_kw):
+        drawn.append(colormap)
+        return frame
+
+    monkeypatch.setattr(main_window, "draw_pose", _record_draw_pose)
+
+    window._config.extra_models = [
+        DLCProcessorSettings(model_id="paw", model_path="paw.pt"),
+        DLCProcessorSettings(model_id="eye", model_path="eye.pt"),
+    ]
+    window._rebuild_model_overlay_toggles()
+    window._extra_models.configure(window._config.extra_models)
+    assert list(window.model_overlay_checkboxes) == ["paw", "eye"]
+
+    pose = type("Pose", (), {"pose": np.zeros((2, 3))})()
+    window._extra_poses = {"eye": pose, "paw": pose}
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    window._draw_extra_poses(frame, (0, 0), (1.0, 1.0), displayed_only=True)
+    assert sorted(drawn) == sorted(main_window.EXTRA_MODEL_COLORMAPS[:2])
+
+    drawn.clear()
+    window.model_overlay_checkboxes["paw"].setChecked(False)
+    window._draw_extra_poses(frame, (0, 0), (1.0, 1.0), displayed_only=True)
+    assert drawn == [main_window.EXTRA_MODEL_COLORMAPS[1]]  # eye keeps its own colormap
+
+    # Recorded overlays follow the same toggles as the preview
+    drawn.clear()
+    window._inference_camera_id = "fake:0"
+    window._last_pose = None
+    window._render_overlays_for_recording("fake:0", frame)
+    assert drawn == [main_window.EXTRA_MODEL_COLORMAPS[1]]
+    window._extra_models.shutdown()
+
+
+@pytest.mark.gui
+@pytest.mark.timeout(10)
+def test_display_timer_polls_latest_pose(window):
+    from dlclivegui.services.dlc_processor import PoseResult
+
+    window._display_timer.stop()
+    window._metrics_timer.stop()
+    window._dlc_active = True
+    assert not window._poll_poses()
+
+    # Many poses between two display ticks: only the newest one is drawn
+    for t in (1.0, 2.0, 3.0):
+        window._dlc.latest_pose.publish(PoseResult(pose=np.zeros((2, 3)), timestamp=t))
+    assert window._poll_poses()
+    assert window._last_pose.timestamp == 3.0
+    assert not window._poll_poses()  # nothing new: no redraw
+
+    window._dlc_active = False
+    window._dlc.latest_pose.publish(PoseResult(pose=np.zeros((2, 3)), timestamp=4.0))
+    assert not window._poll_poses()
@@ -4,7 +4,12 @@ import numpy as np
 import pytest
 
 from dlclivegui.config import CameraSettings
-from dlclivegui.gui.recording_manager import RecordingManager
+from dlclivegui.gui.recording_manager import (
+    ESTIMATED_FRAME_SIZE,
+    MIN_RECORDER_BUFFER,
+    RecordingManager,
+    allocate_buffer_frames,
+)
 from dlclivegui.services.multi_camera_controller import get_camera_id, get_display_id
 from dlclivegui.services.video_recorder import RecorderStats
 
@@ -378,3 +383,154 @@ def test_start_all_does_not_infer_frame_size_from_display_id(
     # Since RecordingManager uses stable IDs internally, it should not find this frame.
     rec = mgr.recorders[stable_id]
     assert rec.frame_size is None
+
+
+@pytest.mark.unit
+def test_pretrigger_frames_are_flushed_first_on_start(
+    recording_settings, _active_cams_two, current_frames, patch_video_recorder, patch_build_run_dir
+):
+    recording_settings.pretrigger_seconds = 1.0
+    recording_settings.pretrigger_memory_mb = 64
+    ids = [get_camera_id(c) for c in _active_cams_two]
+
+    mgr = RecordingManager()
+    mgr.configure_pretrigger(recording_settings, ids)
+    assert mgr.pretrigger_enabled is True
+
+    cam0_id = ids[0]
+    frame = current_frames[cam0_id]
+    for i in range(30):
+        mgr.buffer_frame(cam0_id, frame, timestamp=100.0 + i * 0.1)
+
+    mgr.start_all(recording_settings, _active_cams_two, current_frames, session_name="Sess")
+    rec = mgr.recorders[cam0_id]
+    flushed = [ts for _f, ts in rec.write_calls]
+    # Only the last 1s of frames survives, in order, with their capture timestamps
+    assert flushed == pytest.approx([100.0 + i * 0.1 for i in range(19, 30)])
+
+    # While recording, buffering is a no-op for that camera
+    mgr.buffer_frame(cam0_id, frame, timestamp=200.0)
+    assert len(rec.write_calls) == len(flushed)
+    mgr.stop_all()
+
+
+@pytest.mark.unit
+def test_pretrigger_disabled_by_default(recording_settings):
+    mgr = RecordingManager()
+    mgr.configure_pretrigger(recording_settings, ["cam"])
+    assert mgr.pretrigger_enabled is False
+    mgr.buffer_frame("cam", np.zeros((4, 4, 3), dtype=np.uint8), timestamp=1.0)
+
+
+@pytest.mark.unit
+def test_allocate_buffer_frames_shares_budget_by_byte_rate():
+    small = 480 * 640 * 3
+    large = 2160 * 3840 * 3
+    budget = 512 * 1024 * 1024
+    frames = allocate_buffer_frames(budget, {"vga": (small, 30.0), "4k": (large, 30.0)})
+
+    # Same stall tolerance (frames at equal fps) for both cameras, within budget
+    assert frames["vga"] == pytest.approx(frames["4k"], abs=1)
+    assert frames["vga"] * small + frames["4k"] * large <= budget
+
+    # Tiny budgets still leave a usable queue
+    assert allocate_buffer_frames(1, {"4k": (large, 30.0)})["4k"] == MIN_RECORDER_BUFFER
+    assert allocate_buffer_frames(budget, {}) == {}
+
+
+@pytest.mark.unit
+def test_start_all_sizes_buffers_from_memory_budget(
+    recording_settings, _active_cams_two, current_frames, patch_video_recorder, patch_build_run_dir
+):
+    recording_settings.buffer_memory_mb = 64
+    mgr = RecordingManager()
+    mgr.start_all(recording_settings, _active_cams_two, current_frames, session_name="Sess")
+
+    total = 0
+    for cam in _active_cams_two:
+        cam_id = get_camera_id(cam)
+        frame = current_frames[cam_id]
+        buffer_size = mgr.recorders[cam_id].kwargs["buffer_size"]
+        assert buffer_size >= MIN_RECORDER_BUFFER
+        total += buffer_size * frame.shape[0] * frame.shape[1] * 3
+    assert total <= 64 * 1024 * 1024
+    mgr.stop_all()
+
+
+@pytest.mark.unit
+def test_start_all_counts_unknown_frame_sizes_against_budget(
+    recording_settings, _active_cams_two, patch_video_recorder, patch_build_run_dir
+):
+    recording_settings.buffer_memory_mb = 64
+    cam0, cam1 = _active_cams_two
+    cam0.width, cam0.height = 640, 480
+    cam1.width = cam1.height = 0  # no frame and no configured resolution
+    mgr = RecordingManager()
+    mgr.start_all(recording_settings, _active_cams_two, {}, session_name="Sess")
+
+    estimated = ESTIMATED_FRAME_SIZE[0] * ESTIMATED_FRAME_SIZE[1] * 3
+    sizes = {get_camera_id(cam0): 480 * 640 * 3, get_camera_id(cam1): estimated}
+    total = sum(mgr.recorders[cam_id].kwargs["buffer_size"] * nbytes for cam_id, nbytes in sizes.items())
+    assert total <= 64 * 1024 * 1024
+    mgr.stop_all()
+
+
+@pytest.mark.unit
+def test_stop_all_finalizes_recorders_concurrently_in_background(
+    qtbot, monkeypatch, recording_settings, _active_cams_two, current_frames, patch_video_recorder, patch_build_run_dir
+):
+    import threading
+    import time
+
+    # Each stop() waits for the other one: sequential stops would break the barrier
+    both_stopping = threading.Barrier(2, timeout=5.0)
+    overlap_errors = []
+    release = threading.Event()
+    original_stop = patch_video_recorder.stop
+
+    def slow_stop(self):
+        try:
+            both_stopping.wait()
+        except threading.BrokenBarrierError as exc:
+            overlap_errors.append(exc)
+        release.wait(timeout=5.0)
+        original_stop(self)
+
+    monkeypatch.setattr(patch_video_recorder, "stop", slow_stop)
+    mgr = RecordingManager()
+    progress = []
+    finished = []
+    mgr.stop_progress.connect(lambda done, total: progress.append((done, total)))
+    mgr.stop_finished.connect(finished.append)
+
+    run_dir = mgr.start_all(recording_settings, _active_cams_two, current_frames, session_name="Sess")
+    recorders = list(mgr.recorders.values())
+
+    t0 = time.perf_counter()
+    mgr.stop_all()
+    assert time.perf_counter() - t0 < 0.5  # does not wait for the slow recorders
+    assert mgr.is_active is False
+    assert mgr.run_dir is None
+    assert mgr.is_finalizing is True
+
+    release.set()
+    assert mgr.wait_for_stop(timeout=5.0) is True
+    assert overlap_errors == []  # both recorders were inside stop() at the same time
+    assert all(rec.stopped for rec in recorders)
+    # Signals are emitted from the stop threads and delivered through the event loop
+    qtbot.waitUntil(lambda: len(finished) == 1, timeout=2000)
+    assert sorted(progress) == [(1, 2), (2, 2)]
+    assert finished == [run_dir]
+
+
+@pytest.mark.unit
+def test_stop_all_wait_blocks_until_finalized(
+    recording_settings, _active_cams_two, current_frames, patch_video_recorder, patch_build_run_dir
+):
+    mgr = RecordingManager()
+    mgr.start_all(recording_settings, _active_cams_two, current_frames, session_name="Sess")
+    recorders = list(mgr.recorders.values())
+
+    mgr.stop_all(wait=True)
+    assert mgr.is_finalizing is False
+    assert all(rec.stopped for rec in recorders)
@@ -158,3 +158,24 @@ def test_processor_overrides_session_name_and_persists(window, start_all_spy, mo
     # Assert recording call used overridden session name
     kwargs = start_all_spy["kwargs"]
     assert kwargs["session_name"] == "auto_ABC"
+
+
+def test_processor_recording_event_starts_and_stops_recording(window, start_all_spy, monkeypatch, fake_processor):
+    window._dlc_active = True
+    window._dlc_initialized = True
+    window.allow_processor_ctrl_checkbox.setChecked(True)
+    window._dlc._processor = fake_processor
+    monkeypatch.setattr(window, "_start_recording", lambda: window._start_multi_camera_recording())
+    stopped = []
+    monkeypatch.setattr(window, "_stop_recording", lambda: stopped.append(True))
+
+    window._dlc.processor_recording_changed.emit(True, 17, "evt_sess", 12.5)
+
+    assert start_all_spy["kwargs"]["session_name"] == "evt_sess"
+    assert window.session_name_edit.text() == "evt_sess"
+    assert window._last_processor_vid_recording is True
+
+    monkeypatch.setattr(type(window._rec_manager), "is_active", property(lambda self: True))
+    window._dlc.processor_recording_changed.emit(False, 30, "evt_sess", 13.0)
+    assert stopped == [True]
+    assert window._last_processor_vid_recording is False
@@ -5,6 +5,8 @@ import pytest
 from dlclivegui.config import DLCProcessorSettings
 from dlclivegui.services.dlc_processor import (
     DLCLiveProcessor,
+    LatestPoseSlot,
+    PoseResult,
     ProcessorStats,
 )
 
@@ -166,7 +168,7 @@ def test_stats_computation(qtbot, monkeypatch_dlclive, settings_model):
 def test_worker_processes_second_frame_and_updates_stats(qtbot, monkeypatch_dlclive, settings_model):
     """
     Explicitly verify that after initialization, a queued frame is processed:
-    - frame_processed is emitted for the second frame
+    - the second frame's pose is processed
     - frames_processed >= 2 (init + 1 queued)
     """
     proc = DLCLiveProcessor()
@@ -263,3 +265,413 @@ def test_queue_accounting_clears_after_processed_frame(qtbot, monkeypatch_dlcliv
 
     finally:
         proc.reset()
+
+
+@pytest.mark.unit
+def test_pipelined_resize_maps_keypoints_to_full_frame(qtbot, monkeypatch, FakeDLCLiveClass):
+    from dlclivegui.services import dlc_processor
+
+    shapes = []
+    seen_by_processor = []
+
+    class RecordingDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            shapes.append(frame.shape)
+            pose = np.array([[10.0, 20.0, 0.9], [5.0, 5.0, 0.5]])
+            return self.opts["processor"].process(pose, frame_time=frame_time)
+
+    class Proc:
+        def process(self, pose, **kwargs):
+            seen_by_processor.append(pose.copy())
+            return pose
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", RecordingDLCLive)
+    monkeypatch.setattr(dlc_processor, "ENABLE_PROFILING", True)
+    proc = DLCLiveProcessor()
+    proc.configure(DLCProcessorSettings(model_path="dummy.pt", resize=0.5), processor=Proc())
+    poses = []
+    proc.pose_ready.connect(lambda result: poses.append(result.pose))
+
+    try:
+        frame = np.zeros((100, 60, 3), dtype=np.uint8)
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        assert proc._dlc.opts["resize"] == 1.0  # resized before DLCLive instead
+        for i in range(5):
+            qtbot.waitUntil(lambda n=i: proc.get_stats().frames_processed >= n + 1, timeout=1500)
+            proc.enqueue_frame(frame, 2.0 + i)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 6, timeout=1500)
+        assert proc._preprocess_thread is not None and proc._preprocess_thread.is_alive()
+        assert proc.get_stats().avg_preprocess_time > 0
+    finally:
+        proc.reset()
+
+    assert proc._preprocess_thread is None
+    assert set(shapes) == {(50, 30, 3)}
+    expected = np.array([[20.0, 40.0, 0.9], [10.0, 10.0, 0.5]])
+    for pose in poses + seen_by_processor:
+        np.testing.assert_allclose(pose, expected)
+
+
+@pytest.mark.unit
+def test_resize_stays_in_dlclive_with_dynamic_cropping(qtbot, monkeypatch_dlclive):
+    settings = DLCProcessorSettings(model_path="dummy.pt", resize=0.5, dynamic=(True, 0.5, 10))
+    proc = DLCLiveProcessor()
+    proc.configure(settings)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(np.zeros((40, 40, 3), dtype=np.uint8), 1.0)
+        assert proc._dlc.opts["resize"] == 0.5
+        assert proc._preprocess_thread is None
+    finally:
+        proc.reset()
+
+
+@pytest.mark.unit
+def test_roi_inference_crops_frame_and_maps_keypoints_back(qtbot, monkeypatch, FakeDLCLiveClass):
+    from dlclivegui.services import dlc_processor
+
+    frames = []
+
+    class RecordingDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            frames.append(frame.copy())
+            return np.array([[4.0, 6.0, 0.9]])
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", RecordingDLCLive)
+    # ROI (grown by the margin) is clipped to the 200x100 frame, then resized by 0.5
+    settings = DLCProcessorSettings(model_path="dummy.pt", roi=(50, 20, 250, 60), roi_margin=10, resize=0.5)
+    proc = DLCLiveProcessor()
+    proc.configure(settings)
+    poses = []
+    proc.pose_ready.connect(lambda result: poses.append(result.pose))
+
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    frame[10:70, 40:200] = 255  # exactly the clipped ROI
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 1, timeout=1500)
+        proc.enqueue_frame(frame, 2.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=1500)
+    finally:
+        proc.reset()
+
+    assert {f.shape for f in frames} == {(30, 80, 3)}
+    assert all((f == 255).all() for f in frames)
+    for pose in poses:
+        np.testing.assert_allclose(pose, [[40.0 + 4.0 * 2, 10.0 + 6.0 * 2, 0.9]])
+
+
+@pytest.mark.unit
+def test_roi_outside_frame_falls_back_to_full_frame():
+    proc = DLCLiveProcessor()
+    proc.configure(DLCProcessorSettings(model_path="dummy.pt", roi=(500, 500, 600, 600)))
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    cropped, offset = proc._crop_to_roi(frame)
+    assert cropped.shape == frame.shape and offset is None
+    assert cropped is not frame
+
+
+def test_invalid_roi_is_rejected():
+    with pytest.raises(ValueError):
+        DLCProcessorSettings(roi=(10, 10, 5, 20))
+
+
+@pytest.mark.unit
+def test_latency_target_keeps_the_freshest_frame(qtbot, monkeypatch, FakeDLCLiveClass):
+    import threading
+
+    from dlclivegui.services import dlc_processor
+
+    gate = threading.Event()
+    stamps = []
+
+    class BlockingDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            stamps.append(frame_time)
+            gate.wait(timeout=2.0)
+            return np.ones((2, 3))
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", BlockingDLCLive)
+    proc = DLCLiveProcessor()
+    proc.configure(DLCProcessorSettings(model_path="dummy.pt", target_latency_ms=50.0))
+    frame = np.zeros((16, 16, 3), dtype=np.uint8)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        # Worker is blocked in the init pose; frames 2..5 compete for the single queue slot
+        for ts in (2.0, 3.0, 4.0, 5.0):
+            proc.enqueue_frame(frame, ts)
+        gate.set()
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=1500)
+
+        stats = proc.get_stats()
+        assert stamps == [1.0, 5.0]
+        assert stats.rate_control_active
+        assert stats.frames_replaced == 3
+        assert stats.frames_dropped == 3
+        assert stats.frames_skipped == 0
+    finally:
+        gate.set()
+        proc.reset()
+
+
+@pytest.mark.unit
+def test_restart_reuses_cached_model(qtbot, monkeypatch, FakeDLCLiveClass):
+    from dlclivegui.services import dlc_processor
+
+    built = []
+
+    class CountingDLCLive(FakeDLCLiveClass):
+        def __init__(self, **opts):
+            super().__init__(**opts)
+            built.append(self)
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", CountingDLCLive)
+    proc = DLCLiveProcessor()
+    proc.configure(DLCProcessorSettings(model_path="dummy.pt"))
+    frame = np.zeros((32, 32, 3), dtype=np.uint8)
+    try:
+        for _ in range(2):
+            with qtbot.waitSignal(proc.initialized, timeout=1500):
+                proc.enqueue_frame(frame, 1.0)
+            proc.reset()
+        assert len(built) == 1
+        stats = proc.get_stats()
+        assert stats.last_init_cached
+        assert stats.cached_models == 1
+
+        # Another input shape needs another runner; the cache keeps one by default
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(np.zeros((16, 16, 3), dtype=np.uint8), 1.0)
+        assert len(built) == 2
+        assert not proc.get_stats().last_init_cached
+        proc.reset()
+        assert proc.evict_cached_models() == 1
+    finally:
+        proc.shutdown()
+    assert len(proc.model_cache) == 0
+
+
+@pytest.mark.unit
+def test_preload_warms_model_for_first_session(qtbot, monkeypatch, FakeDLCLiveClass):
+    import threading
+
+    from dlclivegui.services import dlc_processor
+
+    built = []
+    release_init = threading.Event()
+
+    class SlowInitDLCLive(FakeDLCLiveClass):
+        def __init__(self, **opts):
+            super().__init__(**opts)
+            built.append(self)
+
+        def init_inference(self, frame):
+            release_init.wait(timeout=2.0)
+            self.init_shape = frame.shape
+            super().init_inference(frame)
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", SlowInitDLCLive)
+    settings = DLCProcessorSettings(model_path="dummy.pt", resize=0.5)
+    proc = DLCLiveProcessor()
+    proc.configure(settings)
+    try:
+        assert proc.preload(settings, (40, 60, 3))
+        assert proc.preload(settings, (40, 60, 3))  # already in flight: not started twice
+
+        # Inference starts while the preload is still initializing: the worker waits for it
+        proc.enqueue_frame(np.zeros((40, 60, 3), dtype=np.uint8), 1.0)
+        with qtbot.waitSignal(proc.preloaded, timeout=1500) as blocker, qtbot.waitSignal(proc.initialized):
+            release_init.set()
+        assert blocker.args == [True, "dummy.pt"]
+        assert len(built) == 1
+        assert built[0].init_shape == (20, 30, 3)  # the warm-up used the resized input
+        assert built[0].opts["processor"] is None
+        assert proc.get_stats().last_init_cached
+        assert not proc.preload(settings, (40, 60, 3))  # in use by the running session
+    finally:
+        proc.shutdown()
+
+
+@pytest.mark.unit
+def test_motion_model_predicts_poses_between_inferences(qtbot, monkeypatch, FakeDLCLiveClass):
+    import threading
+
+    from dlclivegui.services import dlc_processor
+
+    gate = threading.Event()
+    gate.set()
+
+    class MovingDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            gate.wait(timeout=2.0)
+            return np.array([[10.0 * frame_time, 5.0, 0.9]])
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", MovingDLCLive)
+    seen = []
+
+    class RecordingProcessor:
+        def process(self, pose, **kwargs):
+            seen.append((float(pose[0, 0]), kwargs.get("predicted", False)))
+            return pose
+
+    proc = DLCLiveProcessor()
+    settings = DLCProcessorSettings(
+        model_path="dummy.pt", motion_model="constant_velocity", motion_max_horizon_ms=1000.0
+    )
+    proc.configure(settings.model_copy(update={"predictions_to_processor": True}), processor=RecordingProcessor())
+    results = []
+    proc.pose_ready.connect(results.append)
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 1, timeout=1500)
+        proc.enqueue_frame(frame, 2.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=1500)
+
+        gate.clear()  # inference is now slower than the camera
+        proc.enqueue_frame(frame, 2.5)
+        qtbot.waitUntil(lambda: any(r.timestamp == 2.5 for r in results), timeout=1500)
+        predicted = [r for r in results if r.packet.predicted]
+        assert predicted[-1].timestamp == 2.5
+        assert predicted[-1].pose[0, 0] == pytest.approx(25.0, abs=1.0)
+        assert not [r for r in results if r.timestamp == 2.0 and not r.packet.predicted][0].packet.predicted
+        assert (pytest.approx(25.0, abs=1.0), True) in seen
+        assert proc.get_stats().frames_predicted == len(predicted)
+    finally:
+        gate.set()
+        proc.reset()
+
+
+@pytest.mark.unit
+def test_prediction_during_inference_bypasses_processor_wrapper(qtbot, monkeypatch, FakeDLCLiveClass):
+    import threading
+
+    from dlclivegui.services import dlc_processor
+
+    gate = threading.Event()
+    gate.set()
+    in_inference = threading.Event()
+
+    class ProcessingDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            in_inference.set()
+            gate.wait(timeout=2.0)
+            pose = np.array([[10.0 * frame_time, 5.0, 0.9]])  # model-input coordinates
+            return self.opts["processor"].process(pose, frame_time=frame_time)
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", ProcessingDLCLive)
+    seen = []
+
+    class RecordingProcessor:
+        def process(self, pose, **kwargs):
+            seen.append((float(pose[0, 0]), kwargs.get("predicted", False)))
+            return pose
+
+    proc = DLCLiveProcessor()
+    settings = DLCProcessorSettings(
+        model_path="dummy.pt",
+        resize=0.5,
+        motion_model="constant_velocity",
+        motion_max_horizon_ms=1000.0,
+        predictions_to_processor=True,
+    )
+    proc.configure(settings, processor=RecordingProcessor())
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 1, timeout=1500)
+        proc.enqueue_frame(frame, 2.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=1500)
+
+        # The worker is inside inference (processor wrapped) when the camera thread emits a prediction
+        gate.clear()
+        in_inference.clear()
+        proc.enqueue_frame(frame, 2.5)
+        assert in_inference.wait(timeout=1.0)
+        camera = threading.Thread(target=proc.enqueue_frame, args=(frame, 3.0), daemon=True)
+        camera.start()
+        camera.join(timeout=2.0)
+        assert not camera.is_alive()
+        gate.set()
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 3, timeout=1500)
+    finally:
+        gate.set()
+        proc.reset()
+
+    # Inferred poses reach the processor in full-frame coordinates, predictions are not mapped twice
+    assert (20.0, False) in seen and (40.0, False) in seen
+    assert (pytest.approx(60.0, abs=1.0), True) in seen
+
+
+@pytest.mark.unit
+def test_latest_pose_slot_keeps_newest_frame():
+    slot = LatestPoseSlot()
+    seq0, result = slot.read()
+    assert result is None
+
+    assert slot.publish(PoseResult(pose=None, timestamp=2.0))
+    seq1, result = slot.read()
+    assert seq1 != seq0 and result.timestamp == 2.0
+
+    # A pose for an older frame (e.g. inferred after a prediction for a newer one) is ignored
+    assert not slot.publish(PoseResult(pose=None, timestamp=1.0))
+    assert slot.read() == (seq1, result)
+
+    slot.clear()
+    seq2, result = slot.read()
+    assert seq2 not in (seq0, seq1) and result is None
+
+
+@pytest.mark.unit
+def test_latest_pose_slot_publish_checks_and_stores_atomically():
+    import threading
+
+    checking, resume = threading.Event(), threading.Event()
+
+    class StalledResult:
+        """Pauses the publishing thread between the newer-frame check and the store."""
+
+        pose = None
+
+        @property
+        def timestamp(self):
+            checking.set()
+            resume.wait(timeout=2.0)
+            return 1.0
+
+    slot = LatestPoseSlot()
+    slot.publish(PoseResult(pose=None, timestamp=0.0))
+    older = threading.Thread(target=slot.publish, args=(StalledResult(),))
+    older.start()
+    assert checking.wait(timeout=2.0)
+    newer = threading.Thread(target=slot.publish, args=(PoseResult(pose=None, timestamp=2.0),))
+    newer.start()
+    newer.join(timeout=0.2)  # waits for the stalled publish instead of racing it
+    resume.set()
+    older.join(timeout=2.0)
+    newer.join(timeout=2.0)
+    assert slot.read()[1].timestamp == 2.0
+
+
+@pytest.mark.unit
+def test_poses_are_published_to_slot_without_signal_receivers(qtbot, monkeypatch_dlclive, settings_model):
+    proc = DLCLiveProcessor()
+    proc.configure(settings_model)
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=1500):
+            proc.enqueue_frame(frame, 1.0)
+        proc.enqueue_frame(frame, 2.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=1500)
+
+        _, result = proc.latest_pose.read()
+        assert result.timestamp == 2.0
+        assert result.pose.shape == (2, 3)
+    finally:
+        proc.reset()
+    assert proc.latest_pose.read()[1] is None
@@ -0,0 +1,121 @@
+import textwrap
+
+import numpy as np
+import pytest
+
+from dlclivegui.config import DLCProcessorSettings
+from dlclivegui.services import dlc_processor, inference_process
+from dlclivegui.services.dlc_processor import DLCLiveProcessor
+from dlclivegui.services.inference_process import InferenceProcessError, RemoteDLCLive
+
+FAKE_DLCLIVE = textwrap.dedent(
+    """
+    import os
+
+    import numpy as np
+
+
+    class FakeRemoteDLCLive:
+        def __init__(self, **opts):
+            if opts.get("model_path") == "broken.pt":
+                raise FileNotFoundError("no such model")
+            self.opts = opts
+            self.cfg = {"bodyparts": ["nose", "tail"]}
+
+        def init_inference(self, frame):
+            return None
+
+        def get_pose(self, frame, frame_time=None):
+            if frame_time == -1:
+                os._exit(3)  # simulate a crash of the model runtime
+            if frame_time == -2:
+                raise ValueError("bad frame")
+            # Encode the frame content so the test can check what arrived
+            return np.array([[float(frame.mean()), float(frame.shape[0]), 1.0], [0.0, 0.0, float(frame_time)]])
+    """
+)
+
+
+@pytest.fixture
+def fake_factory(tmp_path, monkeypatch):
+    (tmp_path / "fake_remote_dlclive.py").write_text(FAKE_DLCLIVE)
+    monkeypatch.syspath_prepend(str(tmp_path))  # inherited by spawned children
+    monkeypatch.setattr(inference_process, "DLCLIVE_FACTORY", "fake_remote_dlclive:FakeRemoteDLCLive")
+
+
+class _Proc:
+    def __init__(self):
+        self.cfg = None
+        self.calls = 0
+
+    def set_dlc_cfg(self, cfg):
+        self.cfg = cfg
+
+    def process(self, pose, **kwargs):
+        self.calls += 1
+        return pose
+
+
+@pytest.mark.unit
+def test_remote_dlclive_round_trip_and_errors(fake_factory):
+    processor = _Proc()
+    remote = RemoteDLCLive({"model_path": "dummy.pt"}, processor=processor)
+    try:
+        assert remote.cfg == {"bodyparts": ["nose", "tail"]}
+        remote.init_inference(np.zeros((4, 4, 3), np.uint8))
+
+        pose = remote.get_pose(np.full((8, 6, 3), 7, np.uint8), frame_time=2.5)
+        np.testing.assert_array_equal(pose, [[7.0, 8.0, 1.0], [0.0, 0.0, 2.5]])
+        assert processor.calls == 1
+        assert remote.last_ipc_time > 0
+
+        # A larger frame reallocates the shared-memory slots
+        pose = remote.get_pose(np.full((64, 64, 3), 9, np.uint8), frame_time=3.0)
+        assert pose[0, :2].tolist() == [9.0, 64.0]
+
+        with pytest.raises(InferenceProcessError, match="bad frame"):
+            remote.get_pose(np.zeros((8, 6, 3), np.uint8), frame_time=-2)
+        assert remote.alive
+
+        with pytest.raises(InferenceProcessError, match="exit code 3"):
+            remote.get_pose(np.zeros((8, 6, 3), np.uint8), frame_time=-1)
+        assert not remote.alive
+    finally:
+        remote.close()
+
+
+@pytest.mark.unit
+def test_remote_dlclive_reports_model_errors(fake_factory):
+    with pytest.raises(InferenceProcessError, match="no such model"):
+        RemoteDLCLive({"model_path": "broken.pt"})
+
+
+@pytest.mark.unit
+def test_processor_in_process_mode_survives_inference_crash(qtbot, fake_factory, monkeypatch):
+    monkeypatch.setattr(dlc_processor, "ENABLE_PROFILING", True)
+    processor = _Proc()
+    proc = DLCLiveProcessor()
+    proc.configure(DLCProcessorSettings(model_path="dummy.pt", inference_mode="process"), processor=processor)
+    poses = []
+    proc.pose_ready.connect(lambda result: poses.append(result.pose))
+    frame = np.full((10, 12, 3), 5, np.uint8)
+    try:
+        with qtbot.waitSignal(proc.initialized, timeout=30000):
+            proc.enqueue_frame(frame, 1.0)
+        assert isinstance(proc._dlc, RemoteDLCLive)
+        assert processor.cfg == {"bodyparts": ["nose", "tail"]}
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 1, timeout=3000)
+        proc.enqueue_frame(frame, 2.0)
+        qtbot.waitUntil(lambda: proc.get_stats().frames_processed >= 2, timeout=3000)
+        assert [p[1, 2] for p in poses] == [1.0, 2.0]
+        assert poses[0][0, 0] == 5.0
+        assert proc.get_stats().avg_ipc_overhead > 0
+
+        with qtbot.waitSignal(proc.error, timeout=5000) as blocker:
+            proc.enqueue_frame(frame, -1.0)
+        assert "exited unexpectedly" in blocker.args[0]
+        pid = proc._dlc.pid
+    finally:
+        proc.reset()
+    assert proc._dlc is None
+    assert pid is not None
@@ -0,0 +1,86 @@
+import pytest
+
+from dlclivegui.services.model_cache import ModelCache, ModelKey
+
+
+class _Runner:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _key(path, shape=(480, 640, 3), **overrides):
+    options = {"model_path": str(path), "model_type": "pytorch", "precision": "FP32", "resize": 1.0}
+    options.update(overrides)
+    return ModelKey.from_options(options, shape)
+
+
+@pytest.fixture
+def models(tmp_path):
+    a = tmp_path / "a.pt"
+    b = tmp_path / "b.pt"
+    a.write_bytes(b"x" * 100)
+    b.write_bytes(b"y" * 300)
+    return a, b
+
+
+@pytest.mark.unit
+def test_key_covers_settings_and_input_shape(models):
+    a, _ = models
+    assert _key(a) == _key(a)
+    assert _key(a) != _key(a, shape=(240, 320, 3))
+    assert _key(a) != _key(a, precision="FP16")
+    assert _key(a) != _key(a, resize=0.5)
+    assert _key(a) != _key(a, device="cpu")
+
+
+@pytest.mark.unit
+def test_take_returns_released_runner_once(models):
+    a, _ = models
+    cache = ModelCache(capacity=2)
+    runner = _Runner("a")
+    assert cache.take(_key(a)) is None
+    cache.put(_key(a), runner)
+
+    assert cache.memory_bytes() == 100
+    assert cache.take(_key(a, shape=(1, 1, 3))) is None
+    assert cache.take(_key(a)) is runner
+    assert cache.take(_key(a)) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert not runner.closed
+
+
+@pytest.mark.unit
+def test_lru_eviction_and_explicit_eviction(models):
+    a, b = models
+    cache = ModelCache(capacity=2)
+    ra, rb, ra_small = _Runner("a"), _Runner("b"), _Runner("a-small")
+    cache.put(_key(a), ra)
+    cache.put(_key(b), rb)
+    cache.put(_key(a, shape=(120, 160, 3)), ra_small)  # evicts the least recently used (a)
+    assert ra.closed and not rb.closed
+    assert [e.runner for e in cache.entries()] == [rb, ra_small]
+    assert cache.memory_bytes() == 400
+
+    # A miss makes room for the runner about to be built
+    assert cache.take(_key(b, precision="FP16")) is None
+    assert rb.closed and len(cache) == 1
+
+    assert cache.evict(str(a)) == 1
+    assert ra_small.closed and len(cache) == 0
+
+
+@pytest.mark.unit
+def test_zero_capacity_disables_caching(models):
+    a, _ = models
+    cache = ModelCache(capacity=1)
+    runner = _Runner("a")
+    cache.put(_key(a), runner)
+    cache.capacity = 0
+    assert runner.closed and len(cache) == 0
+    other = _Runner("a2")
+    cache.put(_key(a), other)
+    assert other.closed
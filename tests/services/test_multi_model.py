@@ -0,0 +1,87 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from dlclivegui.config import ApplicationSettings, DLCProcessorSettings
+from dlclivegui.services import dlc_processor
+from dlclivegui.services.multi_model import PoseModelGroup
+
+
+@pytest.fixture
+def tracked_dlclive(monkeypatch, FakeDLCLiveClass):
+    """FakeDLCLive that records how many models run get_pose at the same time."""
+    state = {"running": 0, "max_running": 0}
+    lock = threading.Lock()
+
+    class TrackedDLCLive(FakeDLCLiveClass):
+        def get_pose(self, frame, frame_time=None):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            # Model-specific output so the streams can be told apart
+            n = 4 if "paw" in self.opts["model_path"] else 2
+            return np.full((n, 3), 1.0)
+
+    monkeypatch.setattr(dlc_processor, "DLCLive", TrackedDLCLive)
+    return state
+
+
+def _models():
+    return [
+        DLCProcessorSettings(model_id="body", model_path="body.pt"),
+        DLCProcessorSettings(model_id="paw", model_path="paw.pt", roi=(0, 0, 8, 8)),
+    ]
+
+
+@pytest.mark.unit
+def test_group_emits_one_stream_per_model(qtbot, tracked_dlclive):
+    group = PoseModelGroup(max_concurrent=1)
+    group.configure(_models())
+    results = {}
+    group.pose_ready.connect(lambda model_id, result: results.setdefault(model_id, []).append(result))
+    frame = np.zeros((32, 32, 3), dtype=np.uint8)
+    try:
+        for i in range(5):
+            group.enqueue_frame(frame, float(i))
+            time.sleep(0.02)
+        qtbot.waitUntil(lambda: len(results.get("body", [])) >= 2 and len(results.get("paw", [])) >= 2, timeout=3000)
+
+        assert results["body"][0].pose.shape == (2, 3)
+        assert results["paw"][0].pose.shape == (4, 3)
+        assert {r.packet.source.model_id for r in results["paw"]} == {"paw"}
+        assert tracked_dlclive["max_running"] == 1  # models took turns
+        assert set(group.get_stats()) == {"body", "paw"}
+    finally:
+        group.shutdown()
+
+
+@pytest.mark.unit
+def test_group_reconfigure_keeps_and_drops_processors(tracked_dlclive):
+    group = PoseModelGroup()
+    group.configure(_models())
+    body = group.processor("body")
+    group.configure(_models()[:1])
+    assert group.model_ids == ["body"]
+    assert group.processor("body") is body
+    assert group.gate is None
+
+    group.max_concurrent = 2
+    assert body._inference_gate is group.gate
+    with pytest.raises(ValueError, match="unique"):
+        group.configure([DLCProcessorSettings(model_id="a"), DLCProcessorSettings(model_id="a")])
+    group.shutdown()
+
+
+@pytest.mark.unit
+def test_extra_models_get_unique_ids_and_round_trip():
+    cfg = ApplicationSettings.from_dict(
+        {"extra_models": [{"model_path": "paw.pt"}, {"model_path": "eye.pt", "model_id": "eye"}]}
+    )
+    assert [m.model_id for m in cfg.extra_models] == ["model_2", "eye"]
+    again = ApplicationSettings.from_dict(cfg.to_dict())
+    assert again.extra_models == cfg.extra_models
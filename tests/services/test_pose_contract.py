@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from dlclivegui.services.dlc_processor import validate_pose_array
+from dlclivegui.services.dlc_processor import PoseValidator, validate_pose_array
 
 
 @pytest.mark.unit
@@ -38,3 +38,39 @@ def test_validate_pose_array_rejects_non_numeric():
     pose = np.array([[["x", "y", "p"]]], dtype=object)
     with pytest.raises(ValueError, match="expected numeric values"):
         validate_pose_array(pose)
+
+
+@pytest.mark.unit
+def test_pose_validator_checks_in_full_only_when_shape_changes(monkeypatch):
+    from dlclivegui.services import dlc_processor
+
+    calls = []
+    original = dlc_processor.validate_pose_array
+    monkeypatch.setattr(
+        dlc_processor, "validate_pose_array", lambda pose, **kw: calls.append(np.shape(pose)) or original(pose, **kw)
+    )
+    validator = PoseValidator()
+    pose = np.ones((5, 3), dtype=np.float32)
+    for _ in range(10):
+        assert validator(pose) is pose  # no copy on the fast path
+    assert calls == [(5, 3)]
+
+    validator(np.ones((2, 5, 3)))  # more animals: checked again
+    assert validator.full_checks == 2
+    with pytest.raises(ValueError, match="last dimension size 3"):
+        validator(np.ones((5, 2)))
+
+
+@pytest.mark.unit
+def test_pose_validator_masks_non_finite_keypoints():
+    validator = PoseValidator()
+    pose = np.ones((2, 4, 3))
+    pose[0, 1, 0] = np.nan
+    pose[1, 3, 2] = np.inf
+    out = validator(pose)
+    assert out is not pose and np.isfinite(pose[0, 0]).all()
+    assert np.isnan(out[0, 1, :2]).all() and out[0, 1, 2] == 0.0
+    assert np.isnan(out[1, 3, :2]).all() and out[1, 3, 2] == 0.0
+    np.testing.assert_array_equal(out[0, 0], [1.0, 1.0, 1.0])
+    assert validator.masked_keypoints == 2
+    assert validator(np.zeros((2, 4, 3), dtype=np.int64)).dtype == np.int64  # integers: nothing to mask
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from dlclivegui.services.pose_tracking import ConstantVelocityPredictor, KalmanPredictor, make_pose_predictor
+
+
+def _pose(t, n=3, speed=(10.0, -5.0), likelihood=0.9):
+    pose = np.zeros((n, 3))
+    pose[:, 0] = np.arange(n) + speed[0] * t
+    pose[:, 1] = 100 + speed[1] * t
+    pose[:, 2] = likelihood
+    return pose
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cls", [ConstantVelocityPredictor, KalmanPredictor])
+def test_predicts_linear_motion_between_inferences(cls):
+    model = cls(max_horizon=1.0)
+    assert model.predict(0.0) is None
+    for i in range(20):
+        model.update(i / 30.0, _pose(i / 30.0))
+    t = 19 / 30.0 + 1 / 120.0
+    np.testing.assert_allclose(model.predict(t), _pose(t), atol=1e-3)
+
+
+@pytest.mark.unit
+def test_prediction_is_clamped_to_horizon_and_vectorized_over_animals():
+    model = ConstantVelocityPredictor(max_horizon=0.05, smoothing=1.0)
+    poses = np.stack([_pose(0.0), _pose(0.0, speed=(0.0, 0.0))])  # (2 animals, 3 keypoints, 3)
+    model.update(0.0, poses)
+    model.update(0.1, np.stack([_pose(0.1), _pose(0.1, speed=(0.0, 0.0))]))
+    predicted = model.predict(10.0)
+    assert predicted.shape == (2, 3, 3)
+    np.testing.assert_allclose(predicted[0, :, 0], np.arange(3) + 10.0 * 0.15)
+    np.testing.assert_allclose(predicted[1], _pose(0.0, speed=(0.0, 0.0)))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cls", [ConstantVelocityPredictor, KalmanPredictor])
+def test_missing_and_low_confidence_keypoints_keep_their_estimate(cls):
+    model = cls(min_confidence=0.5, max_horizon=1.0)
+    model.update(0.0, _pose(0.0))
+    model.update(0.1, _pose(0.1))
+    before = model.predict(0.2)
+
+    observed = _pose(0.2)
+    observed[0, 2] = 0.1  # low confidence: ignored
+    observed[1, :2] = np.nan  # missing
+    observed[0, :2] = 1e6
+    model.update(0.2, observed)
+    after = model.predict(0.2)
+    np.testing.assert_allclose(after[:2], before[:2])
+    assert np.isfinite(after).all()
+
+
+@pytest.mark.unit
+def test_factory():
+    assert make_pose_predictor("off") is None
+    assert isinstance(make_pose_predictor("kalman"), KalmanPredictor)
+    with pytest.raises(ValueError):
+        make_pose_predictor("spline")
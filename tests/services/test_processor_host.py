@@ -0,0 +1,184 @@
+import sys
+import textwrap
+import time
+import types
+
+import numpy as np
+import pytest
+
+from dlclivegui.config import DLCProcessorSettings
+from dlclivegui.processors.processor_utils import scan_processor_folder
+from dlclivegui.services.dlc_processor import create_processor
+from dlclivegui.services.processor_host import ProcessorHost
+
+PROCESSOR_SOURCE = textwrap.dedent(
+    """
+    import time
+
+
+    class SlowProc:
+        def __init__(self, delay=0.0):
+            self.delay = delay
+            self.seen = []
+            self._recording = False
+            self.session_name = "idle"
+            self._listeners = []
+
+        def add_recording_listener(self, callback):
+            self._listeners.append(callback)
+
+        def start_recording(self, session_name):
+            self._recording = True
+            self.session_name = session_name
+            for callback in self._listeners:
+                callback(True, len(self.seen), session_name)
+
+        @property
+        def recording(self):
+            return self._recording
+
+        def process(self, pose, **kwargs):
+            time.sleep(self.delay)
+            self.seen.append((float(pose[0, 0]), kwargs.get("frame_time")))
+            return pose
+
+        def summary(self):
+            return self.seen
+
+        def fail(self):
+            raise ValueError("boom")
+
+
+    def get_available_processors():
+        return {"SlowProc": {"class": SlowProc, "name": "Slow", "description": "", "params": {}}}
+    """
+)
+
+
+@pytest.fixture
+def scanned(tmp_path):
+    (tmp_path / "slow_proc.py").write_text(PROCESSOR_SOURCE)
+    return scan_processor_folder(tmp_path)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def _pose(value):
+    pose = np.zeros((4, 3))
+    pose[0, 0] = value
+    return pose
+
+
+def test_blocking_host_delivers_every_pose_in_order(scanned):
+    host = ProcessorHost.from_scan(
+        scanned, "slow_proc.py::SlowProc", kwargs={"delay": 0.002}, queue_size=2, blocking=True
+    )
+    try:
+        for i in range(20):
+            pose = _pose(i)
+            assert host.process(pose, frame_time=float(i)) is pose
+        _wait_for(lambda: host.host_stats().processed == 20)
+
+        stats = host.host_stats()
+        assert (stats.submitted, stats.dropped, stats.pending, stats.errors) == (20, 0, 0, 0)
+        assert stats.avg_process_time > 0
+        assert host.call("summary") == [(float(i), float(i)) for i in range(20)]
+        with pytest.raises(ValueError, match="boom"):
+            host.call("fail")
+    finally:
+        host.close()
+    assert not host.running
+
+
+def test_non_blocking_host_drops_when_queue_is_full(scanned):
+    host = ProcessorHost.from_scan(scanned, "slow_proc.py::SlowProc", kwargs={"delay": 0.2}, queue_size=2)
+    try:
+        start = time.perf_counter()
+        for i in range(10):
+            host.process(_pose(i))
+        assert time.perf_counter() - start < 0.15  # never waits for the processor
+
+        stats = host.host_stats()
+        assert stats.submitted == 2
+        assert stats.dropped == 8
+    finally:
+        host.close()  # processes the queued poses before exiting
+    assert host.host_stats().processed == 2
+
+
+def test_host_mirrors_status_and_recording_events(scanned):
+    settings = DLCProcessorSettings(processor_mode="process")
+    host = create_processor(scanned, "slow_proc.py::SlowProc", settings)
+    try:
+        assert isinstance(host, ProcessorHost)
+        assert host.recording is False
+        events = []
+        host.add_recording_listener(lambda *event: events.append(event))
+
+        host.call("start_recording", "session_1")
+        _wait_for(lambda: events and host.recording)
+        assert events == [(True, 0, "session_1")]
+        assert host.session_name == "session_1"
+        assert not hasattr(host, "_vid_recording")
+    finally:
+        host.close()
+
+
+SOCKET_PROCESSOR_SOURCE = textwrap.dedent(
+    """
+    try:
+        import dlclive  # noqa: F401
+    except ImportError:  # the spawned child cannot see the test's monkeypatched module
+        import sys
+        import types
+
+        sys.modules["dlclive"] = types.SimpleNamespace(Processor=object)
+
+    from dlclivegui.processors.dlc_processor_socket import BaseProcessorSocket
+
+
+    class SocketProc(BaseProcessorSocket):
+        pass
+
+
+    def get_available_processors():
+        return {"SocketProc": {"class": SocketProc, "name": "Socket", "description": "", "params": {}}}
+    """
+)
+
+
+def test_host_mirrors_socket_processor_event_state(tmp_path, monkeypatch):
+    # BaseProcessorSocket keeps its recording flags in threading.Event objects, which do not pickle
+    monkeypatch.setitem(sys.modules, "dlclive", types.SimpleNamespace(Processor=object))
+    monkeypatch.delitem(sys.modules, "dlclivegui.processors.dlc_processor_socket", raising=False)
+    (tmp_path / "socket_proc.py").write_text(SOCKET_PROCESSOR_SOURCE)
+    scanned = scan_processor_folder(tmp_path)
+    host = create_processor(scanned, "socket_proc.py::SocketProc", DLCProcessorSettings(processor_mode="process"))
+    try:
+        assert host._recording is False and host.recording is False
+        events = []
+        host.add_recording_listener(lambda *event: events.append(event))
+
+        host.process(_pose(1.0), frame_time=2.5)
+        host.process(_pose(2.0), frame_time=2.7, predicted=True)  # forwarded with the flag: no step
+        _wait_for(lambda: host.host_stats().processed == 2)
+        host.call("start_recording")
+        _wait_for(lambda: events and host.recording)
+        assert events == [(True, 1, host.session_name, 2.5)]
+        assert host._recording is True and host._vid_recording is True
+        assert host.video_recording is True
+        assert host.get_client_stats() == []
+    finally:
+        host.close()
+        sys.modules.pop("dlclivegui.processors.dlc_processor_socket", None)  # imported against the fake dlclive
+
+
+def test_host_start_reports_processor_errors(scanned):
+    with pytest.raises(RuntimeError, match="TypeError"):
+        ProcessorHost.from_scan(scanned, "slow_proc.py::SlowProc", kwargs={"unknown": 1})
@@ -0,0 +1,56 @@
+import pytest
+
+from dlclivegui.services.rate_control import DECISION_WINDOW, InferenceRateController
+
+pytestmark = pytest.mark.unit
+
+
+def test_target_fps_submits_every_kth_frame_despite_jitter():
+    ctrl = InferenceRateController(target_fps=15.0)
+    # 30 fps capture with +-3 ms jitter
+    times = [i / 30.0 + (0.003 if i % 3 else -0.003) for i in range(60)]
+    submitted = [i for i, t in enumerate(times) if ctrl.should_submit(t)]
+
+    assert submitted == list(range(0, 60, 2))
+    assert ctrl.skipped == 30
+
+
+def test_target_fps_restarts_schedule_after_a_gap():
+    ctrl = InferenceRateController(target_fps=10.0)
+    assert ctrl.should_submit(0.0)
+    assert not ctrl.should_submit(0.05)
+    assert ctrl.should_submit(5.0)  # long pause: no burst to catch up
+    assert not ctrl.should_submit(5.05)
+    assert ctrl.should_submit(5.1)
+
+
+def test_no_cap_submits_everything():
+    ctrl = InferenceRateController(target_latency=0.05)
+    assert all(ctrl.should_submit(i / 100) for i in range(10))
+    assert ctrl.keep_latest
+    assert not InferenceRateController(target_fps=30.0).keep_latest
+
+
+def test_adaptive_resize_tracks_latency_budget():
+    ctrl = InferenceRateController(target_latency=0.05, adapt_resize=True, resize=0.8, min_resize=0.5)
+    for _ in range(DECISION_WINDOW):
+        ctrl.record_latency(0.1)
+    assert ctrl.resize == pytest.approx(0.72)
+    assert ctrl.resize_changes == 1
+    assert "0.80 -> 0.72" in ctrl.last_decision
+
+    for _ in range(20 * DECISION_WINDOW):
+        ctrl.record_latency(0.1)
+    assert ctrl.resize == 0.5  # clamped at min_resize
+
+    for _ in range(20 * DECISION_WINDOW):
+        ctrl.record_latency(0.01)
+    assert ctrl.resize == 0.8  # back up to the configured resize, never above
+
+
+def test_resize_is_fixed_without_latency_target():
+    ctrl = InferenceRateController(target_fps=10.0, adapt_resize=True, resize=0.8)
+    for _ in range(5 * DECISION_WINDOW):
+        ctrl.record_latency(1.0)
+    assert not ctrl.adapt_resize
+    assert ctrl.resize == 0.8
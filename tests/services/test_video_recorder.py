@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import json
 import threading
 import time
@@ -372,3 +373,158 @@ def test_stop_timeout_marks_abandoned_and_prevents_restart(
     assert rec._abandoned is False
     rec.start()
     rec.stop()
+
+
+# ----------------------------
+# Pre-trigger ring buffer
+# ----------------------------
+
+
+def test_ring_buffer_evicts_by_duration(rgb_frame):
+    ring = vr_mod.FrameRingBuffer(max_seconds=1.0, max_bytes=10 * rgb_frame.nbytes)
+    for i in range(5):
+        ring.append(rgb_frame, timestamp=i * 0.5)
+
+    items = ring.drain()
+    # Only frames within 1s of the newest (t=2.0) are kept
+    assert [ts for _f, ts in items] == [1.0, 1.5, 2.0]
+    assert len(ring) == 0
+    assert ring.nbytes == 0
+
+
+def test_ring_buffer_evicts_by_bytes(rgb_frame):
+    ring = vr_mod.FrameRingBuffer(max_seconds=100.0, max_bytes=3 * rgb_frame.nbytes)
+    for i in range(10):
+        ring.append(rgb_frame, timestamp=float(i))
+
+    assert len(ring) == 3
+    assert ring.nbytes == 3 * rgb_frame.nbytes
+    assert ring.duration == pytest.approx(2.0)
+    assert [ts for _f, ts in ring.drain()] == [7.0, 8.0, 9.0]
+
+
+def test_ring_buffer_frames_flushed_with_original_timestamps(patch_writegear, output_path, rgb_frame):
+    ring = vr_mod.FrameRingBuffer(max_seconds=5.0, max_bytes=100 * rgb_frame.nbytes)
+    for i in range(4):
+        ring.append(rgb_frame, timestamp=10.0 + i)
+
+    pending = ring.drain()
+    rec = vr_mod.VideoRecorder(output_path, frame_size=(48, 64), buffer_size=len(pending) + 1)
+    rec.start()
+    for frame, ts in pending:
+        assert rec.write(frame, timestamp=ts) is True
+    assert rec.write(rgb_frame, timestamp=20.0) is True
+    rec.stop()
+
+    ts_file = output_path.with_suffix("").with_suffix(output_path.suffix + "_timestamps.json")
+    data = json.loads(ts_file.read_text())
+    assert data["timestamps"] == [10.0, 11.0, 12.0, 13.0, 20.0]
+
+
+# ----------------------------
+# Backpressure: spill to disk
+# ----------------------------
+
+
+def test_spill_preserves_order_instead_of_dropping(patch_blocking_writegear, output_path, rgb_frame):
+    rec = vr_mod.VideoRecorder(output_path, frame_size=(48, 64), buffer_size=4, spill_max_bytes=1024 * rgb_frame.nbytes)
+    rec.start()
+
+    # First frame blocks the encoder; everything after it backs up.
+    assert rec.write(rgb_frame, timestamp=0.0) is True
+    wg = patch_blocking_writegear.instances[0]
+    wait_until(lambda: wg.entered_write.is_set(), timeout=1.0)
+
+    for i in range(1, 20):
+        assert rec.write(rgb_frame, timestamp=float(i)) is True
+
+    stats = rec.get_stats()
+    assert stats.dropped_frames == 0
+    assert stats.spilled_frames > 0
+    assert stats.spill_events == 1
+    assert stats.backpressure == "spilling"
+    spill_path = output_path.with_name(output_path.name + ".spill")
+    wait_until(spill_path.exists, timeout=1.0)  # written by the spill thread
+
+    wg.release_write.set()
+    rec.stop()
+
+    ts_path = output_path.with_suffix("").with_suffix(output_path.suffix + "_timestamps.json")
+    data = json.loads(ts_path.read_text())
+    assert data["timestamps"] == [float(i) for i in range(20)]
+    assert len(wg.frames) == 20
+    assert not spill_path.exists()
+
+
+def test_spill_budget_exhausted_drops_frames(patch_blocking_writegear, output_path, rgb_frame):
+    rec = vr_mod.VideoRecorder(output_path, frame_size=(48, 64), buffer_size=4, spill_max_bytes=2 * rgb_frame.nbytes)
+    rec.start()
+    rec.write(rgb_frame, timestamp=0.0)
+    wg = patch_blocking_writegear.instances[0]
+    wait_until(lambda: wg.entered_write.is_set(), timeout=1.0)
+
+    results = [rec.write(rgb_frame, timestamp=float(i)) for i in range(1, 10)]
+    assert results.count(False) >= 1
+
+    stats = rec.get_stats()
+    assert stats.spilled_frames == 2
+    assert stats.dropped_frames == results.count(False)
+    assert stats.backpressure == "dropping"
+
+    wg.release_write.set()
+    rec.stop()
+    ts_path = output_path.with_suffix("").with_suffix(output_path.suffix + "_timestamps.json")
+    timestamps = json.loads(ts_path.read_text())["timestamps"]
+    assert timestamps == sorted(timestamps)
+
+
+def test_buffer_seconds_uses_measured_input_rate(patch_blocking_writegear, output_path, rgb_frame, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(vr_mod.time, "perf_counter", lambda: next(clock) / 100.0)  # 100 fps input
+
+    rec = vr_mod.VideoRecorder(output_path, frame_size=(48, 64), frame_rate=30.0, buffer_size=50)
+    rec.start()
+    rec.write(rgb_frame, timestamp=0.0)
+    wg = patch_blocking_writegear.instances[0]
+    wait_until(lambda: wg.entered_write.is_set(), timeout=1.0)
+    for i in range(1, 11):
+        rec.write(rgb_frame, timestamp=float(i))
+
+    stats = rec.get_stats()
+    assert stats.queue_size == 10
+    assert stats.enqueue_fps == pytest.approx(100.0, rel=0.2)
+    assert stats.buffer_seconds == pytest.approx(stats.queue_size / stats.enqueue_fps)
+    assert stats.buffer_bytes == 10 * rgb_frame.nbytes
+
+    wg.release_write.set()
+    rec.stop()
+
+
+def test_spill_write_does_not_block_on_disk(patch_blocking_writegear, monkeypatch, output_path, rgb_frame):
+    disk_stalled = threading.Event()
+    original_loop = vr_mod._FrameSpill._spill_loop
+
+    def stalled_loop(self):
+        disk_stalled.wait(5.0)
+        original_loop(self)
+
+    monkeypatch.setattr(vr_mod._FrameSpill, "_spill_loop", stalled_loop)
+    rec = vr_mod.VideoRecorder(output_path, frame_size=(48, 64), buffer_size=4, spill_max_bytes=1024 * rgb_frame.nbytes)
+    rec.start()
+    rec.write(rgb_frame, timestamp=0.0)
+    wg = patch_blocking_writegear.instances[0]
+    wait_until(lambda: wg.entered_write.is_set(), timeout=1.0)
+
+    # Encoder and disk are both stalled: write() still returns immediately
+    start = time.perf_counter()
+    results = [rec.write(rgb_frame, timestamp=float(i)) for i in range(1, 20)]
+    assert time.perf_counter() - start < 0.5
+    assert all(results)
+    assert rec.get_stats().spilled_frames > 0
+
+    disk_stalled.set()
+    wg.release_write.set()
+    rec.stop()
+    assert len(wg.frames) == 20
+    ts_path = output_path.with_suffix("").with_suffix(output_path.suffix + "_timestamps.json")
+    assert json.loads(ts_path.read_text())["timestamps"] == [float(i) for i in range(20)]
@@ -30,6 +30,24 @@ def test_format_recorder_stats_exact():
     )
 
 
+def test_format_recorder_stats_reports_spill():
+    stats = SimpleNamespace(
+        frames_written=10,
+        frames_enqueued=15,
+        write_fps=30.0,
+        last_latency=0.01,
+        average_latency=0.01,
+        buffer_seconds=0.05,
+        queue_size=3,
+        dropped_frames=0,
+        spilled_frames=4,
+        spill_pending=2,
+        backpressure="spilling",
+    )
+
+    assert format_recorder_stats(stats).endswith("| dropped 0 | spilled 4 (2 pending, spilling)")
+
+
 def test_format_dlc_stats_exact_no_profile():
     stats = SimpleNamespace(
         frames_processed=100,